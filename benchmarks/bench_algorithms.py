@@ -0,0 +1,273 @@
+"""
+БЕНЧМАРК АЛГОРИТМОВ ПО РАЗМЕРАМ И ДВИЖКАМ
+=========================================
+
+Замер задания 1 (sum_arrays_special), задания 3 (поворот матрицы) и
+задания 8 (find_common_numbers) на размерах от 10 до 10^8 элементов
+для каждого доступного движка. Результаты сохраняются в JSON вместе со
+сведениями о машине и коммите, чтобы сравнивать прогоны между коммитами
+на одной машине (--compare).
+
+Движки:
+-------
+- задание 1 и 8: все значения ENGINES соответствующего модуля;
+  "parallel" замеряется только от PARALLEL_THRESHOLD (ниже порога он
+  решает задачу как "numpy") и с --workers процессами - не меньше двух,
+  иначе движок тоже уходит в "numpy"
+- задание 3: numpy-copy, numpy-view, numpy-inplace, python (списки),
+  python-view (RotatedMatrix), file (rotate_file через memmap)
+
+Для задания 3 размер - число элементов матрицы (сторона √size).
+Движки на чистом Python ограничены --python-limit; размеры, для которых
+не хватает памяти, пропускаются.
+
+Запуск:
+-------
+python -m benchmarks.bench_algorithms
+python -m benchmarks.bench_algorithms --tasks 1 8 --sizes 1000 1000000 --output base.json
+python -m benchmarks.bench_algorithms --output new.json --compare base.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.tasks import task1, task8
+from src.tasks.task2 import rotate_clockwise
+from src.utils.input_operations import generate_array
+
+DEFAULT_SIZES = [10, 10 ** 3, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8]
+
+ROTATION_ENGINES = ('numpy-copy', 'numpy-view', 'numpy-inplace', 'python', 'python-view', 'file')
+
+# Минимальное суммарное время одного замера (секунды): короткие вызовы повторяются
+_MIN_MEASURE_TIME = 0.2
+
+# Множитель памяти на вход (входы, копии и результат), по которому размер пропускается
+_MEMORY_FACTOR = 6
+
+
+def _measure(func, repeat):
+    """
+    Замер функции: лучшее и медианное время одного вызова (секунды).
+
+    Короткие вызовы выполняются пачками, чтобы замер длился не менее
+    _MIN_MEASURE_TIME; подготовка данных выполняется до замера.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= _MIN_MEASURE_TIME or loops >= 10 ** 6:
+            break
+        loops *= 10
+
+    times = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        times.append((time.perf_counter() - start) / loops)
+    times.sort()
+    return {'best_s': times[0], 'median_s': times[len(times) // 2], 'loops': loops, 'repeat': repeat}
+
+
+def _available_memory():
+    """Доступная физическая память (байт) или None, если неизвестно."""
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _fits(nbytes):
+    available = _available_memory()
+    return available is None or nbytes * _MEMORY_FACTOR <= available
+
+
+def bench_task1(size, engines, repeat, python_limit, seed, workers):
+    """Замеры задания 1: два массива int64 длины size."""
+    arr1 = generate_array(size, -10 ** 6, 10 ** 6, seed=seed)
+    arr2 = generate_array(size, -10 ** 6, 10 ** 6, seed=seed + 1)
+    lists = None
+    for engine in engines:
+        options = {}
+        if engine == 'python':
+            if size > python_limit:
+                continue
+            if lists is None:
+                lists = (arr1.tolist(), arr2.tolist())
+            a, b = lists
+        else:
+            if engine == 'parallel':
+                if size < task1.PARALLEL_THRESHOLD:
+                    continue
+                options['workers'] = workers
+            a, b = arr1, arr2
+        yield engine, _measure(lambda: task1.sum_arrays_special(a, b, engine=engine, **options), repeat)
+
+
+def bench_task3(size, engines, repeat, python_limit, seed, workers):
+    """Замеры задания 3: квадратная матрица float64 с числом элементов ≈ size."""
+    n = max(1, math.isqrt(size))
+    matrix = generate_array(n * n, 0, 1000, dtype='float64', seed=seed).reshape(n, n)
+    nested = None
+    for engine in engines:
+        if engine.startswith('python'):
+            if n * n > python_limit:
+                continue
+            if nested is None:
+                nested = matrix.tolist()
+            view = engine == 'python-view'
+            yield engine, _measure(lambda: rotate_clockwise(nested, view=view), repeat)
+        elif engine == 'numpy-copy':
+            yield engine, _measure(lambda: rotate_clockwise(matrix), repeat)
+        elif engine == 'numpy-view':
+            yield engine, _measure(lambda: rotate_clockwise(matrix, view=True), repeat)
+        elif engine == 'numpy-inplace':
+            # Поворот на месте меняет содержимое, но не форму - повторы допустимы
+            yield engine, _measure(lambda: rotate_clockwise(matrix, inplace=True), repeat)
+        elif engine == 'file':
+            with tempfile.TemporaryDirectory() as tmp:
+                source = os.path.join(tmp, 'matrix.npy')
+                target = os.path.join(tmp, 'rotated.npy')
+                np.save(source, matrix)
+                yield engine, _measure(lambda: rotate_clockwise(source, output=target), repeat)
+
+
+def bench_task8(size, engines, repeat, python_limit, seed, workers):
+    """Замеры задания 8: значения в диапазоне размера, чтобы были совпадения."""
+    high = max(size, 100)
+    arr1 = generate_array(size, 0, high, seed=seed)
+    arr2 = generate_array(size, 0, high, seed=seed + 1)
+    lists = None
+    for engine in engines:
+        if engine == 'python':
+            if size > python_limit:
+                continue
+            if lists is None:
+                lists = (arr1.tolist(), arr2.tolist())
+            a, b = lists
+        else:
+            a, b = arr1, arr2
+        yield engine, _measure(lambda: task8.find_common_numbers(a, b, engine=engine), repeat)
+
+
+TASKS = {
+    1: ('sum_arrays_special', task1.ENGINES, bench_task1, 16),
+    3: ('rotate_clockwise', ROTATION_ENGINES, bench_task3, 8),
+    8: ('find_common_numbers', task8.ENGINES, bench_task8, 16),
+}
+
+
+def machine_info():
+    """Сведения о машине и версии кода для файла результатов."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def run(tasks, sizes, engines=None, repeat=3, python_limit=10 ** 6, seed=42, workers=None):
+    """
+    Прогон всех замеров.
+
+    workers - число процессов движка "parallel" (None - по числу ядер,
+    но не меньше двух).
+
+    Возвращает:
+    -----------
+    list
+        Записи {'task', 'function', 'engine', 'size', 'best_s',
+        'median_s', 'loops', 'repeat'}
+    """
+    workers = workers or max(2, os.cpu_count() or 1)
+    results = []
+    for task in tasks:
+        function, task_engines, bench, bytes_per_item = TASKS[task]
+        selected = [e for e in task_engines if engines is None or e in engines]
+        if not selected:
+            continue
+        for size in sizes:
+            if not _fits(size * bytes_per_item):
+                print(f"задание {task}, размер {size}: недостаточно памяти - пропуск")
+                continue
+            try:
+                for engine, timing in bench(size, selected, repeat, python_limit, seed, workers):
+                    row = {'task': task, 'function': function, 'engine': engine, 'size': size, **timing}
+                    results.append(row)
+                    print(f"задание {task} {engine:>14} {size:>11} "
+                          f"{timing['best_s'] * 1000:>12.3f} мс (медиана {timing['median_s'] * 1000:.3f})")
+            except MemoryError:
+                print(f"задание {task}, размер {size}: недостаточно памяти - пропуск")
+    return results
+
+
+def compare(results, baseline):
+    """Печать отношения времени к прежнему прогону (>1 - замедление)."""
+    previous = {(r['task'], r['engine'], r['size']): r['best_s'] for r in baseline['results']}
+    print(f"\nСравнение с {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')}):")
+    for row in results:
+        key = (row['task'], row['engine'], row['size'])
+        if key in previous and previous[key] > 0:
+            ratio = row['best_s'] / previous[key]
+            mark = '  ЗАМЕДЛЕНИЕ' if ratio > 1.1 else ''
+            print(f"задание {row['task']} {row['engine']:>14} {row['size']:>11} {ratio:>7.2f}x{mark}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк алгоритмов по размерам и движкам")
+    parser.add_argument('--tasks', type=int, nargs='+', choices=sorted(TASKS), default=sorted(TASKS))
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--engines', nargs='+', default=None, help="только указанные движки")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--python-limit', type=int, default=10 ** 6,
+                        help="наибольший размер для движков на чистом Python")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="процессов движка parallel (по умолчанию - число ядер, не меньше 2)")
+    parser.add_argument('--output', default=None,
+                        help="файл результатов JSON (по умолчанию bench_<коммит>.json)")
+    parser.add_argument('--compare', default=None, help="JSON прежнего прогона для сравнения")
+    args = parser.parse_args(argv)
+
+    meta = machine_info()
+    results = run(args.tasks, args.sizes, args.engines, args.repeat, args.python_limit, args.seed,
+                  args.workers)
+
+    output = args.output or f"bench_{meta['commit'] or 'local'}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'results': results}, f, ensure_ascii=False, indent=2)
+    print(f"\nРезультаты сохранены: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(results, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
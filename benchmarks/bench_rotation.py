@@ -0,0 +1,84 @@
+"""
+БЕНЧМАРК ПОВОРОТА МАТРИЦЫ НА МЕСТЕ
+==================================
+
+Сравнение поворота квадратной матрицы N×N на месте (блочные четверные
+обмены) с поворотом через копию для задания 3.
+
+Запуск:
+-------
+python -m benchmarks.bench_rotation
+python -m benchmarks.bench_rotation --sizes 1000 4000 --dtype float32
+
+Для N = 16000 и float64 матрица занимает 2 ГБ, а поворот через копию
+требует еще столько же - при нехватке памяти размер пропускается.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tasks.task2 import cache_block_size, rotate_clockwise
+
+
+def _best_time(func, repeat):
+    """Лучшее время из repeat запусков (секунды)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_size(n, dtype, repeat, block_size=None):
+    """
+    Замер одного размера матрицы.
+
+    Возвращает:
+    -----------
+    dict
+        Время поворота через копию и на месте, а также размер блока
+    """
+    matrix = np.arange(n * n, dtype=dtype).reshape(n, n)
+    block = block_size or cache_block_size(matrix.itemsize)
+
+    copy_time = _best_time(lambda: rotate_clockwise(matrix), repeat)
+    inplace_time = _best_time(
+        lambda: rotate_clockwise(matrix, inplace=True, block_size=block), repeat)
+
+    return {
+        'size': n,
+        'block': block,
+        'copy': copy_time,
+        'inplace': inplace_time,
+        'extra_mb_copy': matrix.nbytes / 2 ** 20,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Поворот на месте против поворота через копию")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 4000, 16000])
+    parser.add_argument('--dtype', default='float64')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--block-size', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    print(f"{'N':>7} {'блок':>6} {'копия, с':>10} {'на месте, с':>12} {'ускорение':>10} {'доп. память копии':>18}")
+    for n in args.sizes:
+        try:
+            row = bench_size(n, np.dtype(args.dtype), args.repeat, args.block_size)
+        except MemoryError:
+            print(f"{n:>7} недостаточно памяти - пропуск")
+            continue
+        print(f"{row['size']:>7} {row['block']:>6} {row['copy']:>10.3f} {row['inplace']:>12.3f} "
+              f"{row['copy'] / row['inplace']:>9.2f}x {row['extra_mb_copy']:>14.0f} МБ")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+НАГРУЗОЧНЫЙ КЛИЕНТ ЛОКАЛЬНОГО СЕРВЕРА
+=====================================
+
+Генератор нагрузки для src.core.server: несколько соединений, в каждом
+по --pipeline одновременных запросов (конвейер), в течение --duration
+секунд. Печатает число запросов в секунду и задержки (p50, p90, p99,
+p99.9, максимум). Время кодирования запроса клиентом входит в задержку.
+
+С --spawn сервер запускается отдельным процессом на временном сокете
+Unix и останавливается по окончании.
+
+Запуск:
+-------
+python -m benchmarks.bench_server --spawn --task 8 --size 1000
+python -m benchmarks.bench_server --spawn --task 1 --size 1000000 --binary --workers 4
+python -m benchmarks.bench_server --unix /tmp/adp.sock --connections 8 --pipeline 32
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.core.client import Client
+from src.core.server import DEFAULT_HOST, DEFAULT_PORT
+from src.utils.input_operations import generate_array
+
+# Время ожидания запуска сервера с --spawn (секунды)
+_SPAWN_TIMEOUT = 30.0
+
+
+def make_inputs(task, size, binary, seed):
+    """Входы запроса: массивы NumPy для двоичных запросов, списки - для JSON."""
+    if task == 3:
+        n = max(1, math.isqrt(size))
+        inputs = [generate_array(n * n, 0, 1000, dtype='float64', seed=seed).reshape(n, n)]
+    else:
+        high = max(size, 100) if task == 8 else 10 ** 6
+        low = 0 if task == 8 else -10 ** 6
+        inputs = [generate_array(size, low, high, seed=seed),
+                  generate_array(size, low, high, seed=seed + 1)]
+    return inputs if binary else [data.tolist() for data in inputs]
+
+
+async def run_load(connect, task, inputs, binary, connections, pipeline, duration, warmup):
+    """
+    Нагрузка на сервер.
+
+    Возвращает:
+    -----------
+    tuple
+        (задержки успешных запросов в секундах, число ошибок, время замера)
+    """
+    clients = [await connect() for _ in range(connections)]
+    latencies = []
+    errors = 0
+    start = time.perf_counter()
+    measure_from = start + warmup
+    stop_at = measure_from + duration
+
+    async def worker(client):
+        nonlocal errors
+        while True:
+            sent = time.perf_counter()
+            if sent >= stop_at:
+                return
+            response = await client.request(task, inputs, binary=binary)
+            done = time.perf_counter()
+            if sent < measure_from:
+                continue
+            if response.get('status') == 'ok':
+                latencies.append(done - sent)
+            else:
+                errors += 1
+                if errors == 1:
+                    print(f"ошибка сервера: {response.get('error')}", file=sys.stderr)
+
+    try:
+        await asyncio.gather(*(worker(client) for client in clients for _ in range(pipeline)))
+    finally:
+        for client in clients:
+            await client.close()
+    return latencies, errors, time.perf_counter() - measure_from
+
+
+def report(latencies, errors, elapsed):
+    """Печать пропускной способности и задержек."""
+    latencies.sort()
+    count = len(latencies)
+    print(f"запросов: {count} (ошибок {errors}) за {elapsed:.2f} с - {count / elapsed:.1f} запросов/с")
+    if not count:
+        return
+    parts = []
+    for label, q in (('p50', 50), ('p90', 90), ('p99', 99), ('p99.9', 99.9)):
+        rank = max(1, math.ceil(count * q / 100))
+        parts.append(f"{label} {latencies[rank - 1] * 1000:.3f}")
+    parts.append(f"макс. {latencies[-1] * 1000:.3f}")
+    print("задержка, мс: " + ', '.join(parts))
+
+
+def _spawn_server(unix, workers):
+    """Запуск сервера отдельным процессом и ожидание его сокета."""
+    command = [sys.executable, os.path.join(ROOT, 'main.py'), 'serve', '--unix', unix]
+    if workers:
+        command += ['--workers', str(workers)]
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + _SPAWN_TIMEOUT
+    while not os.path.exists(unix):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise RuntimeError("сервер не запустился")
+        time.sleep(0.05)
+    return process
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Нагрузочный клиент локального сервера заданий")
+    parser.add_argument('--unix', default=None, help="путь сокета Unix сервера")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--spawn', action='store_true',
+                        help="запустить сервер на время замера (временный сокет Unix)")
+    parser.add_argument('--workers', type=int, default=None, help="процессов сервера с --spawn")
+    parser.add_argument('--task', type=int, choices=(1, 3, 8), default=8)
+    parser.add_argument('--size', type=int, default=1000,
+                        help="размер входа (для задания 3 - число элементов матрицы)")
+    parser.add_argument('--binary', action='store_true', help="двоичные запросы вместо JSON")
+    parser.add_argument('--connections', type=int, default=4)
+    parser.add_argument('--pipeline', type=int, default=16,
+                        help="одновременных запросов в одном соединении")
+    parser.add_argument('--duration', type=float, default=5.0, help="длительность замера (секунды)")
+    parser.add_argument('--warmup', type=float, default=0.5,
+                        help="начальный период без учета в статистике (секунды)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    inputs = make_inputs(args.task, args.size, args.binary, args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        process = None
+        unix = args.unix
+        if args.spawn:
+            unix = os.path.join(tmp, 'server.sock')
+            process = _spawn_server(unix, args.workers)
+
+        async def connect():
+            return await Client.connect(args.host, args.port, unix=unix)
+
+        try:
+            latencies, errors, elapsed = asyncio.run(run_load(
+                connect, args.task, inputs, args.binary, args.connections, args.pipeline,
+                args.duration, args.warmup))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    print(f"задание {args.task}, размер {args.size}, {'двоичный' if args.binary else 'JSON'}, "
+          f"соединений {args.connections} × конвейер {args.pipeline}")
+    report(latencies, errors, elapsed)
+
+
+if __name__ == '__main__':
+    main()
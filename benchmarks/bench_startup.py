@@ -0,0 +1,102 @@
+"""
+БЕНЧМАРК ХОЛОДНОГО СТАРТА
+=========================
+
+Время импорта main.py в новом интерпретаторе: общее время запуска
+(за вычетом пустого интерпретатора) и самые дорогие импорты по данным
+python -X importtime. Импорт выполняется во временном каталоге, чтобы
+заодно проверить отсутствие побочных эффектов (папки logs/).
+
+Запуск:
+-------
+python -m benchmarks.bench_startup
+python -m benchmarks.bench_startup --module src.core.batch --repeat 20 --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code, cwd, importtime=False):
+    """Запуск кода в новом интерпретаторе; возвращает (время, stderr)."""
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-c', code]
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE='1')
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=cwd, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip())
+    return elapsed, completed.stderr
+
+
+def parse_importtime(stderr):
+    """
+    Разбор вывода -X importtime.
+
+    Возвращает:
+    -----------
+    list
+        (модуль, собственное время мкс, накопленное время мкс)
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def bench_startup(module, repeat):
+    """
+    Замер холодного импорта модуля.
+
+    Возвращает:
+    -----------
+    dict
+        Лучшее время запуска с импортом и без, таблица importtime
+        и признак создания папки logs/
+    """
+    with tempfile.TemporaryDirectory() as cwd:
+        baseline = min(_run('pass', cwd)[0] for _ in range(repeat))
+        total = min(_run(f'import {module}', cwd)[0] for _ in range(repeat))
+        _, stderr = _run(f'import {module}', cwd, importtime=True)
+        side_effects = os.path.exists(os.path.join(cwd, 'logs'))
+
+    return {
+        'baseline': baseline,
+        'total': total,
+        'imports': parse_importtime(stderr),
+        'side_effects': side_effects,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Время холодного старта приложения")
+    parser.add_argument('--module', default='main')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    row = bench_startup(args.module, args.repeat)
+    print(f"Пустой интерпретатор: {row['baseline'] * 1000:8.1f} мс")
+    print(f"import {args.module}: {row['total'] * 1000:13.1f} мс "
+          f"(+{(row['total'] - row['baseline']) * 1000:.1f} мс)")
+    print(f"Папка logs/ при импорте: {'создана' if row['side_effects'] else 'не создана'}")
+
+    print(f"\n{'накопл., мс':>12} {'собств., мс':>12}  модуль")
+    for name, self_us, cumulative_us in sorted(row['imports'], key=lambda r: -r[2])[:args.top]:
+        print(f"{cumulative_us / 1000:>12.1f} {self_us / 1000:>12.1f}  {name}")
+
+
+if __name__ == '__main__':
+    main()
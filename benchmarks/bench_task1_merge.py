@@ -0,0 +1,70 @@
+"""
+БЕНЧМАРК ИТОГОВОЙ СОРТИРОВКИ ЗАДАНИЯ 1
+======================================
+
+Сравнение стратегии "comparison" (полная сортировка суммы, как раньше)
+со стратегией "auto" (слияние серий почти монотонной суммы, подсчет для
+узких диапазонов) на массивах из 10^7 элементов с разным соотношением
+разбросов входов. Результаты обеих стратегий сверяются.
+
+Запуск:
+-------
+python -m benchmarks.bench_task1_merge
+python -m benchmarks.bench_task1_merge --size 1000000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tasks.task1 import sum_arrays_special
+
+# Профили данных: (разброс arr1, разброс arr2) - значения в [-k, k]
+PROFILES = {
+    'одинаковый разброс': (10 ** 9, 10 ** 9),
+    'arr2 шире в 10 раз': (10 ** 8, 10 ** 9),
+    'arr2 шире в 10^6 раз': (10 ** 3, 10 ** 9),
+    'arr1 шире в 10^6 раз': (10 ** 9, 10 ** 3),
+    'узкий диапазон': (10 ** 4, 10 ** 4),
+}
+
+
+def _best_time(func, repeat):
+    """Лучшее время из repeat запусков (секунды) и последний результат."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Полная сортировка против слияния серий (задание 1)")
+    parser.add_argument('--size', type=int, default=10 ** 7)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'профиль':<22} {'comparison, с':>14} {'auto, с':>9} {'ускорение':>10}")
+    for name, (spread1, spread2) in PROFILES.items():
+        arr1 = rng.integers(-spread1, spread1, args.size)
+        arr2 = rng.integers(-spread2, spread2, args.size)
+        base_time, base = _best_time(
+            lambda: sum_arrays_special(arr1, arr2, engine='numpy', sort='comparison'), args.repeat)
+        fast_time, fast = _best_time(
+            lambda: sum_arrays_special(arr1, arr2, engine='numpy', sort='auto'), args.repeat)
+        if not np.array_equal(base, fast):
+            raise AssertionError(f"{name}: результаты стратегий различаются")
+        print(f"{name:<22} {base_time:>14.3f} {fast_time:>9.3f} {base_time / fast_time:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -33,17 +33,59 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 # Импорт функций из алгоритмов
-from algorithms.algorithm1 import sum_arrays_special
-from algorithms.algorithm3 import rotate_clockwise, rotate_counterclockwise
-from algorithms.algorithm8 import find_common_numbers
+from src.tasks.task1 import sum_arrays_special
+from src.tasks.task2 import rotate_clockwise, rotate_counterclockwise
+from src.tasks.task8 import classify_common_numbers
 
 # Импорт функций ввода/вывода
-from utils.input_operations import (
+from src.utils.input_operations import (
     manual_input_array,
     generate_random_array,
     generate_random_matrix
 )
 
+# Загрузка данных из файлов (.txt, .npy, .adp)
+from src.core.batch import load_inputs
+
+# Кэш результатов по содержимому входных данных
+from src.utils.result_cache import CACHE_DIR_ENV, make_key, result_cache
+
+
+def run_command(argv):
+    """
+    Выполнение команды неинтерактивного режима.
+
+    Параметры:
+    ----------
+    argv : list
+        Аргументы командной строки без имени программы
+
+    Возвращает:
+    -----------
+    int or None
+        Код завершения команды или None, если команды нет
+        и нужно запустить интерактивное меню
+    """
+    if not argv:
+        return None
+    command, args = argv[0], argv[1:]
+    if command == "run":
+        from src.core.batch import main as batch_main
+        return batch_main(args)
+    if command == "show":
+        from src.core.batch import show_main
+        return show_main(args)
+    if command == "generate":
+        from src.core.batch import generate_main
+        return generate_main(args)
+    if command == "jobs":
+        from src.core.jobs import main as jobs_main
+        return jobs_main(args)
+    if command == "serve":
+        from src.core.server import main as server_main
+        return server_main(args)
+    return None
+
 
 class ApplicationState:
     """
@@ -64,6 +106,8 @@ class ApplicationState:
         Флаг, указывающий что данные введены
     algorithm_executed : bool
         Флаг, указывающий что алгоритм выполнен
+    match_analysis : tuple or None
+        Классификация совпадений задания 8: (прямые, перевернутые)
 
     Методы:
     -------
@@ -78,6 +122,7 @@ class ApplicationState:
         self.result = None            # Результат выполнения
         self.data_entered = False     # Данные введены?
         self.algorithm_executed = False  # Алгоритм выполнен?
+        self.match_analysis = None    # Классификация совпадений (задание 8)
 
     def reset_for_new_data(self):
         """
@@ -88,9 +133,11 @@ class ApplicationState:
 
         Сбрасывает:
         - result (результат)
+        - match_analysis (классификация совпадений)
         - algorithm_executed (флаг выполнения)
         """
         self.result = None
+        self.match_analysis = None
         self.algorithm_executed = False
 
 
@@ -167,6 +214,7 @@ def input_data(state):
     Реализует требования:
     - Ввод данных вручную
     - Генерация случайных данных
+    - Загрузка данных из файла (потоковый разбор)
     - Проверка корректности ввода
 
     Параметры:
@@ -188,16 +236,36 @@ def input_data(state):
     print("Доступные способы ввода:")
     print("1. Ввести данные вручную")
     print("2. Сгенерировать случайные данные")
+    print("3. Загрузить данные из файла")
 
     try:
-        choice = int(input("Ваш выбор (1 или 2): "))
+        choice = int(input("Ваш выбор (1, 2 или 3): "))
 
-        if choice not in [1, 2]:
-            print("✗ Ошибка: выберите 1 или 2")
+        if choice not in [1, 2, 3]:
+            print("✗ Ошибка: выберите 1, 2 или 3")
             return
 
+        # ЗАГРУЗКА ИЗ ФАЙЛА: потоковый разбор без построчного ввода
+        if choice == 3:
+            print("\n[Загрузка данных из файла]")
+            print("Форматы: .txt - числа через пробел (матрица - по строке на строку),")
+            print("         .adp - двоичный контейнер (может содержать оба массива)")
+
+            if state.current_task == 3:
+                path = input("Файл с матрицей: ").strip()
+                matrix = load_inputs(path, matrix=True, dtype='float64')[0]
+                state.data = matrix
+                print(f"✓ Матрица загружена ({len(matrix)}x{len(matrix[0])})")
+            else:
+                arrays = load_inputs(input("Файл с первым массивом: ").strip())
+                if len(arrays) < 2:
+                    arrays += load_inputs(input("Файл со вторым массивом: ").strip())
+                arr1, arr2 = arrays[:2]
+                state.data = (arr1, arr2)
+                print(f"✓ Массивы загружены ({len(arr1)} и {len(arr2)} элементов)")
+
         # ОБРАБОТКА ЗАДАНИЯ 1: Два массива чисел
-        if state.current_task == 1:
+        elif state.current_task == 1:
             if choice == 1:  # Ручной ввод
                 print("\n[Ручной ввод двух массивов]")
                 print("Требование: массивы должны быть одинакового размера")
@@ -379,7 +447,10 @@ def execute_algorithm(state):
             print("4. Итоговый массив сортируется по возрастанию")
 
             arr1, arr2 = state.data
-            state.result = sum_arrays_special(arr1, arr2)
+            state.result, cached = _cached_result(
+                1, state.data, lambda: sum_arrays_special(arr1, arr2))
+            if cached:
+                print("✓ Результат для этих данных взят из кэша")
             print("✓ Алгоритм выполнен успешно!")
 
         # ЗАДАНИЕ 3: Поворот матрицы
@@ -396,11 +467,13 @@ def execute_algorithm(state):
             try:
                 direction = int(input("Ваш выбор (1 или 2): "))
 
+                # Результат - представление без копирования данных:
+                # строки повернутой матрицы вычисляются при выводе
                 if direction == 1:
-                    state.result = rotate_clockwise(matrix)
+                    state.result = rotate_clockwise(matrix, view=True)
                     print("✓ Матрица повернута по часовой стрелке")
                 elif direction == 2:
-                    state.result = rotate_counterclockwise(matrix)
+                    state.result = rotate_counterclockwise(matrix, view=True)
                     print("✓ Матрица повернута против часовой стрелки")
                 else:
                     print("✗ Ошибка: выберите 1 или 2")
@@ -418,7 +491,12 @@ def execute_algorithm(state):
             print("   (например, 123 и 321 считаются общими)")
 
             arr1, arr2 = state.data
-            state.result = find_common_numbers(arr1, arr2)
+            (common, direct_matches, reversed_matches), cached = _cached_result(
+                8, state.data, lambda: classify_common_numbers(arr1, arr2))
+            state.result = common
+            state.match_analysis = (direct_matches, reversed_matches)
+            if cached:
+                print("✓ Результат для этих данных взят из кэша")
             print("✓ Поиск общих чисел выполнен!")
 
         # Установка флага выполнения
@@ -473,7 +551,8 @@ def display_result(state):
 
         # Дополнительная информация
         print("\nАНАЛИЗ:")
-        zero_count = state.result.count(0)
+        # Результат может быть списком или массивом NumPy (при загрузке из файла)
+        zero_count = sum(1 for value in state.result if value == 0)
         print(f"• Количество нулей в результате: {zero_count}")
         print(f"• Минимальное значение: {min(state.result)}")
         print(f"• Максимальное значение: {max(state.result)}")
@@ -487,6 +566,7 @@ def display_result(state):
 
         print("\nРЕЗУЛЬТАТ (повернутая матрица):")
         print(f"Размер: {len(state.result)} строк × {len(state.result[0])} столбцов")
+        # Строки выводятся прямо из представления, без копии всей матрицы
         for i, row in enumerate(state.result):
             print(f"  Строка {i+1}: {row}")
 
@@ -511,19 +591,8 @@ def display_result(state):
 
             # Анализ типов совпадений
             print("\nАНАЛИЗ СОВПАДЕНИЙ:")
-            direct_matches = []
-            reversed_matches = []
-
-            for num in state.result:
-                if num in arr1 and num in arr2:
-                    direct_matches.append(num)
-                else:
-                    # Поиск перевернутой версии
-                    for check_num in arr1:
-                        if isinstance(check_num, int) and check_num >= 0:
-                            reversed_num = int(str(check_num)[::-1])
-                            if reversed_num in arr2 and check_num == num:
-                                reversed_matches.append((check_num, reversed_num))
+            # Классификация уже получена при выполнении алгоритма
+            direct_matches, reversed_matches = state.match_analysis
 
             if direct_matches:
                 print(f"• Прямые совпадения ({len(direct_matches)}): {direct_matches}")
@@ -542,6 +611,39 @@ def display_result(state):
     print('='*60)
 
 
+def _cached_result(task, inputs, compute):
+    """
+    Результат алгоритма из кэша или вычисленный и сохраненный в кэш.
+
+    Ключ - номер задания и хеш содержимого входов, поэтому повторное
+    выполнение над теми же данными (в том числе после сброса результатов
+    или повторного ввода тех же данных) не пересчитывает результат.
+    Поворот матрицы (задание 3) не кэшируется: он возвращает
+    представление без копирования, и хеширование матрицы дороже него.
+
+    Параметры:
+    ----------
+    task : int
+        Номер задания
+    inputs : tuple or list
+        Входные данные
+    compute : callable
+        Вычисление результата без аргументов
+
+    Возвращает:
+    -----------
+    tuple
+        (результат, взят ли он из кэша)
+    """
+    key = make_key(task, {}, list(inputs))
+    result = result_cache.get(key)
+    if result is not None:
+        return result, True
+    result = compute()
+    result_cache.put(key, result)
+    return result, False
+
+
 def _adjust_array_size(arr, target_size):
     """
     Вспомогательная функция для корректировки размера массива.
@@ -652,7 +754,20 @@ if __name__ == "__main__":
 
     Запускает главную функцию при прямом выполнении файла.
     Позволяет также импортировать функции без запуска меню.
+    Команда "run" запускает пакетный режим без меню:
+    python main.py run --task 8 --input a.bin --input b.bin --output out.bin
+    Команда "show" выводит сводку по двоичному контейнеру результата:
+    python main.py show out.adp
+    Команда "generate" создает входные данные в контейнере:
+    python main.py generate --task 1 --size 1000000 --seed 42 --output data.adp
+    Команда "jobs" выполняет задания из манифеста JSONL в пуле:
+    python main.py jobs manifest.jsonl --pool process --workers 4
+    Команда "serve" запускает локальный сервер заданий (asyncio):
+    python main.py serve --unix /tmp/adp.sock --workers 4
     """
+    exit_code = run_command(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
     main()
 
 """
@@ -667,7 +782,8 @@ import os
 from datetime import datetime
 
 # Импорт модуля логирования
-from utils.logger import get_logger, FunctionLogger
+from src.utils.logger import (configure, get_logger, FunctionLogger, set_task_id, profiler,
+                              enable_profiling, disable_profiling, dump_stats)
 
 # Настройка логирования
 logger = get_logger('main')
@@ -690,6 +806,7 @@ class ApplicationState:
         self.result = None
         self.data_entered = False
         self.algorithm_executed = False
+        self.match_analysis = None
 
     @FunctionLogger('state')
     def reset_for_new_data(self):
@@ -699,6 +816,7 @@ class ApplicationState:
         """
         logger.info("Сброс результатов из-за новых данных")
         self.result = None
+        self.match_analysis = None
         self.algorithm_executed = False
 
 
@@ -740,6 +858,7 @@ def select_task(state):
         if choice in [1, 3, 8]:
             state.current_task = choice
             state.reset_for_new_data()
+            set_task_id(choice)
             logger.info(f"Задание {choice} установлено как текущее")
             print(f"✓ Выбрано задание {choice}")
         else:
@@ -824,8 +943,11 @@ def execute_algorithm(state):
             logger.debug(f"Данные для алгоритма 1: arr1={arr1}, arr2={arr2}")
 
             # Импортируем здесь, чтобы логирование сработало
-            from algorithms.algorithm1 import sum_arrays_special
-            state.result = sum_arrays_special(arr1, arr2)
+            from src.tasks.task1 import sum_arrays_special
+            state.result, cached = _cached_result(
+                1, state.data, lambda: sum_arrays_special(arr1, arr2))
+            if cached:
+                logger.info("Результат алгоритма 1 взят из кэша")
 
             logger.info(f"Алгоритм 1 выполнен. Результат: {state.result}")
 
@@ -838,7 +960,17 @@ def execute_algorithm(state):
 
         elif state.current_task == 8:
             logger.info("Выполнение алгоритма 8: поиск общих чисел")
-            # ... аналогично ...
+            arr1, arr2 = state.data
+
+            from src.tasks.task8 import classify_common_numbers
+            (common, direct_matches, reversed_matches), cached = _cached_result(
+                8, state.data, lambda: classify_common_numbers(arr1, arr2))
+            if cached:
+                logger.info("Результат алгоритма 8 взят из кэша")
+            state.result = common
+            state.match_analysis = (direct_matches, reversed_matches)
+
+            logger.info(f"Алгоритм 8 выполнен. Найдено общих чисел: {len(common)}")
 
         state.algorithm_executed = True
         logger.info(f"Алгоритм {state.current_task} успешно выполнен")
@@ -874,10 +1006,14 @@ def logging_settings_menu():
     print("1. Установить уровень логирования INFO (все сообщения)")
     print("2. Установить уровень логирования CRITICAL (только критические)")
     print("3. Показать текущие настройки логирования")
-    print("4. Вернуться в главное меню")
+    print("4. Включить/выключить профилирование функций")
+    print("5. Показать статистику профилирования")
+    print("6. Показать статистику кэша результатов")
+    print("7. Включить/выключить дисковый уровень кэша результатов")
+    print("8. Вернуться в главное меню")
 
     try:
-        choice = int(input("Выберите действие (1-4): "))
+        choice = int(input("Выберите действие (1-8): "))
 
         if choice == 1:
             # Устанавливаем уровень INFO
@@ -910,15 +1046,63 @@ def logging_settings_menu():
             for i, handler in enumerate(logger.handlers, 1):
                 print(f"  {i}. {type(handler).__name__}: "
                       f"{logging.getLevelName(handler.level)}")
+                # Асинхронный режим: политика и потери при переполнении очереди
+                if hasattr(handler, 'dropped'):
+                    print(f"     очередь: политика {handler.overflow}, "
+                          f"потеряно записей: {handler.dropped}")
 
         elif choice == 4:
+            # Переключаем профилирование
+            if profiler.enabled:
+                disable_profiling()
+                print("✓ Профилирование выключено (статистика сохранена)")
+            else:
+                answer = input("Замерять пиковую память (медленнее)? (да/нет): ").strip().lower()
+                enable_profiling(memory=answer in ['да', 'д', 'yes', 'y'])
+                print("✓ Профилирование включено")
+
+        elif choice == 5:
+            # Показываем статистику профилирования
+            print(f"\nПрофилирование: {'включено' if profiler.enabled else 'выключено'}")
+            print(dump_stats())
+
+        elif choice == 6:
+            # Показываем попадания и промахи кэша результатов
+            stats = result_cache.stats()
+            print(f"\nКэш результатов:")
+            print(f"Попаданий: {stats['hits']} (с диска: {stats['disk_hits']}), "
+                  f"промахов: {stats['misses']}, доля попаданий: {stats['hit_rate']:.1%}")
+            print(f"В памяти: {stats['entries']} записей, {stats['memory_bytes'] / 2 ** 20:.1f} МиБ "
+                  f"из {result_cache.memory_budget / 2 ** 20:.0f} МиБ, вытеснено: {stats['evictions']}")
+            if result_cache.disk_dir:
+                print(f"На диске ({result_cache.disk_dir}): {stats['disk_entries']} записей, "
+                      f"{stats['disk_bytes'] / 2 ** 20:.1f} МиБ")
+            else:
+                print(f"Дисковый уровень выключен (включается пунктом 7 или переменной {CACHE_DIR_ENV})")
+
+        elif choice == 7:
+            # Дисковый уровень: результаты переживают перезапуск приложения
+            if result_cache.disk_dir:
+                print(f"Дисковый уровень: {result_cache.disk_dir}")
+            disk_dir = input("Каталог дискового кэша (пустая строка - выключить): ").strip()
+            try:
+                result_cache.configure(disk_dir=disk_dir)
+            except OSError as e:
+                print(f"✗ Каталог недоступен: {e}")
+            else:
+                if disk_dir:
+                    print(f"✓ Дисковый уровень включен: {disk_dir}")
+                else:
+                    print("✓ Дисковый уровень выключен")
+
+        elif choice == 8:
             print("Возврат в главное меню...")
 
         else:
             print("Неверный выбор!")
 
     except ValueError:
-        print("Введите число от 1 до 4!")
+        print("Введите число от 1 до 8!")
 
 
 def main():
@@ -989,4 +1173,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Обработчики логов создаются только для интерактивного режима
+    configure()
+    main()
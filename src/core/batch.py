@@ -0,0 +1,473 @@
+"""
+ПАКЕТНЫЙ РЕЖИМ
+==============
+
+Неинтерактивный запуск алгоритмов без главного меню: данные читаются
+из файлов, результат записывается в файл, на экран выводится только
+краткая сводка (без содержимого массивов).
+
+Пример:
+-------
+python main.py run --task 8 --input a.bin --input b.bin --output out.bin
+python main.py run --task 3 --input m.npy --direction ccw --output r.npy
+python main.py run --task 1 --input data.adp --output result.adp
+python main.py run --task 8 --input a.txt --input b.txt --output common.txt --memory-budget 512
+python main.py show result.adp
+python main.py generate --task 1 --size 100000000 --seed 42 --output data.adp
+
+Форматы файлов (по расширению):
+-------------------------------
+- .adp - двоичный контейнер (src.utils.binary_format); все его столбцы
+  становятся входами задания по порядку, результат пишется в столбец
+  "result" с номером задания
+- .npy - массив NumPy
+- .txt - числа через пробел с типом --dtype (для матрицы - по строке
+  на строку матрицы)
+- остальные - двоичный файл по строкам с типом --dtype (для матрицы
+  нужен --shape)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен - доступны только .txt файлы
+    np = None
+
+from src.tasks.task1 import ENGINES, SORT_STRATEGIES, sum_arrays_special
+from src.tasks.task2 import rotate_clockwise, rotate_counterclockwise
+from src.tasks.task8 import find_common_numbers, find_common_numbers_external
+from src.utils.binary_format import (
+    EXTENSION,
+    allocate_container,
+    read_container,
+    write_container
+)
+from src.utils.input_operations import generate_array, read_matrix, read_numbers
+
+
+# Число входных файлов для каждого задания
+TASK_INPUTS = {1: 2, 3: 1, 8: 2}
+
+# Направления поворота задания 3
+DIRECTIONS = ('cw', 'ccw')
+
+# Тип элементов текстовых и двоичных файлов по умолчанию
+DEFAULT_DTYPE = 'int64'
+
+
+def load_task_inputs(task, paths, dtype=DEFAULT_DTYPE, shape=None):
+    """
+    Загрузка всех входов задания из файлов с проверкой их числа.
+
+    Параметры:
+    ----------
+    task : int
+        Номер задания (1, 3 или 8)
+    paths : list
+        Входные файлы (контейнер .adp может дать несколько входов)
+    dtype, shape
+        См. load_data
+
+    Возвращает:
+    -----------
+    list
+        Входные данные задания
+
+    Исключения:
+    -----------
+    ValueError
+        Если число входов не совпадает с нужным заданию
+    """
+    inputs = []
+    for path in paths:
+        inputs.extend(load_inputs(path, matrix=task == 3, dtype=dtype, shape=shape))
+    expected = TASK_INPUTS[task]
+    if len(inputs) != expected:
+        raise ValueError(f"для задания {task} нужно входов: {expected}, получено {len(inputs)}")
+    return inputs
+
+
+def load_inputs(path, matrix=False, dtype=DEFAULT_DTYPE, shape=None):
+    """
+    Загрузка входов задания из одного файла.
+
+    Контейнер .adp может содержать несколько входов (например, оба
+    массива задания 1), остальные форматы - ровно один.
+
+    Параметры:
+    ----------
+    path : str
+        Путь к файлу
+    matrix, dtype, shape
+        См. load_data (для контейнера не используются)
+
+    Возвращает:
+    -----------
+    list
+        Входные данные в порядке столбцов
+    """
+    if os.path.splitext(path)[1].lower() == EXTENSION:
+        container = read_container(path)
+        # Без NumPy столбцы - memoryview; матрицы переводятся в списки строк
+        return [column if np is not None or column.ndim == 1 else column.tolist()
+                for column in container.columns.values()]
+    return [load_data(path, matrix=matrix, dtype=dtype, shape=shape)]
+
+
+def load_data(path, matrix=False, dtype=DEFAULT_DTYPE, shape=None):
+    """
+    Загрузка массива или матрицы из файла.
+
+    Параметры:
+    ----------
+    path : str
+        Путь к файлу (.npy, .txt или двоичный)
+    matrix : bool
+        Загружать ли матрицу (для .txt - строки файла, для двоичного - shape)
+    dtype : str
+        Тип элементов текстового или двоичного файла
+    shape : tuple or None
+        Размер матрицы (для .txt необязателен - столбцы по первой строке)
+
+    Возвращает:
+    -----------
+    list or numpy.ndarray
+        Загруженные данные
+
+    Исключения:
+    -----------
+    ValueError
+        Если формат не поддерживается или данные некорректны
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == '.txt':
+        # Потоковый разбор блоками сразу в типизированный массив
+        if matrix:
+            return read_matrix(path, cols=shape[1] if shape else None, dtype=dtype)
+        return read_numbers(path, dtype=dtype)
+
+    if np is None:
+        raise ValueError(f"для файлов {ext or 'без расширения'} требуется NumPy")
+
+    if ext == '.npy':
+        data = np.load(path, mmap_mode='r' if matrix else None)
+    else:
+        data = np.fromfile(path, dtype=np.dtype(dtype))
+        if matrix:
+            if shape is None:
+                raise ValueError("для двоичной матрицы нужно указать --shape")
+            data = data.reshape(shape)
+
+    expected_ndim = 2 if matrix else 1
+    if data.ndim != expected_ndim:
+        raise ValueError(f"{path}: ожидается измерений {expected_ndim}, получено {data.ndim}")
+    return data
+
+
+def save_result(path, result, dtype=DEFAULT_DTYPE, task=0):
+    """
+    Запись результата в файл.
+
+    Параметры:
+    ----------
+    path : str
+        Путь к файлу (.npy, .txt или двоичный)
+    result : list, numpy.ndarray or RotatedMatrix
+        Результат алгоритма (массив или матрица)
+    dtype : str
+        Тип элементов двоичного файла для результатов-списков
+    task : int
+        Номер задания (записывается в контейнер .adp)
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == EXTENSION:
+        write_container(path, {'result': result}, task=task)
+        return
+
+    if ext == '.txt':
+        with open(path, 'w', encoding='utf-8') as f:
+            rows = result if _is_matrix(result) else [result]
+            for row in rows:
+                f.write(' '.join(map(str, _as_list(row))))
+                f.write('\n')
+        return
+
+    if np is None:
+        raise ValueError(f"для файлов {ext or 'без расширения'} требуется NumPy")
+
+    if not isinstance(result, np.ndarray):
+        result = np.asarray(list(result), dtype=np.dtype(dtype))
+    if ext == '.npy':
+        np.save(path, result)
+    else:
+        np.ascontiguousarray(result).tofile(path)
+
+
+def run_task(task, inputs, direction='cw', engine='auto', workers=None, sort='auto'):
+    """
+    Выполнение алгоритма над загруженными данными.
+
+    Параметры:
+    ----------
+    task : int
+        Номер задания (1, 3 или 8)
+    inputs : list
+        Входные данные (два массива или одна матрица)
+    direction : str
+        Направление поворота для задания 3: "cw" или "ccw"
+    engine : str
+        Движок для задания 1
+    workers : int or None
+        Число процессов движка "parallel" (None - по числу ядер)
+    sort : str
+        Стратегия сортировки для задания 1
+
+    Возвращает:
+    -----------
+    list, numpy.ndarray or RotatedMatrix
+        Результат алгоритма
+
+    Исключения:
+    -----------
+    ValueError
+        Если задание или направление поворота неизвестны
+    """
+    if task == 1:
+        return sum_arrays_special(inputs[0], inputs[1], engine=engine, workers=workers, sort=sort)
+    if task == 3:
+        if direction not in DIRECTIONS:
+            raise ValueError(f"неизвестное направление: {direction} (доступны: {', '.join(DIRECTIONS)})")
+        # Представление без копии: при записи строки читаются прямо из исходной матрицы
+        rotate = rotate_clockwise if direction == 'cw' else rotate_counterclockwise
+        return rotate(inputs[0], view=True)
+    if task == 8:
+        return find_common_numbers(inputs[0], inputs[1])
+    raise ValueError(f"неизвестное задание: {task}")
+
+
+def build_parser():
+    """Разбор аргументов командной строки пакетного режима."""
+    parser = argparse.ArgumentParser(
+        prog='main.py run',
+        description="Пакетный запуск алгоритма без интерактивного меню")
+    parser.add_argument('--task', type=int, choices=sorted(TASK_INPUTS), required=True,
+                        help="номер задания")
+    parser.add_argument('--input', action='append', required=True, dest='inputs',
+                        help="входной файл (для заданий 1 и 8 - дважды, "
+                             "если это не контейнер .adp с обоими массивами)")
+    parser.add_argument('--output', required=True, help="файл для результата")
+    parser.add_argument('--dtype', default=DEFAULT_DTYPE, help="тип элементов текстовых и двоичных файлов")
+    parser.add_argument('--shape', type=int, nargs=2, metavar=('ROWS', 'COLS'),
+                        help="размер матрицы в двоичном файле (задание 3)")
+    parser.add_argument('--direction', choices=DIRECTIONS, default='cw',
+                        help="направление поворота (задание 3)")
+    parser.add_argument('--engine', choices=ENGINES, default='auto',
+                        help="движок вычислений (задание 1)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="число процессов движка parallel (по умолчанию - число ядер)")
+    parser.add_argument('--sort', choices=SORT_STRATEGIES, default='auto',
+                        help="стратегия сортировки (задание 1): подсчет для узких диапазонов целых")
+    parser.add_argument('--memory-budget', type=int, default=None, metavar='MIB',
+                        help="задание 8 во внешней памяти с этим бюджетом (МиБ): "
+                             "для входов больше ОЗУ, вывод - .txt или двоичный")
+    parser.add_argument('--tmp-dir', default=None,
+                        help="каталог временных файлов внешнего режима")
+    return parser
+
+
+def main(argv=None):
+    """
+    Точка входа пакетного режима.
+
+    Параметры:
+    ----------
+    argv : list or None
+        Аргументы после "run" (None - из sys.argv)
+
+    Возвращает:
+    -----------
+    int
+        Код завершения: 0 - успех, 1 - ошибка данных или файлов
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    expected = TASK_INPUTS[args.task]
+    if len(args.inputs) > expected:
+        parser.error(f"для задания {args.task} нужно входных файлов: {expected}")
+    if args.memory_budget is not None:
+        if args.task != 8:
+            parser.error("--memory-budget поддерживается только для задания 8")
+        return _external_main(args)
+
+    try:
+        start = time.perf_counter()
+        inputs = load_task_inputs(args.task, args.inputs, dtype=args.dtype, shape=args.shape)
+        loaded = time.perf_counter()
+        result = run_task(args.task, inputs, args.direction, args.engine, args.workers, args.sort)
+        computed = time.perf_counter()
+        save_result(args.output, result, args.dtype, args.task)
+        saved = time.perf_counter()
+    except (OSError, ValueError) as e:
+        print(f"✗ Ошибка: {e}", file=sys.stderr)
+        return 1
+
+    sizes = ' + '.join(str(len(data)) for data in inputs)
+    print(f"задание {args.task}: вход {sizes}, результат {len(result)} → {args.output} "
+          f"(чтение {loaded - start:.3f} с, алгоритм {computed - loaded:.3f} с, "
+          f"запись {saved - computed:.3f} с)")
+    return 0
+
+
+def generate_main(argv=None):
+    """
+    Генерация входных данных задания прямо в контейнер .adp.
+
+    Столбцы контейнера выделяются заранее (allocate_container) и
+    заполняются генератором блоками через memmap, поэтому наборы
+    в сотни миллионов элементов не требуют такого же объема памяти.
+    Каждый столбец получает собственный поток из SeedSequence(seed).
+
+    Параметры:
+    ----------
+    argv : list or None
+        Аргументы после "generate" (None - из sys.argv)
+
+    Возвращает:
+    -----------
+    int
+        Код завершения: 0 - успех, 1 - ошибка
+    """
+    parser = argparse.ArgumentParser(prog='main.py generate',
+                                     description="Генерация данных задания в контейнер .adp")
+    parser.add_argument('--task', type=int, choices=sorted(TASK_INPUTS), required=True)
+    parser.add_argument('--size', type=int, help="размер массивов (задания 1 и 8)")
+    parser.add_argument('--shape', type=int, nargs=2, metavar=('ROWS', 'COLS'),
+                        help="размер матрицы (задание 3)")
+    parser.add_argument('--min', type=float, default=0, dest='min_val')
+    parser.add_argument('--max', type=float, default=100, dest='max_val')
+    parser.add_argument('--dtype', default='int64')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--output', required=True, help="файл контейнера .adp")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("✗ Ошибка: генерация требует NumPy", file=sys.stderr)
+        return 1
+    if args.task == 3:
+        if args.shape is None:
+            parser.error("для задания 3 нужен --shape")
+        columns = {'matrix': (args.dtype, tuple(args.shape))}
+    else:
+        if args.size is None:
+            parser.error(f"для задания {args.task} нужен --size")
+        columns = {'arr1': (args.dtype, (args.size,)), 'arr2': (args.dtype, (args.size,))}
+
+    min_val, max_val = args.min_val, args.max_val
+    if np.dtype(args.dtype).kind in 'iu':
+        min_val, max_val = int(min_val), int(max_val)
+
+    try:
+        start = time.perf_counter()
+        container = allocate_container(args.output, columns, task=args.task)
+        seeds = np.random.SeedSequence(args.seed).spawn(len(columns))
+        for column, seed in zip(container.columns.values(), seeds):
+            generate_array(min_val=min_val, max_val=max_val, seed=seed,
+                           out=column, workers=args.workers)
+            column.flush()
+        elapsed = time.perf_counter() - start
+    except (OSError, ValueError) as e:
+        print(f"✗ Ошибка: {e}", file=sys.stderr)
+        return 1
+
+    total = sum(column.size for column in container.columns.values())
+    print(f"задание {args.task}: сгенерировано {total} элементов → {args.output} ({elapsed:.3f} с)")
+    return 0
+
+
+def show_main(argv=None):
+    """
+    Вывод сводки по контейнеру .adp без вывода всех данных.
+
+    Для каждого столбца печатаются тип, размер, первые элементы и
+    (при наличии NumPy) минимум и максимум. Данные читаются из
+    отображенного в память файла без копирования.
+
+    Параметры:
+    ----------
+    argv : list or None
+        Аргументы после "show" (None - из sys.argv)
+
+    Возвращает:
+    -----------
+    int
+        Код завершения: 0 - успех, 1 - ошибка чтения
+    """
+    parser = argparse.ArgumentParser(prog='main.py show',
+                                     description="Сводка по двоичному контейнеру")
+    parser.add_argument('path', help="файл контейнера .adp")
+    parser.add_argument('--head', type=int, default=10, help="сколько элементов показать")
+    args = parser.parse_args(argv)
+
+    try:
+        container = read_container(args.path)
+    except (OSError, ValueError) as e:
+        print(f"✗ Ошибка: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Контейнер: {args.path}")
+    print(f"Задание: {container.task or 'не указано'}")
+    for name, column in container.columns.items():
+        shape = 'x'.join(map(str, column.shape))
+        dtype = column.dtype if np is not None else column.format
+        print(f"• {name}: {dtype}, {shape}")
+        if np is not None and column.size:
+            flat = column.reshape(-1)
+            print(f"  первые элементы: {flat[:args.head].tolist()}")
+            print(f"  минимум: {flat.min()}, максимум: {flat.max()}")
+        elif np is None and column.nbytes:
+            flat = column.cast('B').cast(column.format)
+            print(f"  первые элементы: {flat[:args.head].tolist()}")
+    return 0
+
+
+def _external_main(args):
+    """Задание 8 во внешней памяти: входы читаются блоками, результат пишется потоково."""
+    try:
+        start = time.perf_counter()
+        sources = list(args.inputs)
+        if len(sources) == 1 and os.path.splitext(sources[0])[1].lower() == EXTENSION:
+            # Контейнер с обоими массивами - столбцы отображены в память, не загружены
+            sources = list(read_container(sources[0]).columns.values())
+        if len(sources) != TASK_INPUTS[8]:
+            raise ValueError(f"для задания 8 нужно входов: {TASK_INPUTS[8]}, получено {len(sources)}")
+        count = find_common_numbers_external(sources[0], sources[1], args.output,
+                                             memory_budget=args.memory_budget * 1024 * 1024,
+                                             tmp_dir=args.tmp_dir, dtype=args.dtype)
+    except (OSError, ValueError) as e:
+        print(f"✗ Ошибка: {e}", file=sys.stderr)
+        return 1
+
+    print(f"задание 8 (внешняя память, {args.memory_budget} МиБ): результат {count} → {args.output} "
+          f"({time.perf_counter() - start:.3f} с)")
+    return 0
+
+
+def _is_matrix(result):
+    """Проверка, является ли результат матрицей (а не одномерным массивом)."""
+    if np is not None and isinstance(result, np.ndarray):
+        return result.ndim == 2
+    scalars = (int, float, np.generic) if np is not None else (int, float)
+    return len(result) > 0 and not isinstance(result[0], scalars)
+
+
+def _as_list(row):
+    """Строка результата в виде списка чисел Python."""
+    return row.tolist() if np is not None and isinstance(row, np.ndarray) else row
@@ -0,0 +1,157 @@
+"""
+КЛИЕНТ ЛОКАЛЬНОГО СЕРВЕРА
+=========================
+
+Асинхронный клиент сервера src.core.server с конвейером запросов:
+request() можно вызывать одновременно из многих задач asyncio - запросы
+уходят сразу, ответы сопоставляются по id.
+
+Пример:
+-------
+client = await Client.connect(unix='/tmp/adp.sock')
+response = await client.request(8, [[12, 5], [21, 6]])
+response['result']  # [12]
+await client.close()
+"""
+
+import asyncio
+import itertools
+
+from src.core.server import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    KIND_BINARY,
+    KIND_JSON,
+    MAX_FRAME_SIZE,
+    pack_request,
+    read_frame,
+    unpack_response,
+    write_frame
+)
+
+
+class Client:
+    """
+    Соединение с сервером заданий.
+
+    Создается через Client.connect; закрывается close() или как
+    асинхронный контекстный менеджер.
+    """
+
+    def __init__(self, reader, writer, max_frame=MAX_FRAME_SIZE):
+        self._reader = reader
+        self._writer = writer
+        self._max_frame = max_frame
+        self._ids = itertools.count()
+        self._waiters = {}
+        self._drain_lock = asyncio.Lock()
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT, unix=None):
+        """
+        Подключение к серверу.
+
+        Параметры:
+        ----------
+        host, port : str, int
+            Адрес TCP (если unix не задан)
+        unix : str or None
+            Путь сокета Unix
+
+        Возвращает:
+        -----------
+        Client
+            Подключенный клиент
+        """
+        if unix:
+            reader, writer = await asyncio.open_unix_connection(unix)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, task, inputs, binary=False, **params):
+        """
+        Выполнение задания на сервере.
+
+        Параметры:
+        ----------
+        task : int
+            Номер задания (1, 3 или 8)
+        inputs : list
+            Входы задания (два массива или одна матрица)
+        binary : bool
+            Двоичный кадр (контейнер) вместо JSON
+        **params
+            direction, engine, sort
+
+        Возвращает:
+        -----------
+        dict
+            Ответ сервера: id, status, result или error, elapsed_s
+
+        Исключения:
+        -----------
+        ConnectionError
+            Если соединение закрыто до получения ответа
+        """
+        if self._receiver.done():
+            raise ConnectionError("соединение с сервером закрыто")
+        kind = KIND_BINARY if binary else KIND_JSON
+        request_id = next(self._ids)
+        payload = pack_request(kind, task, inputs, request_id, **params)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[request_id] = waiter
+        try:
+            write_frame(self._writer, kind, payload)
+            async with self._drain_lock:
+                await self._writer.drain()
+        except BaseException:
+            # Запрос не отправлен - ответа ждать некому; ошибку соединения,
+            # уже переданную приемом ответов, вызывающий получит отсюда
+            self._waiters.pop(request_id, None)
+            if waiter.done() and not waiter.cancelled():
+                waiter.exception()
+            waiter.cancel()
+            raise
+        return await waiter
+
+    async def close(self):
+        """Закрытие соединения."""
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._receiver.cancel()
+        try:
+            await self._receiver
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _receive(self):
+        """Прием ответов и передача их ожидающим запросам."""
+        error = ConnectionError("соединение с сервером закрыто")
+        try:
+            while True:
+                frame = await read_frame(self._reader, self._max_frame)
+                if frame is None:
+                    break
+                response = unpack_response(*frame)
+                waiter = self._waiters.pop(response.get('id'), None)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(response)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            error = ConnectionError(f"соединение с сервером прервано: {e}")
+        finally:
+            for waiter in self._waiters.values():
+                if not waiter.done():
+                    waiter.set_exception(error)
+            self._waiters.clear()
@@ -0,0 +1,385 @@
+"""
+ЗАПУСК ЗАДАНИЙ ПО МАНИФЕСТУ
+===========================
+
+Пакетная обработка множества заданий 1/3/8 из манифеста JSONL в пуле
+потоков или процессов. Каждое задание выполняется в собственном
+состоянии (JobState - аналог ApplicationState), результаты выводятся
+построчно в JSONL по мере завершения, в конце печатается сводка:
+пропускная способность и задержки (p50/p95/p99).
+
+Строка манифеста:
+-----------------
+{"id": "a1", "task": 1, "inputs": ["data.adp"], "output": "r1.adp"}
+{"id": "m7", "task": 3, "data": [[[1, 2], [3, 4]]], "direction": "ccw"}
+{"task": 8, "inputs": ["a.txt", "b.txt"], "dtype": "int32"}
+
+Поля:
+- task      - номер задания (1, 3 или 8), обязательно
+- id        - идентификатор (по умолчанию - номер строки)
+- inputs    - входные файлы (как --input пакетного режима)
+- data      - входные данные прямо в манифесте (списки), вместо inputs
+- output    - файл результата; без него результат включается в запись
+- direction, engine, sort, dtype, shape - как в пакетном режиме
+- workers   - число процессов для engine="parallel" (как --workers
+              пакетного режима, а не размер пула манифеста)
+
+Пример:
+-------
+python main.py jobs manifest.jsonl --pool process --workers 8 --output results.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from src.core.batch import DEFAULT_DTYPE, TASK_INPUTS, load_task_inputs, run_task, save_result
+
+# Виды пулов исполнителей
+POOLS = ('thread', 'process')
+
+
+class JobState:
+    """
+    Состояние одного задания - аналог ApplicationState интерактивного
+    режима, но свое у каждого задания, поэтому задания не влияют друг
+    на друга при параллельном выполнении.
+
+    Атрибуты:
+    ---------
+    job_id : str
+        Идентификатор задания
+    current_task : int
+        Номер задания
+    data : list or None
+        Входные данные
+    result : object
+        Результат алгоритма
+    data_entered, algorithm_executed : bool
+        Выполненные этапы
+    """
+
+    def __init__(self, job_id, task):
+        self.job_id = job_id
+        self.current_task = task
+        self.data = None
+        self.result = None
+        self.data_entered = False
+        self.algorithm_executed = False
+
+
+def read_manifest(path):
+    """
+    Чтение манифеста JSONL.
+
+    Пустые строки и строки, начинающиеся с "#", пропускаются. Ошибки
+    разбора не прерывают чтение: задание возвращается с полем "error".
+
+    Параметры:
+    ----------
+    path : str
+        Путь к файлу манифеста
+
+    Возвращает:
+    -----------
+    generator
+        Описания заданий (dict) с гарантированным полем "id"
+    """
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError("строка манифеста должна быть объектом JSON")
+            except ValueError as e:
+                yield {'id': str(line_number), 'error': f"строка {line_number}: {e}"}
+                continue
+            job.setdefault('id', str(line_number))
+            yield job
+
+
+def execute_job(job):
+    """
+    Выполнение одного задания (в потоке или процессе пула).
+
+    Параметры:
+    ----------
+    job : dict
+        Описание задания из манифеста
+
+    Возвращает:
+    -----------
+    dict
+        Запись результата: id, task, status ("ok" или "error"), error,
+        размеры входов и результата, output или result, время этапов
+        (load_s, compute_s, save_s) и pid исполнителя
+    """
+    record = {'id': job.get('id'), 'task': job.get('task'), 'pid': os.getpid()}
+    start = time.perf_counter()
+    try:
+        if 'error' in job:
+            raise ValueError(job['error'])
+        state = JobState(job['id'], _job_task(job))
+
+        state.data = _load_job_inputs(job, state.current_task)
+        state.data_entered = True
+        loaded = time.perf_counter()
+
+        state.result = run_task(state.current_task, state.data,
+                                direction=job.get('direction', 'cw'),
+                                engine=job.get('engine', 'auto'),
+                                workers=_job_workers(job),
+                                sort=job.get('sort', 'auto'))
+        state.algorithm_executed = True
+        computed = time.perf_counter()
+
+        if job.get('output'):
+            save_result(job['output'], state.result, job.get('dtype', DEFAULT_DTYPE), state.current_task)
+            record['output'] = job['output']
+        else:
+            record['result'] = _as_json_value(state.result)
+        saved = time.perf_counter()
+    except Exception as e:  # ошибка одного задания не должна прерывать весь манифест
+        record.update(status='error', error=f"{type(e).__name__}: {e}",
+                      elapsed_s=time.perf_counter() - start)
+        return record
+
+    record.update(
+        status='ok',
+        input_sizes=[len(data) for data in state.data],
+        result_size=len(state.result),
+        load_s=loaded - start,
+        compute_s=computed - loaded,
+        save_s=saved - computed,
+        elapsed_s=saved - start,
+    )
+    return record
+
+
+def run_jobs(jobs, pool='thread', workers=None, max_pending=None):
+    """
+    Выполнение заданий в пуле с выдачей результатов по мере завершения.
+
+    Задания передаются в пул не все сразу, а с ограничением числа
+    ожидающих (max_pending), поэтому манифест любого размера читается
+    потоково.
+
+    Параметры:
+    ----------
+    jobs : iterable
+        Описания заданий
+    pool : str
+        "thread" или "process"
+    workers : int or None
+        Число исполнителей (None - по числу ядер)
+    max_pending : int or None
+        Наибольшее число отправленных, но не завершенных заданий
+        (None - вчетверо больше числа исполнителей)
+
+    Возвращает:
+    -----------
+    generator
+        Записи execute_job с добавленным полем latency_s - время от
+        отправки задания в пул до получения результата. Сбой самого пула
+        (например, аварийно завершенный процесс) дает запись с ошибкой
+        для затронутых заданий
+
+    Исключения:
+    -----------
+    ValueError
+        Если вид пула неизвестен или число исполнителей не положительно
+    """
+    if pool not in POOLS:
+        raise ValueError(f"неизвестный пул: {pool} (доступны: {', '.join(POOLS)})")
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("число исполнителей должно быть положительным")
+    max_pending = max_pending or workers * 4
+
+    executor_class = ProcessPoolExecutor if pool == 'process' else ThreadPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        pending = {}
+        jobs = iter(jobs)
+        exhausted = False
+        while pending or not exhausted:
+            # Дозаполняем очередь пула
+            while not exhausted and len(pending) < max_pending:
+                job = next(jobs, None)
+                if job is None:
+                    exhausted = True
+                    break
+                submitted = time.perf_counter()
+                try:
+                    pending[executor.submit(execute_job, job)] = (job, submitted)
+                except Exception as e:  # пул уже неработоспособен
+                    yield _failed_record(job, e, submitted)
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                job, submitted = pending.pop(future)
+                try:
+                    record = future.result()
+                except Exception as e:
+                    yield _failed_record(job, e, submitted)
+                    continue
+                record['latency_s'] = time.perf_counter() - submitted
+                yield record
+
+
+def summarize(records, wall_time):
+    """
+    Сводка по выполненным заданиям.
+
+    Параметры:
+    ----------
+    records : list
+        Записи run_jobs
+    wall_time : float
+        Общее время выполнения (секунды)
+
+    Возвращает:
+    -----------
+    dict
+        jobs, ok, failed, wall_s, jobs_per_s, elements_per_s и задержки
+        latency_p50_s / p95 / p99 / max
+    """
+    latencies = sorted(record['latency_s'] for record in records)
+    elements = sum(sum(record.get('input_sizes', ())) for record in records)
+    ok = sum(1 for record in records if record['status'] == 'ok')
+    return {
+        'jobs': len(records),
+        'ok': ok,
+        'failed': len(records) - ok,
+        'wall_s': wall_time,
+        'jobs_per_s': len(records) / wall_time if wall_time > 0 else 0.0,
+        'elements_per_s': elements / wall_time if wall_time > 0 else 0.0,
+        'latency_p50_s': _percentile(latencies, 50),
+        'latency_p95_s': _percentile(latencies, 95),
+        'latency_p99_s': _percentile(latencies, 99),
+        'latency_max_s': latencies[-1] if latencies else 0.0,
+    }
+
+
+def main(argv=None):
+    """
+    Точка входа запуска по манифесту.
+
+    Параметры:
+    ----------
+    argv : list or None
+        Аргументы после "jobs" (None - из sys.argv)
+
+    Возвращает:
+    -----------
+    int
+        Код завершения: 0 - все задания выполнены, 1 - есть ошибки
+    """
+    parser = argparse.ArgumentParser(prog='main.py jobs',
+                                     description="Параллельный запуск заданий из манифеста JSONL")
+    parser.add_argument('manifest', help="файл манифеста JSONL")
+    parser.add_argument('--pool', choices=POOLS, default='thread',
+                        help="пул исполнителей: потоки или процессы")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="число исполнителей (по умолчанию - число ядер)")
+    parser.add_argument('--output', default=None,
+                        help="файл результатов JSONL (по умолчанию - стандартный вывод)")
+    args = parser.parse_args(argv)
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("число исполнителей должно быть положительным")
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    # Сводка не должна смешиваться с результатами в стандартном выводе
+    report = sys.stdout if args.output else sys.stderr
+    records = []
+    try:
+        start = time.perf_counter()
+        for record in run_jobs(read_manifest(args.manifest), args.pool, args.workers):
+            records.append({key: value for key, value in record.items() if key != 'result'})
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            out.flush()
+        wall_time = time.perf_counter() - start
+    except OSError as e:
+        print(f"✗ Ошибка: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    summary = summarize(records, wall_time)
+    print(f"заданий: {summary['jobs']} (успешно {summary['ok']}, с ошибкой {summary['failed']}) "
+          f"за {summary['wall_s']:.3f} с - {summary['jobs_per_s']:.1f} заданий/с, "
+          f"{summary['elements_per_s']:.3g} элементов/с", file=report)
+    print(f"задержка: p50 {summary['latency_p50_s'] * 1000:.2f} мс, "
+          f"p95 {summary['latency_p95_s'] * 1000:.2f} мс, "
+          f"p99 {summary['latency_p99_s'] * 1000:.2f} мс, "
+          f"макс. {summary['latency_max_s'] * 1000:.2f} мс", file=report)
+    return 0 if summary['failed'] == 0 else 1
+
+
+def _failed_record(job, error, submitted):
+    """Запись ошибки задания, которое пул не смог выполнить."""
+    elapsed = time.perf_counter() - submitted
+    return {'id': job.get('id'), 'task': job.get('task'), 'status': 'error',
+            'error': f"{type(error).__name__}: {error}", 'elapsed_s': elapsed, 'latency_s': elapsed}
+
+
+def _job_task(job):
+    """Номер задания из описания с проверкой."""
+    task = job.get('task')
+    if task not in TASK_INPUTS:
+        raise ValueError(f"неизвестное задание: {task} (доступны: 1, 3, 8)")
+    return task
+
+
+def _job_workers(job):
+    """Число процессов задания для engine="parallel" с проверкой."""
+    workers = job.get('workers')
+    if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int)
+                                or workers < 1):
+        raise ValueError(f"workers должно быть целым числом не меньше 1, получено {workers!r}")
+    return workers
+
+
+def _load_job_inputs(job, task):
+    """Входные данные задания: из манифеста ("data") или из файлов ("inputs")."""
+    if 'data' not in job:
+        shape = job.get('shape')
+        return load_task_inputs(task, job.get('inputs', ()), dtype=job.get('dtype', DEFAULT_DTYPE),
+                                shape=tuple(shape) if shape else None)
+    inputs = list(job['data'])
+    expected = TASK_INPUTS[task]
+    if len(inputs) != expected:
+        raise ValueError(f"для задания {task} нужно входов: {expected}, получено {len(inputs)}")
+    return inputs
+
+
+def _as_json_value(result):
+    """Результат в виде списков Python для записи в JSON."""
+    if hasattr(result, 'materialize'):
+        result = result.materialize()
+    if hasattr(result, 'tolist'):
+        return result.tolist()
+    return [_as_json_value(row) if isinstance(row, (list, tuple)) else _as_number(row)
+            for row in result]
+
+
+def _as_number(value):
+    """Число Python вместо скаляра NumPy."""
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _percentile(ordered, q):
+    """Перцентиль отсортированного списка методом ближайшего ранга."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
@@ -0,0 +1,518 @@
+"""
+ЛОКАЛЬНЫЙ СЕРВЕР ЗАПРОСОВ
+=========================
+
+Асинхронный сервер (asyncio, только стандартная библиотека и NumPy
+алгоритмов) для вызова заданий 1/3/8 из других процессов на той же
+машине - без запуска интерпретатора на каждый вызов. Слушает сокет Unix
+или TCP на localhost.
+
+Протокол:
+---------
+Запросы и ответы передаются кадрами: вид (1 байт), длина нагрузки
+(u32 little-endian), нагрузка. Вид кадра:
+
+- b'J' - JSON: запрос {"id", "task", "data": [входы], "direction",
+  "engine" (auto, python или numpy), "sort"}, ответ {"id", "status": "ok"/"error", "result" или
+  "error", "elapsed_s"}
+- b'B' - двоичный: длина метаданных (u32), метаданные JSON (id,
+  direction, engine, sort; task - необязательно) и контейнер
+  src.utils.binary_format, столбцы которого - входы по порядку, а номер
+  задания - из заголовка; ответ - метаданные ответа и контейнер со
+  столбцом "result" (при ошибке контейнера нет)
+
+Ответ приходит в том же виде, что и запрос. Клиент может отправлять
+запросы, не дожидаясь ответов (конвейер): ответы приходят по мере
+готовности и сопоставляются по id.
+
+Совсем маленькие запросы (нагрузка до inline_bytes, по умолчанию 4 КиБ -
+десятки микросекунд вычислений) выполняются прямо в цикле событий:
+пересылка в процесс стоила бы дороже самого вычисления. Остальные уходят
+в заранее запущенный и прогретый пул процессов, чтобы долгий запрос не
+задерживал другие соединения.
+
+Пример:
+-------
+python main.py serve --unix /tmp/adp.sock --workers 4
+python main.py serve --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import stat
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.core.batch import TASK_INPUTS, run_task
+from src.utils.binary_format import decode_container, encode_container
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен - матрицы контейнера переводятся в списки
+    np = None
+
+
+# Адрес по умолчанию (только локальные подключения)
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Виды кадров
+KIND_JSON = b'J'
+KIND_BINARY = b'B'
+
+# Заголовок кадра: вид и длина нагрузки
+FRAME = struct.Struct('<cI')
+
+# Наибольший размер нагрузки кадра (байт)
+MAX_FRAME_SIZE = 1 << 30
+
+# Нагрузка, до которой запрос выполняется без пула процессов (байт)
+INLINE_BYTES = 4 * 1024
+
+# Наибольшее число одновременно выполняемых запросов одного соединения
+MAX_IN_FLIGHT = 64
+
+# Допустимые движки: "parallel" запускал бы свой пул процессов внутри
+# цикла событий или процесса пула сервера - параллелизм дает сам сервер
+ENGINES = ('auto', 'python', 'numpy')
+
+_META = struct.Struct('<I')
+
+
+def pack_request(kind, task, inputs, request_id=None, **params):
+    """
+    Нагрузка кадра запроса.
+
+    Параметры:
+    ----------
+    kind : bytes
+        KIND_JSON или KIND_BINARY
+    task : int
+        Номер задания
+    inputs : list
+        Входы задания (списки или массивы NumPy)
+    request_id : object
+        Идентификатор для сопоставления ответа
+    **params
+        direction, engine, sort
+
+    Возвращает:
+    -----------
+    bytes
+        Нагрузка кадра (без заголовка FRAME)
+    """
+    if kind == KIND_JSON:
+        request = {'id': request_id, 'task': task, 'data': [_as_json(data) for data in inputs], **params}
+        return json.dumps(request, default=_json_scalar).encode('utf-8')
+    columns = {f"input{k}": data for k, data in enumerate(inputs)}
+    return _pack_binary({'id': request_id, **params}, encode_container(columns, task=task))
+
+
+def unpack_response(kind, payload):
+    """
+    Разбор нагрузки кадра ответа.
+
+    Параметры:
+    ----------
+    kind : bytes
+        Вид кадра
+    payload : bytes
+        Нагрузка кадра
+
+    Возвращает:
+    -----------
+    dict
+        Ответ; для двоичного кадра "result" - массив поверх payload
+        (без копирования)
+    """
+    if kind == KIND_JSON:
+        return json.loads(payload)
+    response, container = _unpack_binary(payload)
+    if container is not None:
+        response['result'] = container['result']
+    return response
+
+
+def handle_request(kind, payload):
+    """
+    Выполнение одного запроса (в цикле событий или в процессе пула).
+
+    Ошибки данных не выбрасываются, а возвращаются в ответе.
+
+    Параметры:
+    ----------
+    kind : bytes
+        Вид кадра запроса
+    payload : bytes
+        Нагрузка кадра запроса
+
+    Возвращает:
+    -----------
+    bytes
+        Нагрузка кадра ответа того же вида
+    """
+    start = time.perf_counter()
+    request = {}
+    try:
+        if kind == KIND_JSON:
+            request = json.loads(payload)
+            if not isinstance(request, dict):
+                raise ValueError("запрос должен быть объектом JSON")
+            task, inputs = request.get('task'), request.get('data') or []
+        elif kind == KIND_BINARY:
+            # Метаданные разбираются отдельно, чтобы ответ с ошибкой
+            # поврежденного контейнера нес id запроса
+            request, end = _unpack_meta(payload)
+            container = decode_container(memoryview(payload)[end:])
+            task = request.get('task', container.task)
+            # Без NumPy столбцы - memoryview; матрицы переводятся в списки строк
+            inputs = [column if np is not None or column.ndim == 1 else column.tolist()
+                      for column in container.columns.values()]
+        else:
+            raise ValueError(f"неизвестный вид кадра: {kind!r}")
+
+        if task not in TASK_INPUTS:
+            raise ValueError(f"неизвестное задание: {task} (доступны: 1, 3, 8)")
+        if len(inputs) != TASK_INPUTS[task]:
+            raise ValueError(f"для задания {task} нужно входов: {TASK_INPUTS[task]}, получено {len(inputs)}")
+
+        engine = request.get('engine', 'auto')
+        if engine not in ENGINES:
+            raise ValueError(f"неизвестный движок: {engine} (доступны: {', '.join(ENGINES)})")
+
+        result = run_task(task, inputs,
+                          direction=request.get('direction', 'cw'),
+                          engine=engine,
+                          sort=request.get('sort', 'auto'))
+        if hasattr(result, 'materialize'):
+            result = result.materialize()
+    except Exception as e:  # ошибка запроса не должна останавливать сервер
+        request_id = request.get('id') if isinstance(request, dict) else None
+        return _error_response(kind, request_id, e, time.perf_counter() - start)
+
+    response = {'id': request.get('id'), 'status': 'ok', 'elapsed_s': time.perf_counter() - start}
+    if kind == KIND_JSON:
+        response['result'] = _as_json(result)
+        return json.dumps(response, default=_json_scalar).encode('utf-8')
+    return _pack_binary(response, encode_container({'result': result}, task=task))
+
+
+async def read_frame(reader, max_size=MAX_FRAME_SIZE):
+    """
+    Чтение кадра из потока.
+
+    Параметры:
+    ----------
+    reader : asyncio.StreamReader
+        Поток соединения
+    max_size : int
+        Наибольший допустимый размер нагрузки
+
+    Возвращает:
+    -----------
+    tuple or None
+        (вид, нагрузка) или None, если соединение закрыто между кадрами
+
+    Исключения:
+    -----------
+    ValueError
+        Если кадр больше max_size
+    asyncio.IncompleteReadError
+        Если соединение оборвалось посреди кадра
+    """
+    try:
+        header = await reader.readexactly(FRAME.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise
+    kind, size = FRAME.unpack(header)
+    if size > max_size:
+        raise ValueError(f"кадр слишком велик: {size} байт (допустимо {max_size})")
+    return kind, await reader.readexactly(size)
+
+
+def write_frame(writer, kind, payload):
+    """Отправка кадра (без ожидания освобождения буфера)."""
+    writer.write(FRAME.pack(kind, len(payload)))
+    writer.write(payload)
+
+
+class RequestServer:
+    """
+    Сервер заданий с прогретым пулом процессов.
+
+    Атрибуты:
+    ---------
+    workers : int
+        Число процессов пула
+    inline_bytes : int
+        Нагрузка, до которой запрос выполняется в цикле событий
+    max_in_flight : int
+        Наибольшее число выполняемых запросов одного соединения
+    max_frame : int
+        Наибольший размер нагрузки кадра
+    """
+
+    def __init__(self, workers=None, inline_bytes=INLINE_BYTES, max_in_flight=MAX_IN_FLIGHT,
+                 max_frame=MAX_FRAME_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ValueError("число процессов должно быть положительным")
+        self.inline_bytes = inline_bytes
+        self.max_in_flight = max_in_flight
+        self.max_frame = max_frame
+        self._pool = None
+        self._server = None
+        self._unix = None
+        self._connections = set()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix=None):
+        """
+        Запуск пула процессов и прием подключений.
+
+        Параметры:
+        ----------
+        host, port : str, int
+            Адрес TCP (если unix не задан)
+        unix : str or None
+            Путь сокета Unix
+        """
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up)
+        # Одновременные вызовы запускают все процессы сразу, а не по первому запросу
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _ping) for _ in range(self.workers)))
+
+        if unix:
+            _remove_stale_socket(unix)
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=unix)
+            self._unix = unix
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+
+    @property
+    def addresses(self):
+        """Адреса, на которых принимаются подключения."""
+        return [sock.getsockname() for sock in self._server.sockets] if self._server else []
+
+    async def serve_forever(self):
+        """Обслуживание подключений до отмены."""
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Остановка приема подключений, открытых соединений и пула процессов."""
+        if self._server is not None:
+            self._server.close()
+            # Открытые соединения закрываются (их выполняемые запросы отменяются)
+            for task in self._connections:
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        if self._unix and os.path.exists(self._unix):
+            os.unlink(self._unix)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def _handle_connection(self, reader, writer):
+        """Обслуживание соединения: чтение кадров и параллельная обработка."""
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        limit = asyncio.Semaphore(self.max_in_flight)
+        drain_lock = asyncio.Lock()
+        pending = set()
+        try:
+            while True:
+                frame = await read_frame(reader, self.max_frame)
+                if frame is None:
+                    break
+                # При исчерпании лимита чтение приостанавливается - клиент получает обратное давление
+                await limit.acquire()
+                task = asyncio.ensure_future(self._respond(frame, writer, limit, drain_lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, asyncio.CancelledError):
+            # Оборванное соединение, некорректный кадр или остановка сервера -
+            # соединение закрывается; задача соединения завершается без ошибки
+            for task in pending:
+                task.cancel()
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+            self._connections.discard(connection)
+
+    async def _respond(self, frame, writer, limit, drain_lock):
+        """Выполнение запроса и отправка ответа."""
+        kind, payload = frame
+        try:
+            if len(payload) <= self.inline_bytes:
+                response = handle_request(kind, payload)
+            else:
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(self._pool, handle_request, kind, payload)
+        except Exception as e:  # например, аварийное завершение процесса пула
+            response = _error_response(kind, _request_id(kind, payload), e, 0.0)
+        finally:
+            limit.release()
+
+        if writer.is_closing():
+            return
+        write_frame(writer, kind, response)
+        async with drain_lock:
+            await writer.drain()
+
+
+def main(argv=None):
+    """
+    Точка входа сервера.
+
+    Параметры:
+    ----------
+    argv : list or None
+        Аргументы после "serve" (None - из sys.argv)
+
+    Возвращает:
+    -----------
+    int
+        Код завершения
+    """
+    parser = argparse.ArgumentParser(prog='main.py serve',
+                                     description="Локальный сервер заданий 1, 3 и 8")
+    parser.add_argument('--unix', default=None, help="путь сокета Unix (вместо TCP)")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="число процессов пула (по умолчанию - число ядер)")
+    parser.add_argument('--inline-bytes', type=int, default=INLINE_BYTES,
+                        help="запросы меньше этого размера выполняются без пула")
+    parser.add_argument('--max-in-flight', type=int, default=MAX_IN_FLIGHT,
+                        help="наибольшее число выполняемых запросов одного соединения")
+    args = parser.parse_args(argv)
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("число процессов должно быть положительным")
+    if args.max_in_flight < 1:
+        parser.error("--max-in-flight должно быть положительным")
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"✗ Ошибка: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+async def _serve(args):
+    """Запуск сервера до SIGINT/SIGTERM."""
+    server = RequestServer(args.workers, args.inline_bytes, args.max_in_flight)
+    await server.start(args.host, args.port, args.unix)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):  # Windows
+            pass
+
+    print(f"сервер: {', '.join(map(str, server.addresses))}, процессов: {server.workers}", flush=True)
+    try:
+        await stop.wait()
+    finally:
+        await server.close()
+
+
+def _warm_up():
+    """Инициализация процесса пула: импорт и первый вызов алгоритмов."""
+    _ping()
+
+
+def _ping():
+    """Короткий вызов каждого задания - прогрев импортов и кэшей NumPy."""
+    run_task(1, [[3, 1, 2], [1, 2, 2]])
+    run_task(3, [[[1, 2], [3, 4]]])
+    run_task(8, [[12, 5], [21, 6]])
+    return os.getpid()
+
+
+def _pack_binary(meta, container):
+    """Нагрузка двоичного кадра: длина метаданных, метаданные, контейнер."""
+    encoded = json.dumps(meta, default=_json_scalar).encode('utf-8')
+    return b''.join((_META.pack(len(encoded)), encoded, container))
+
+
+def _unpack_binary(payload):
+    """Разбор двоичного кадра: (метаданные, контейнер или None)."""
+    meta, end = _unpack_meta(payload)
+    container = decode_container(memoryview(payload)[end:]) if end < len(payload) else None
+    return meta, container
+
+
+def _unpack_meta(payload):
+    """Метаданные двоичного кадра и смещение контейнера за ними."""
+    if len(payload) < _META.size:
+        raise ValueError("двоичный кадр слишком мал")
+    size, = _META.unpack_from(payload, 0)
+    end = _META.size + size
+    if end > len(payload):
+        raise ValueError("метаданные выходят за пределы кадра")
+    meta = json.loads(bytes(payload[_META.size:end]))
+    if not isinstance(meta, dict):
+        raise ValueError("метаданные должны быть объектом JSON")
+    return meta, end
+
+
+def _error_response(kind, request_id, error, elapsed):
+    """Нагрузка ответа с ошибкой."""
+    response = {'id': request_id, 'status': 'error',
+                'error': f"{type(error).__name__}: {error}", 'elapsed_s': elapsed}
+    if kind == KIND_BINARY:
+        return _pack_binary(response, b'')
+    return json.dumps(response, default=_json_scalar).encode('utf-8')
+
+
+def _request_id(kind, payload):
+    """Идентификатор запроса для ответа с ошибкой (None, если не разобрать)."""
+    try:
+        if kind == KIND_BINARY:
+            return _unpack_meta(payload)[0].get('id')
+        return json.loads(payload).get('id')
+    except Exception:
+        return None
+
+
+def _as_json(data):
+    """Массив или матрица в виде, пригодном для json.dumps."""
+    if hasattr(data, 'materialize'):
+        data = data.materialize()
+    if hasattr(data, 'tolist'):
+        return data.tolist()
+    return data
+
+
+def _json_scalar(value):
+    """Скаляры NumPy в числа Python при записи JSON."""
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _remove_stale_socket(path):
+    """Удаление оставшегося сокета Unix от прежнего запуска."""
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,518 @@
+"""
+ЗАДАНИЕ 1: СУММА МАССИВОВ С РАЗНОЙ СОРТИРОВКОЙ
+==============================================
+
+Алгоритм:
+---------
+1. Первый массив сортируется по убыванию
+2. Второй массив сортируется по возрастанию
+3. Поэлементная сумма: если числа равны, сумма = 0
+4. Итоговый массив сортируется по возрастанию
+
+Движки выполнения:
+------------------
+- "python" - чистый Python (списки), используется для малых входов
+- "numpy"    - пакетные операции над массивами NumPy
+- "parallel" - NumPy в пуле процессов над общей памятью (для огромных
+               массивов; меньше PARALLEL_THRESHOLD - как "numpy")
+- "auto"     - выбор движка по размеру и типу входных данных
+
+NumPy - необязательная зависимость: без неё всегда используется "python".
+
+Стратегии сортировки (sort):
+----------------------------
+- "auto"       - целые из узкого диапазона сортируются подсчетом за
+                 O(n + k) (sort_integers), остальное - сравнением;
+                 почти монотонная итоговая сумма сливается по сериям
+- "counting"   - подсчет везде, где позволяет диапазон значений
+- "comparison" - всегда сортировка сравнением
+
+Параллельный движок:
+--------------------
+Массивы копируются в блоки multiprocessing.shared_memory, и процессы
+пула работают с ними напрямую - данные не сериализуются. Каждый массив
+сортируется по частям, затем части сливаются (k-way merge): выходной
+диапазон делится разделителями, выбранными по выборке из отсортированных
+частей, и каждый процесс сливает свои куски всех частей. Поэлементная
+сумма считается срезами, итоговая сортировка - так же частями со слиянием.
+
+Слияние серий в итоговой сортировке:
+------------------------------------
+Сумма a[i] + b[i] убывающего a и возрастающего b монотонна, если разброс
+одного массива заметно больше другого: тогда она состоит из немногих
+длинных серий. Порядок суммы оценивается по выборке блоков, и при малой
+доле разрывов серии сливаются устойчивой сортировкой (timsort, O(n log r)
+для r серий) вместо полной. Нули на месте равных пар серии разрывают,
+поэтому они исключаются из слияния и вставляются в готовый результат
+одним блоком.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен - работаем на чистом Python
+    np = None
+
+from src.utils.array_operations import SORT_STRATEGIES, sort_integers
+
+
+# Минимальный размер массива, начиная с которого "auto" выбирает NumPy
+NUMPY_THRESHOLD = 10_000
+
+# Допустимые движки выполнения
+ENGINES = ('auto', 'python', 'numpy', 'parallel')
+
+# Минимальный размер массива, начиная с которого "parallel" использует процессы
+PARALLEL_THRESHOLD = 1_000_000
+
+# Сумма сливается по сериям, если суммарный спуск между соседями не больше
+# 1/16 суммарного подъема (или наоборот): провалы мелкие, и слияние серий
+# в timsort почти целиком идет галопом
+_RUN_DROP_DIVISOR = 16
+
+# Выборка для оценки монотонности суммы: число блоков и их длина
+_RUN_SAMPLE_BLOCKS = 64
+_RUN_SAMPLE_LENGTH = 1024
+
+# Граница модулей значений, при которой сумма гарантированно помещается в int64
+_INT64_SAFE_LIMIT = 2 ** 62
+
+
+def sum_arrays_special(arr1, arr2, engine='auto', workers=None, sort='auto'):
+    """
+    Сумма массивов с разной сортировкой.
+
+    Параметры:
+    ----------
+    arr1 : list or numpy.ndarray
+        Первый массив (сортируется по убыванию)
+    arr2 : list or numpy.ndarray
+        Второй массив (сортируется по возрастанию)
+    engine : str
+        Движок выполнения: "auto", "python", "numpy" или "parallel"
+    workers : int or None
+        Число процессов движка "parallel" (None - по числу ядер)
+    sort : str
+        Стратегия сортировки: "auto", "counting" или "comparison"
+        (параллельный движок сортирует части сравнением)
+
+    Возвращает:
+    -----------
+    list or numpy.ndarray
+        Отсортированный по возрастанию массив сумм. Для списков на входе
+        возвращается список, для массивов NumPy - массив NumPy.
+
+    Исключения:
+    -----------
+    ValueError
+        Если массивы разной длины, указан неизвестный движок или
+        стратегия сортировки, неположительное число процессов
+    """
+    if len(arr1) != len(arr2):
+        raise ValueError(
+            f"массивы должны быть одинакового размера ({len(arr1)} != {len(arr2)})"
+        )
+    if engine not in ENGINES:
+        raise ValueError(f"неизвестный движок: {engine} (доступны: {', '.join(ENGINES)})")
+    if sort not in SORT_STRATEGIES:
+        raise ValueError(f"неизвестная стратегия сортировки: {sort} "
+                         f"(доступны: {', '.join(SORT_STRATEGIES)})")
+
+    if engine == 'python':
+        return _sum_arrays_any(arr1, arr2, sort)
+
+    if engine in ('numpy', 'parallel'):
+        if np is None:
+            raise ValueError(f"движок '{engine}' недоступен: NumPy не установлен")
+        if engine == 'parallel':
+            result = _sum_arrays_parallel(arr1, arr2, _resolve_workers(workers), sort=sort)
+        else:
+            result = _sum_arrays_numpy(arr1, arr2, sort=sort)
+        if result is None:
+            raise ValueError(f"движок '{engine}' не поддерживает эти данные")
+        return result
+
+    # engine == 'auto'
+    if np is not None and (_is_ndarray(arr1) or len(arr1) >= NUMPY_THRESHOLD):
+        result = _sum_arrays_numpy(arr1, arr2, strict_types=not _is_ndarray(arr1), sort=sort)
+        if result is not None:
+            return result
+
+    return _sum_arrays_any(arr1, arr2, sort)
+
+
+def _sum_arrays_any(arr1, arr2, sort='auto'):
+    """
+    Python-версия для входов любого вида: для массива NumPy на входе
+    результат - массив NumPy, как у векторизованной версии.
+    """
+    if not _is_ndarray(arr1):
+        return _sum_arrays_python(list(arr1), list(arr2), sort)
+    arr2 = arr2.tolist() if _is_ndarray(arr2) else list(arr2)
+    return np.asarray(_sum_arrays_python(arr1.tolist(), arr2, sort))
+
+
+def _sum_arrays_python(arr1, arr2, sort='auto'):
+    """
+    Эталонная реализация на чистом Python.
+
+    Параметры:
+    ----------
+    arr1, arr2 : list
+        Исходные массивы одинаковой длины
+    sort : str
+        Стратегия сортировки (см. sort_integers)
+
+    Возвращает:
+    -----------
+    list
+        Отсортированный по возрастанию массив сумм
+    """
+    sorted1 = sort_integers(arr1, sort, reverse=True)
+    sorted2 = sort_integers(arr2, sort)
+
+    result = [0 if a == b else a + b for a, b in zip(sorted1, sorted2)]
+    return sort_integers(result, sort)
+
+
+def _sum_arrays_numpy(arr1, arr2, strict_types=False, sort='auto'):
+    """
+    Векторизованная реализация на NumPy.
+
+    Все шаги алгоритма выполняются пакетными операциями над массивами:
+    две сортировки, сумма с маской равных элементов и итоговая сортировка.
+
+    Параметры:
+    ----------
+    arr1, arr2 : list or numpy.ndarray
+        Исходные массивы одинаковой длины
+    strict_types : bool
+        Если True, обрабатываются только целочисленные данные - так результат
+        для списков совпадает с Python-версией вплоть до типов элементов
+    sort : str
+        Стратегия сортировки (см. sort_integers)
+
+    Возвращает:
+    -----------
+    list, numpy.ndarray or None
+        Результат того же вида, что и вход, или None, если данные
+        не подходят для NumPy (смешанные типы, переполнение int64 и т.п.)
+    """
+    return_list = not _is_ndarray(arr1)
+
+    a = np.asarray(arr1)
+    b = np.asarray(arr2)
+    if a.dtype.kind not in 'iuf' or b.dtype.kind not in 'iuf':
+        return None
+    if strict_types and (a.dtype.kind == 'f' or b.dtype.kind == 'f'):
+        return None
+    # Узкие целые типы расширяются до int64, чтобы сумма не переполнялась
+    a, b = _widen_int(a), _widen_int(b)
+    if a is None or b is None:
+        return None
+
+    # 1-2. Сортировки: по убыванию - как развернутый вид отсортированной копии
+    a = sort_integers(a, sort)
+    b = sort_integers(b, sort)
+    if a.size and a.dtype.kind == 'i' and b.dtype.kind == 'i':
+        # После сортировки крайние значения известны без лишнего прохода
+        bound = max(abs(int(a[0])), abs(int(a[-1])), abs(int(b[0])), abs(int(b[-1])))
+        if bound >= _INT64_SAFE_LIMIT:
+            return None
+    a = a[::-1]
+
+    # 3. Поэлементная сумма, равные элементы дают 0
+    result = a + b
+    equal = a == b
+
+    # 4. Итоговая сортировка по возрастанию
+    direction = _run_direction(result) if sort == 'auto' else 0
+    if direction:
+        result = _merge_sum_runs(result, equal, direction)
+    else:
+        result[equal] = 0
+        # В режиме "auto" - сравнением на месте: сумма отсортированных
+        # входов с узким диапазоном состоит из длинных плато, на которых
+        # np.sort быстрее подсчета
+        if sort != 'counting' or result.dtype.kind == 'f':
+            result.sort()
+        else:
+            result = sort_integers(result, sort)
+    return result.tolist() if return_list else result
+
+
+def _run_direction(values):
+    """
+    Оценка монотонности массива по выборке блоков.
+
+    Сравниваются суммарный подъем и суммарный спуск между соседними
+    элементами: доля разрывов сама по себе не годится - пилообразная
+    последовательность с длинными плато имеет мало разрывов, но серии
+    перекрываются по значениям и сливаются дорого.
+
+    Возвращает:
+    -----------
+    int
+        1 - почти возрастает, -1 - почти убывает, 0 - слияние серий
+        не выгодно
+    """
+    n = len(values)
+    if n < 2:
+        return 0
+    if n <= _RUN_SAMPLE_BLOCKS * _RUN_SAMPLE_LENGTH:
+        steps = np.diff(values)
+    else:
+        starts = np.linspace(0, n - _RUN_SAMPLE_LENGTH, _RUN_SAMPLE_BLOCKS, dtype=np.int64)
+        steps = np.concatenate([np.diff(values[start:start + _RUN_SAMPLE_LENGTH])
+                                for start in starts.tolist()])
+    # Вещественные суммы: разности больших int64 складываются без переполнения
+    steps = steps.astype(np.float64, copy=False)
+    rise = float(steps[steps > 0].sum())
+    drop = -float(steps[steps < 0].sum())
+    if rise > 0 and drop * _RUN_DROP_DIVISOR <= rise:
+        return 1
+    if drop > 0 and rise * _RUN_DROP_DIVISOR <= drop:
+        return -1
+    return 0
+
+
+def _merge_sum_runs(sums, equal, direction):
+    """
+    Сортировка почти монотонной суммы слиянием серий.
+
+    Параметры:
+    ----------
+    sums : numpy.ndarray
+        Суммы без обнуления равных пар
+    equal : numpy.ndarray
+        Маска равных пар (их суммы заменяются нулями)
+    direction : int
+        1 - сумма почти возрастает, -1 - почти убывает
+
+    Возвращает:
+    -----------
+    numpy.ndarray
+        Отсортированный по возрастанию результат с нулями на месте равных пар
+    """
+    zeros = int(np.count_nonzero(equal))
+    values = sums[~equal] if zeros else sums
+    if direction < 0:
+        values = values[::-1]
+    # Устойчивая сортировка 64-битных чисел в NumPy - timsort: готовые
+    # серии находятся за один проход и сливаются
+    values = np.sort(values, kind='stable')
+    if not zeros:
+        return values
+
+    # Вставка нулей равных пар одним блоком
+    position = int(np.searchsorted(values, 0))
+    result = np.empty(len(sums), dtype=sums.dtype)
+    result[:position] = values[:position]
+    result[position:position + zeros] = 0
+    result[position + zeros:] = values[position:]
+    return result
+
+
+def _sum_arrays_parallel(arr1, arr2, workers, threshold=PARALLEL_THRESHOLD, sort='auto'):
+    """
+    Параллельная реализация на пуле процессов и общей памяти.
+
+    Параметры:
+    ----------
+    arr1, arr2 : list or numpy.ndarray
+        Исходные массивы одинаковой длины
+    workers : int
+        Число процессов
+    threshold : int
+        Размер, меньше которого задача решается в текущем процессе
+    sort : str
+        Стратегия сортировки для решения в текущем процессе
+
+    Возвращает:
+    -----------
+    list, numpy.ndarray or None
+        То же, что _sum_arrays_numpy
+    """
+    n = len(arr1)
+    if workers <= 1 or n < max(threshold, workers):
+        return _sum_arrays_numpy(arr1, arr2, sort=sort)
+
+    return_list = not _is_ndarray(arr1)
+    a = np.asarray(arr1)
+    b = np.asarray(arr2)
+    if a.dtype.kind not in 'iuf' or b.dtype.kind not in 'iuf':
+        return None
+    a, b = _widen_int(a), _widen_int(b)
+    if a is None or b is None:
+        return None
+    dtype = np.result_type(a, b)
+
+    # Четыре буфера: входы, сумма и буфер слияния; занятые буферы
+    # переиспользуются, как только их содержимое слито дальше
+    blocks = [shared_memory.SharedMemory(create=True, size=n * dtype.itemsize) for _ in range(4)]
+    try:
+        result = _run_parallel(blocks, a, b, dtype, workers)
+        return result.tolist() if return_list and result is not None else result
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _run_parallel(blocks, a, b, dtype, workers):
+    """
+    Шаги параллельного алгоритма над блоками общей памяти.
+
+    Возвращает копию результата (numpy.ndarray) или None при угрозе
+    переполнения int64; представления блоков не переживают вызов.
+    """
+    n = len(a)
+    specs = [(block.name, dtype.str, n) for block in blocks]
+    views = [np.ndarray((n,), dtype=dtype, buffer=block.buf) for block in blocks]
+    np.copyto(views[0], a, casting='unsafe')
+    np.copyto(views[1], b, casting='unsafe')
+    chunks = _chunk_bounds(n, workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # 1-2. Сортировки: части обоих массивов, затем слияние
+        _wait(pool.submit(_sort_chunk, spec, lo, hi)
+              for spec in specs[:2] for lo, hi in chunks)
+        _parallel_merge(pool, views[0], specs[0], specs[3], chunks, workers)  # a → [3]
+        _parallel_merge(pool, views[1], specs[1], specs[0], chunks, workers)  # b → [0]
+
+        sorted_a, sorted_b = views[3], views[0]
+        if dtype.kind == 'i':
+            bound = max(abs(int(sorted_a[0])), abs(int(sorted_a[-1])),
+                        abs(int(sorted_b[0])), abs(int(sorted_b[-1])))
+            if bound >= _INT64_SAFE_LIMIT:
+                return None
+
+        # 3. Поэлементная сумма по срезам: a по убыванию, b по возрастанию
+        _wait(pool.submit(_combine_slice, specs[3], specs[0], specs[2], lo, hi)
+              for lo, hi in chunks)
+
+        # 4. Итоговая сортировка: части суммы и слияние → [1]
+        _wait(pool.submit(_sort_chunk, specs[2], lo, hi) for lo, hi in chunks)
+        _parallel_merge(pool, views[2], specs[2], specs[1], chunks, workers)
+
+    return views[1].copy()
+
+
+def _resolve_workers(workers):
+    """Число процессов: None - по числу ядер."""
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("число процессов должно быть положительным")
+    return workers
+
+
+def _chunk_bounds(n, parts):
+    """Разбиение [0, n) на parts почти равных частей."""
+    return [(n * k // parts, n * (k + 1) // parts) for k in range(parts)]
+
+
+def _wait(futures):
+    """Ожидание задач пула с передачей исключений."""
+    for future in list(futures):
+        future.result()
+
+
+def _parallel_merge(pool, source, source_spec, target_spec, chunks, workers):
+    """
+    Слияние отсортированных частей source в target.
+
+    Разделители - квантили выборки из всех частей; для каждого выходного
+    диапазона границы в частях находятся бинарным поиском, и процесс
+    сливает свои куски независимо от остальных.
+    """
+    sample = np.concatenate([
+        source[lo:hi][np.linspace(0, hi - lo - 1, workers, dtype=np.int64)]
+        for lo, hi in chunks if hi > lo
+    ])
+    sample.sort()
+    splitters = sample[len(sample) * np.arange(1, workers) // workers]
+
+    # cuts[c] - границы диапазонов в части c (включая ее начало и конец)
+    cuts = [np.concatenate(([lo], lo + np.searchsorted(source[lo:hi], splitters), [hi]))
+            for lo, hi in chunks]
+    offset = 0
+    futures = []
+    for j in range(workers):
+        runs = [(int(c[j]), int(c[j + 1])) for c in cuts if c[j + 1] > c[j]]
+        size = sum(hi - lo for lo, hi in runs)
+        if size:
+            futures.append(pool.submit(_merge_runs, source_spec, target_spec, runs, offset))
+        offset += size
+    _wait(futures)
+
+
+class _SharedArray:
+    """Подключение процесса пула к блоку общей памяти как к массиву."""
+
+    def __init__(self, spec):
+        name, dtype, n = spec
+        self.block = shared_memory.SharedMemory(name=name)
+        self.array = np.ndarray((n,), dtype=np.dtype(dtype), buffer=self.block.buf)
+
+    def __enter__(self):
+        return self.array
+
+    def __exit__(self, *exc):
+        # Представление должно исчезнуть до закрытия блока
+        del self.array
+        self.block.close()
+
+
+def _sort_chunk(spec, lo, hi):
+    """Сортировка части массива на месте (в процессе пула)."""
+    with _SharedArray(spec) as data:
+        data[lo:hi].sort()
+
+
+def _merge_runs(source_spec, target_spec, runs, offset):
+    """
+    Слияние отсортированных кусков source в target[offset:] (в процессе пула).
+
+    Куски записываются подряд и сортируются устойчивой сортировкой -
+    для 64-битных типов это timsort, который сливает готовые серии.
+    """
+    with _SharedArray(source_spec) as source, _SharedArray(target_spec) as target:
+        pos = offset
+        for lo, hi in runs:
+            target[pos:pos + hi - lo] = source[lo:hi]
+            pos += hi - lo
+        target[offset:pos].sort(kind='stable')
+
+
+def _combine_slice(a_spec, b_spec, out_spec, lo, hi):
+    """Сумма среза: a по убыванию + b по возрастанию, равные дают 0."""
+    with _SharedArray(a_spec) as a, _SharedArray(b_spec) as b, _SharedArray(out_spec) as out:
+        n = len(a)
+        left = a[n - hi:n - lo][::-1]
+        right = b[lo:hi]
+        target = out[lo:hi]
+        np.add(left, right, out=target)
+        target[left == right] = 0
+
+
+def _widen_int(arr):
+    """
+    Приведение целочисленного массива к int64.
+
+    Возвращает None для uint64, значения которого могут не поместиться в int64.
+    Вещественные массивы возвращаются без изменений.
+    """
+    if arr.dtype.kind not in 'iu':
+        return arr
+    if arr.dtype == np.uint64:
+        return None
+    return arr.astype(np.int64, copy=False)
+
+
+def _is_ndarray(obj):
+    """Проверка, является ли объект массивом NumPy."""
+    return np is not None and isinstance(obj, np.ndarray)
@@ -0,0 +1,666 @@
+"""
+ЗАДАНИЕ 3: ПОВОРОТ МАТРИЦЫ НА 90 ГРАДУСОВ
+=========================================
+
+Поворот матрицы N×M по часовой или против часовой стрелки.
+Результат имеет размер M×N.
+
+Режимы результата:
+------------------
+- копия (по умолчанию) - новая матрица (список списков или массив NumPy)
+- представление (view=True) - поворот без копирования данных:
+  для массивов NumPy - шаговое (strided) представление np.rot90 (транспонирование
+  и разворот оси), для списков - обертка RotatedMatrix, пересчитывающая
+  индексы при обращении. Копия создается только по запросу (materialize).
+- на месте (inplace=True) - только для квадратных матриц N×N: поворот
+  четверными обменами по блокам, без второй матрицы N×N. Размер блока
+  подбирается так, чтобы четыре обмениваемых блока помещались в кэш L2.
+- отложенный (matrix - RotationPlan) - повороты только записываются,
+  сводятся по модулю 4 и выполняются одним проходом при materialize();
+  поворот на 180° выполняется отражением без транспонирования.
+- файл (matrix - путь к .npy или двоичному файлу) - потоковый поворот
+  матриц больше оперативной памяти: блоки читаются через numpy.memmap
+  и записываются в выходной memmap, пиковая память ограничена tile_bytes.
+"""
+
+import copy
+import os
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен - работаем на чистом Python
+    np = None
+
+
+# Размер кэша, под который подбираются блоки поворота на месте (байт)
+L2_CACHE_BYTES = 1024 * 1024
+
+# Границы размера блока (элементов по стороне)
+_MIN_BLOCK_SIZE = 16
+_MAX_BLOCK_SIZE = 512
+
+# Бюджет памяти на один блок при потоковом повороте файла (байт)
+DEFAULT_TILE_BYTES = 64 * 1024 * 1024
+
+
+class RotatedMatrix:
+    """
+    Повернутая матрица без копирования данных.
+
+    Хранит ссылку на исходную матрицу и число поворотов на 90° по часовой
+    стрелке; элементы и строки вычисляются пересчетом индексов.
+
+    Атрибуты:
+    ---------
+    base : list
+        Исходная матрица (список строк одинаковой длины)
+    turns : int
+        Число поворотов по часовой стрелке (0-3)
+    shape : tuple
+        Размер повернутой матрицы (строки, столбцы)
+
+    Методы:
+    -------
+    get(i, j)
+        Элемент повернутой матрицы
+    materialize()
+        Копия повернутой матрицы в виде списка списков
+    """
+
+    def __init__(self, base, turns=1):
+        """
+        Инициализация представления.
+
+        Параметры:
+        ----------
+        base : list or RotatedMatrix
+            Исходная матрица. Для RotatedMatrix повороты складываются,
+            чтобы не создавать цепочку вложенных представлений.
+        turns : int
+            Число поворотов по часовой стрелке (отрицательное - против)
+        """
+        if isinstance(base, RotatedMatrix):
+            turns += base.turns
+            base = base.base
+        _validate_matrix(base)
+
+        self.base = base
+        self.turns = turns % 4
+        self._rows = len(base)
+        self._cols = len(base[0])
+
+    @property
+    def shape(self):
+        """Размер повернутой матрицы (строки, столбцы)."""
+        if self.turns % 2:
+            return self._cols, self._rows
+        return self._rows, self._cols
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        """
+        Строка повернутой матрицы (создается при обращении).
+
+        Параметры:
+        ----------
+        i : int
+            Номер строки (допускаются отрицательные индексы)
+
+        Возвращает:
+        -----------
+        list
+            Элементы строки
+        """
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("индекс строки вне диапазона")
+
+        base, rows, cols = self.base, self._rows, self._cols
+        if self.turns == 0:
+            return list(base[i])
+        if self.turns == 1:
+            return [base[r][i] for r in range(rows - 1, -1, -1)]
+        if self.turns == 2:
+            return list(reversed(base[rows - 1 - i]))
+        return [base[r][cols - 1 - i] for r in range(rows)]
+
+    def get(self, i, j):
+        """
+        Элемент повернутой матрицы.
+
+        Параметры:
+        ----------
+        i, j : int
+            Строка и столбец в повернутой матрице (без отрицательных
+            индексов)
+
+        Возвращает:
+        -----------
+        any
+            Элемент исходной матрицы, оказавшийся на позиции (i, j)
+
+        Исключения:
+        -----------
+        IndexError
+            Если позиция вне повернутой матрицы
+        """
+        n_rows, n_cols = self.shape
+        if not (0 <= i < n_rows and 0 <= j < n_cols):
+            raise IndexError(f"позиция ({i}, {j}) вне матрицы {n_rows}×{n_cols}")
+
+        rows, cols = self._rows, self._cols
+        if self.turns == 0:
+            return self.base[i][j]
+        if self.turns == 1:
+            return self.base[rows - 1 - j][i]
+        if self.turns == 2:
+            return self.base[rows - 1 - i][cols - 1 - j]
+        return self.base[j][cols - 1 - i]
+
+    def materialize(self):
+        """
+        Копия повернутой матрицы.
+
+        Возвращает:
+        -----------
+        list
+            Новая матрица (список списков)
+        """
+        return _materialize_list(self.base, self.turns)
+
+    def __repr__(self):
+        return f"RotatedMatrix(shape={self.shape}, turns={self.turns})"
+
+
+class RotationPlan:
+    """
+    Отложенная последовательность поворотов.
+
+    Повороты не выполняются сразу, а накапливаются в сумме по модулю 4;
+    итоговый поворот на k × 90° выполняется одним проходом: N поворотов
+    стоят как один, а запись каждого из них - O(1).
+
+    План неизменяемый: каждый поворот возвращает новый план, поэтому его
+    можно передавать в rotate_clockwise/rotate_counterclockwise.
+
+    Атрибуты:
+    ---------
+    matrix : list or numpy.ndarray
+        Исходная матрица
+    turns : int
+        Итоговое число поворотов по часовой стрелке (0-3)
+
+    Методы:
+    -------
+    clockwise(), counterclockwise(), rotate(turns)
+        Новый план с добавленным поворотом
+    view()
+        Итоговый поворот без копирования данных
+    materialize()
+        Итоговый поворот одним проходом
+    """
+
+    def __init__(self, matrix, turns=0):
+        """
+        Инициализация плана.
+
+        Параметры:
+        ----------
+        matrix : list or numpy.ndarray
+            Исходная матрица
+        turns : int
+            Уже записанные повороты по часовой стрелке
+        """
+        if not (np is not None and isinstance(matrix, np.ndarray)):
+            _validate_matrix(matrix)
+        self.matrix = matrix
+        self._turns = turns % 4
+
+    @property
+    def turns(self):
+        """Итоговое число поворотов по часовой стрелке (0-3)."""
+        return self._turns
+
+    def rotate(self, turns):
+        """Новый план с поворотом на turns × 90° по часовой стрелке."""
+        # Копия без повторной проверки матрицы: запись поворота - O(1)
+        plan = copy.copy(self)
+        plan._turns = (self._turns + turns) % 4
+        return plan
+
+    def clockwise(self):
+        """Новый план с поворотом по часовой стрелке."""
+        return self.rotate(1)
+
+    def counterclockwise(self):
+        """Новый план с поворотом против часовой стрелки."""
+        return self.rotate(-1)
+
+    def view(self):
+        """
+        Итоговый поворот без копирования данных.
+
+        Возвращает:
+        -----------
+        numpy.ndarray or RotatedMatrix
+            Представление повернутой матрицы
+        """
+        return _rotate(self.matrix, self.turns, view=True)
+
+    def materialize(self):
+        """
+        Итоговый поворот одним проходом по данным.
+
+        Возвращает:
+        -----------
+        list or numpy.ndarray
+            Новая повернутая матрица
+        """
+        if np is not None and isinstance(self.matrix, np.ndarray):
+            # k = 2 в np.rot90 - отражение по обеим осям, без транспонирования
+            return np.rot90(self.matrix, -self.turns).copy()
+        return _materialize_list(self.matrix, self.turns)
+
+    def __repr__(self):
+        return f"RotationPlan(turns={self.turns})"
+
+
+def rotate_clockwise(matrix, view=False, inplace=False, block_size=None, **file_options):
+    """
+    Поворот матрицы на 90 градусов по часовой стрелке.
+
+    Параметры:
+    ----------
+    matrix : list, numpy.ndarray, RotationPlan or str
+        Исходная матрица N×M, отложенный план (поворот добавляется в план
+        без вычислений) или путь к файлу с матрицей (см. rotate_file)
+    view : bool
+        Вернуть представление без копирования данных (по умолчанию False)
+    inplace : bool
+        Повернуть квадратную матрицу на месте (по умолчанию False)
+    block_size : int or None
+        Сторона блока для поворота на месте (None - подбор под кэш)
+    **file_options
+        Параметры rotate_file для пути к файлу: output, shape, dtype,
+        tile_bytes
+
+    Возвращает:
+    -----------
+    list, numpy.ndarray, RotatedMatrix or RotationPlan
+        Повернутая матрица M×N (при inplace=True - сама matrix,
+        для плана - новый план, для файла - numpy.memmap выходного файла)
+
+    Исключения:
+    -----------
+    ValueError
+        Если матрица пустая, строки разной длины, или для поворота
+        на месте передана неквадратная матрица
+    """
+    return _rotate(matrix, 1, view, inplace, block_size, file_options)
+
+
+def rotate_counterclockwise(matrix, view=False, inplace=False, block_size=None, **file_options):
+    """
+    Поворот матрицы на 90 градусов против часовой стрелки.
+
+    Параметры:
+    ----------
+    matrix : list, numpy.ndarray, RotationPlan or str
+        Исходная матрица N×M, отложенный план (поворот добавляется в план
+        без вычислений) или путь к файлу с матрицей (см. rotate_file)
+    view : bool
+        Вернуть представление без копирования данных (по умолчанию False)
+    inplace : bool
+        Повернуть квадратную матрицу на месте (по умолчанию False)
+    block_size : int or None
+        Сторона блока для поворота на месте (None - подбор под кэш)
+    **file_options
+        Параметры rotate_file для пути к файлу: output, shape, dtype,
+        tile_bytes
+
+    Возвращает:
+    -----------
+    list, numpy.ndarray, RotatedMatrix or RotationPlan
+        Повернутая матрица M×N (при inplace=True - сама matrix,
+        для плана - новый план, для файла - numpy.memmap выходного файла)
+
+    Исключения:
+    -----------
+    ValueError
+        Если матрица пустая, строки разной длины, или для поворота
+        на месте передана неквадратная матрица
+    """
+    return _rotate(matrix, -1, view, inplace, block_size, file_options)
+
+
+def materialize(matrix):
+    """
+    Копия матрицы из представления.
+
+    Параметры:
+    ----------
+    matrix : list, numpy.ndarray or RotatedMatrix
+        Результат поворота
+
+    Возвращает:
+    -----------
+    list or numpy.ndarray
+        Самостоятельная копия данных
+    """
+    if isinstance(matrix, RotatedMatrix):
+        return matrix.materialize()
+    if np is not None and isinstance(matrix, np.ndarray):
+        return matrix.copy()
+    return [list(row) for row in matrix]
+
+
+def rotate_square_inplace(matrix, turns=1, block_size=None):
+    """
+    Поворот квадратной матрицы на месте блочными четверными обменами.
+
+    Каждый элемент (i, j) из левой верхней четверти вместе с тремя
+    элементами своей орбиты (j, N-1-i), (N-1-i, N-1-j), (N-1-j, i)
+    циклически сдвигается за один обмен. Четверть обходится блоками
+    block_size × block_size: для массивов NumPy каждый обмен блоков -
+    четыре векторных присваивания через представления, и все четыре блока
+    остаются в кэше, пока идут транспонированные чтения.
+
+    Параметры:
+    ----------
+    matrix : list or numpy.ndarray
+        Квадратная матрица N×N (изменяется)
+    turns : int
+        1 - по часовой стрелке, -1 - против часовой
+    block_size : int or None
+        Сторона блока (None - подбор под L2_CACHE_BYTES)
+
+    Возвращает:
+    -----------
+    list or numpy.ndarray
+        Та же матрица matrix
+
+    Исключения:
+    -----------
+    ValueError
+        Если матрица не квадратная или turns не равно ±1 по модулю 4
+    """
+    clockwise = _is_clockwise(turns)
+    is_array = np is not None and isinstance(matrix, np.ndarray)
+    if is_array:
+        if matrix.ndim != 2 or matrix.size == 0:
+            raise ValueError("ожидается непустая двумерная матрица")
+        if not matrix.flags.writeable:
+            raise ValueError("матрица доступна только для чтения")
+        n, cols = matrix.shape
+        itemsize = matrix.itemsize
+    else:
+        _validate_matrix(matrix)
+        n, cols = len(matrix), len(matrix[0])
+        itemsize = 8
+    if n != cols:
+        raise ValueError(f"поворот на месте возможен только для квадратной матрицы ({n}x{cols})")
+
+    if block_size is None:
+        block_size = cache_block_size(itemsize)
+    if block_size <= 0:
+        raise ValueError("размер блока должен быть положительным")
+
+    swap = _swap_blocks_numpy if is_array else _swap_blocks_python
+
+    # Левая верхняя четверть: строки [0, N//2), столбцы [0, (N+1)//2).
+    # Орбиты ее элементов покрывают матрицу ровно один раз (центр нечетной
+    # матрицы остается на месте)
+    half_rows, half_cols = n // 2, (n + 1) // 2
+    for i0 in range(0, half_rows, block_size):
+        i1 = min(i0 + block_size, half_rows)
+        for j0 in range(0, half_cols, block_size):
+            j1 = min(j0 + block_size, half_cols)
+            swap(matrix, n, i0, i1, j0, j1, clockwise)
+
+    return matrix
+
+
+def cache_block_size(itemsize, cache_bytes=None):
+    """
+    Сторона блока для поворота на месте.
+
+    Подбирается наибольшая степень двойки b, при которой четыре блока b×b
+    помещаются в кэш: 4 · b² · itemsize <= cache_bytes.
+
+    Параметры:
+    ----------
+    itemsize : int
+        Размер элемента в байтах
+    cache_bytes : int or None
+        Объем кэша (None - L2_CACHE_BYTES)
+
+    Возвращает:
+    -----------
+    int
+        Сторона блока в элементах
+    """
+    if cache_bytes is None:
+        cache_bytes = L2_CACHE_BYTES
+    block = _MIN_BLOCK_SIZE
+    while block * 2 <= _MAX_BLOCK_SIZE and 4 * (block * 2) ** 2 * itemsize <= cache_bytes:
+        block *= 2
+    return block
+
+
+def _swap_blocks_numpy(m, n, i0, i1, j0, j1, clockwise):
+    """
+    Четверной обмен блока [i0:i1, j0:j1] с его орбитой (NumPy).
+
+    Все четыре блока - представления с индексами [a, b] для
+    i = i0 + a, j = j0 + b, поэтому обмен - это присваивания целых блоков.
+    """
+    top_left = m[i0:i1, j0:j1]                                   # (i, j)
+    bottom_left = m[n - j1:n - j0, i0:i1][::-1, :].T             # (N-1-j, i)
+    bottom_right = m[n - i1:n - i0, n - j1:n - j0][::-1, ::-1]   # (N-1-i, N-1-j)
+    top_right = m[j0:j1, n - i1:n - i0][:, ::-1].T               # (j, N-1-i)
+
+    saved = top_left.copy()
+    if clockwise:
+        top_left[...] = bottom_left
+        bottom_left[...] = bottom_right
+        bottom_right[...] = top_right
+        top_right[...] = saved
+    else:
+        top_left[...] = top_right
+        top_right[...] = bottom_right
+        bottom_right[...] = bottom_left
+        bottom_left[...] = saved
+
+
+def _swap_blocks_python(m, n, i0, i1, j0, j1, clockwise):
+    """
+    Четверной обмен блока [i0:i1, j0:j1] с его орбитой (списки).
+    """
+    last = n - 1
+    for i in range(i0, i1):
+        for j in range(j0, j1):
+            if clockwise:
+                (m[i][j], m[last - j][i], m[last - i][last - j], m[j][last - i]) = (
+                    m[last - j][i], m[last - i][last - j], m[j][last - i], m[i][j])
+            else:
+                (m[i][j], m[j][last - i], m[last - i][last - j], m[last - j][i]) = (
+                    m[j][last - i], m[last - i][last - j], m[last - j][i], m[i][j])
+
+
+def rotate_file(path, turns=1, output=None, shape=None, dtype=None, tile_bytes=None):
+    """
+    Потоковый поворот матрицы, хранящейся в файле.
+
+    Исходная и выходная матрицы открываются через numpy.memmap; поворот
+    идет блоками t×t, где t подобрано так, чтобы блок и его повернутая
+    копия укладывались в tile_bytes. Полосы блоков сбрасываются на диск
+    по мере записи, так что в памяти одновременно находится не больше
+    одного блока.
+
+    Параметры:
+    ----------
+    path : str or os.PathLike
+        Файл .npy или двоичный файл с матрицей по строкам
+    turns : int
+        1 - по часовой стрелке, -1 - против часовой
+    output : str, os.PathLike or None
+        Выходной файл (None - рядом с исходным, с суффиксом _rotated).
+        Для .npy на входе пишется .npy, иначе - двоичный файл по строкам
+    shape : tuple or None
+        Размер (строки, столбцы) двоичного файла (для .npy не нужен)
+    dtype : str, numpy.dtype or None
+        Тип элементов двоичного файла (для .npy не нужен)
+    tile_bytes : int or None
+        Бюджет памяти на блок (None - DEFAULT_TILE_BYTES)
+
+    Возвращает:
+    -----------
+    numpy.memmap
+        Повернутая матрица M×N, открытая только для чтения
+
+    Исключения:
+    -----------
+    ValueError
+        Если NumPy не установлен, turns не равно ±1 по модулю 4, для
+        двоичного файла не задан размер или тип, либо файл не совпадает
+        с заданным размером
+    """
+    if np is None:
+        raise ValueError("поворот файла требует NumPy")
+    clockwise = _is_clockwise(turns)
+
+    path = os.fspath(path)
+    is_npy = path.endswith('.npy')
+    if is_npy:
+        source = np.load(path, mmap_mode='r')
+        if source.ndim != 2:
+            raise ValueError(f"ожидается двумерная матрица, получено измерений: {source.ndim}")
+    else:
+        if shape is None or dtype is None:
+            raise ValueError("для двоичного файла нужно указать shape и dtype")
+        dtype = np.dtype(dtype)
+        expected = shape[0] * shape[1] * dtype.itemsize
+        if os.path.getsize(path) != expected:
+            raise ValueError(f"размер файла не соответствует матрице {shape[0]}x{shape[1]} {dtype}")
+        source = np.memmap(path, dtype=dtype, mode='r', shape=tuple(shape))
+
+    rows, cols = source.shape
+    if rows == 0 or cols == 0:
+        raise ValueError("матрица не должна быть пустой")
+
+    if output is None:
+        stem, ext = os.path.splitext(path)
+        output = f"{stem}_rotated{ext}"
+    output = os.fspath(output)
+    if os.path.abspath(output) == os.path.abspath(path):
+        raise ValueError("выходной файл должен отличаться от исходного")
+
+    out_shape = (cols, rows)
+    if is_npy:
+        target = np.lib.format.open_memmap(output, mode='w+', dtype=source.dtype, shape=out_shape)
+    else:
+        target = np.memmap(output, dtype=source.dtype, mode='w+', shape=out_shape)
+
+    tile = _tile_size(source.itemsize, tile_bytes)
+
+    for r0 in range(0, rows, tile):
+        r1 = min(r0 + tile, rows)
+        for c0 in range(0, cols, tile):
+            c1 = min(c0 + tile, cols)
+            block = np.array(source[r0:r1, c0:c1])
+            if clockwise:
+                # in[r][c] → out[c][rows-1-r]
+                target[c0:c1, rows - r1:rows - r0] = np.rot90(block, -1)
+            else:
+                # in[r][c] → out[cols-1-c][r]
+                target[cols - c1:cols - c0, r0:r1] = np.rot90(block, 1)
+            del block
+        # Полоса блоков записана - сбрасываем грязные страницы на диск
+        target.flush()
+
+    del target, source
+    if is_npy:
+        return np.load(output, mmap_mode='r')
+    return np.memmap(output, dtype=np.dtype(dtype), mode='r', shape=out_shape)
+
+
+def _is_clockwise(turns):
+    """Направление четверти оборота: True для 1 (mod 4), False для 3 (mod 4)."""
+    if turns % 4 not in (1, 3):
+        raise ValueError(f"поддерживается только поворот на ±90° (turns = ±1), получено turns={turns}")
+    return turns % 4 == 1
+
+
+def _tile_size(itemsize, tile_bytes=None):
+    """Сторона блока t, при которой блок и его копия занимают не больше tile_bytes."""
+    if tile_bytes is None:
+        tile_bytes = DEFAULT_TILE_BYTES
+    if tile_bytes < 2 * itemsize:
+        raise ValueError("бюджет памяти на блок слишком мал")
+    return max(1, int((tile_bytes / (2 * itemsize)) ** 0.5))
+
+
+def _rotate(matrix, turns, view, inplace=False, block_size=None, file_options=None):
+    """
+    Общая реализация поворота на turns × 90° по часовой стрелке.
+    """
+    if isinstance(matrix, (str, os.PathLike)):
+        if view or inplace:
+            raise ValueError("для файла режимы view и inplace не поддерживаются")
+        return rotate_file(matrix, turns, **(file_options or {}))
+    if file_options:
+        raise ValueError(f"параметры {', '.join(file_options)} допустимы только для файла")
+    if isinstance(matrix, RotationPlan):
+        if view or inplace:
+            raise ValueError("для отложенного плана режимы view и inplace не поддерживаются")
+        return matrix.rotate(turns)
+
+    if inplace:
+        if view:
+            raise ValueError("режимы view и inplace несовместимы")
+        return rotate_square_inplace(matrix, turns, block_size)
+
+    if np is not None and isinstance(matrix, np.ndarray):
+        if matrix.ndim != 2 or matrix.size == 0:
+            raise ValueError("ожидается непустая двумерная матрица")
+        # np.rot90 поворачивает против часовой стрелки и возвращает представление
+        rotated = np.rot90(matrix, -turns)
+        return rotated if view else rotated.copy()
+
+    rotated = RotatedMatrix(matrix, turns)
+    return rotated if view else rotated.materialize()
+
+
+def _materialize_list(base, turns):
+    """
+    Повернутая копия матрицы-списка одним проходом.
+
+    Поворот на 180° - отражение строк и их порядка, без транспонирования;
+    повороты на 90° - одно транспонирование через zip.
+    """
+    turns %= 4
+    if turns == 0:
+        return [list(row) for row in base]
+    if turns == 1:
+        return [list(column) for column in zip(*reversed(base))]
+    if turns == 2:
+        return [row[::-1] if isinstance(row, list) else list(reversed(row))
+                for row in reversed(base)]
+    return [list(column) for column in zip(*base)][::-1]
+
+
+def _validate_matrix(matrix):
+    """Проверка, что матрица непустая и прямоугольная."""
+    if not matrix or not len(matrix[0]):
+        raise ValueError("матрица не должна быть пустой")
+    cols = len(matrix[0])
+    if any(len(row) != cols for row in matrix):
+        raise ValueError("все строки матрицы должны быть одинаковой длины")
@@ -0,0 +1,748 @@
+"""
+ЗАДАНИЕ 8: ПОИСК ОБЩИХ ЧИСЕЛ С ПЕРЕВЕРНУТЫМИ ВЕРСИЯМИ
+=====================================================
+
+Число из первого массива считается общим, если:
+1. Оно само встречается во втором массиве (прямое совпадение)
+2. Во втором массиве есть его перевернутая версия (123 → 321, 120 → 21)
+
+Переворачиваются только целые неотрицательные числа.
+
+Сложность:
+----------
+O(n + m): второй массив индексируется множеством, а таблица перевернутых
+чисел строится один раз для различных значений первого массива.
+
+Движки выполнения:
+------------------
+- "python" - множества и словари Python
+- "numpy"  - np.unique / np.isin над целочисленными массивами
+- "auto"   - NumPy для больших целочисленных входов, иначе Python
+
+Для пополняемых массивов - CommonNumbersIndex: общие числа обновляются
+при каждом добавлении или удалении за O(1) амортизированно.
+
+Для входов больше памяти - find_common_numbers_external: разбиение по
+хешу в файлы на диске, соединение по разделам и потоковая запись.
+"""
+
+import itertools
+import math
+import numbers
+import os
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен - работаем на чистом Python
+    np = None
+
+from src.utils.array_operations import reverse_digits, reverse_number
+from src.utils.binary_format import EXTENSION, read_container
+from src.utils.input_operations import iter_numbers
+
+
+# Минимальный размер массивов, начиная с которого используется NumPy
+NUMPY_THRESHOLD = 10_000
+
+# Допустимые движки выполнения
+ENGINES = ('auto', 'python', 'numpy')
+
+# Бюджет памяти внешнего режима по умолчанию и наименьший допустимый (байт)
+EXTERNAL_MEMORY_BUDGET = 256 * 1024 * 1024
+_MIN_EXTERNAL_BUDGET = 1024 * 1024
+
+# Наибольшее число разделов внешнего режима (все файлы разделов открыты одновременно)
+_MAX_PARTITIONS = 256
+
+# Память на элемент блока при разбиении и на число второго массива при соединении (байт)
+_BYTES_PER_BLOCK_ITEM = 192
+_JOIN_BYTES_PER_ITEM = 32
+
+# Записи файлов разделов: ключ раздела, число, позиция в первом массиве
+_LEFT_RECORD = np.dtype([('probe', '<i8'), ('value', '<i8'), ('pos', '<i8')]) if np else None
+_RUN_RECORD = np.dtype([('pos', '<i8'), ('value', '<i8')]) if np else None
+
+# Множитель хеша Фибоначчи для разбиения
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15) if np else None
+
+_INT64_MAX = 2 ** 63 - 1
+
+# Числа от этой границы переворачиваются поэлементно (перевернутые могут не поместиться в int64)
+_REVERSE_LIMIT = 10 ** 18
+
+
+def is_reversible(num):
+    """
+    Проверка, можно ли перевернуть число.
+
+    Параметры:
+    ----------
+    num : any
+        Проверяемое значение
+
+    Возвращает:
+    -----------
+    bool
+        True для целых неотрицательных чисел (bool не считается числом)
+    """
+    return isinstance(num, numbers.Integral) and not isinstance(num, bool) and num >= 0
+
+
+def build_reversal_table(values):
+    """
+    Таблица перевернутых версий для различных значений массива.
+
+    Все подходящие значения переворачиваются одним вызовом векторизованного
+    ядра reverse_digits, без строковых преобразований.
+
+    Параметры:
+    ----------
+    values : iterable
+        Значения (каждое переворачивается один раз, даже при повторах)
+
+    Возвращает:
+    -----------
+    dict
+        Отображение число → перевернутое число (или None). Порядок ключей
+        соответствует порядку первого появления значений.
+    """
+    table = dict.fromkeys(values)
+    reversible = [num for num in table if is_reversible(num)]
+    reversed_values = reverse_digits(reversible)
+    if np is not None:
+        reversed_values = reversed_values.tolist()
+    table.update(zip(reversible, reversed_values))
+    return table
+
+
+def classify_common_numbers(arr1, arr2, engine='auto'):
+    """
+    Поиск общих чисел с классификацией типа совпадения.
+
+    Параметры:
+    ----------
+    arr1 : list
+        Первый массив (источник общих чисел)
+    arr2 : list
+        Второй массив (в нем ищутся числа и их перевернутые версии)
+    engine : str
+        Движок выполнения: "auto", "python" или "numpy"
+
+    Возвращает:
+    -----------
+    tuple
+        (common, direct_matches, reversed_matches), где
+        common - общие числа в порядке первого появления в arr1,
+        direct_matches - числа, найденные во втором массиве напрямую,
+        reversed_matches - пары (число, перевернутое число) для совпадений
+        только по перевернутой версии
+
+    Исключения:
+    -----------
+    ValueError
+        Если указан неизвестный движок или движок "numpy" недоступен
+        для этих данных
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"неизвестный движок: {engine} (доступны: {', '.join(ENGINES)})")
+
+    if engine == 'numpy':
+        if np is None:
+            raise ValueError("движок 'numpy' недоступен: NumPy не установлен")
+        result = _classify_numpy(arr1, arr2)
+        if result is None:
+            raise ValueError("движок 'numpy' не поддерживает эти данные")
+        return result
+
+    if engine == 'auto' and np is not None and min(len(arr1), len(arr2)) >= NUMPY_THRESHOLD:
+        result = _classify_numpy(arr1, arr2)
+        if result is not None:
+            return result
+
+    index2 = set(arr2)
+    reversal_table = build_reversal_table(arr1)
+
+    common = []
+    direct_matches = []
+    reversed_matches = []
+
+    for num, reversed_num in reversal_table.items():
+        if num in index2:
+            common.append(num)
+            direct_matches.append(num)
+        elif reversed_num is not None and reversed_num in index2:
+            common.append(num)
+            reversed_matches.append((num, reversed_num))
+
+    return common, direct_matches, reversed_matches
+
+
+def _classify_numpy(arr1, arr2):
+    """
+    Векторизованная классификация для целочисленных массивов.
+
+    Различные значения arr1 берутся в порядке первого появления,
+    переворачиваются ядром reverse_digits и ищутся в arr2 через np.isin.
+
+    Возвращает:
+    -----------
+    tuple or None
+        То же, что classify_common_numbers (списки чисел Python),
+        или None, если массивы не целочисленные или числа слишком велики
+    """
+    if len(arr1) == 0 or len(arr2) == 0:
+        # np.asarray([]) дает float64 - пустой вход обрабатывается отдельно
+        return [], [], []
+    a = np.asarray(arr1)
+    b = np.asarray(arr2)
+    if a.dtype.kind not in 'iu' or b.dtype.kind not in 'iu':
+        return None
+    if a.size and int(a.max()) >= 10 ** 18:
+        # Перевернутые версии могут не поместиться в int64
+        return None
+
+    # Различные значения в порядке первого появления
+    unique, first_index = np.unique(a, return_index=True)
+    keys = unique[np.argsort(first_index, kind='stable')]
+
+    direct = np.isin(keys, b)
+
+    reversible = keys >= 0
+    reversed_keys = np.full(keys.shape, -1, dtype=np.int64)
+    reversed_keys[reversible] = reverse_digits(keys[reversible])
+    by_reversal = ~direct & reversible & np.isin(reversed_keys, b)
+
+    common = keys[direct | by_reversal].tolist()
+    direct_matches = keys[direct].tolist()
+    reversed_matches = list(zip(keys[by_reversal].tolist(),
+                                reversed_keys[by_reversal].tolist()))
+    return common, direct_matches, reversed_matches
+
+
+def find_common_numbers(arr1, arr2, engine='auto'):
+    """
+    Поиск общих чисел с учетом перевернутых версий.
+
+    Параметры:
+    ----------
+    arr1 : list
+        Первый массив
+    arr2 : list
+        Второй массив
+    engine : str
+        Движок выполнения: "auto", "python" или "numpy"
+
+    Возвращает:
+    -----------
+    list
+        Общие числа без повторов в порядке первого появления в arr1
+    """
+    common, _, _ = classify_common_numbers(arr1, arr2, engine=engine)
+    return common
+
+
+class CommonNumbersIndex:
+    """
+    Инкрементальный индекс общих чисел для пополняемых массивов.
+
+    Хранит оба массива как мультимножества и поддерживает множество общих
+    чисел (прямых совпадений и совпадений по перевернутой версии) при
+    каждом добавлении и удалении, без повторного поиска по всем данным.
+
+    Сложность:
+    ----------
+    Добавление и удаление - O(1) амортизированно: число переворачивается
+    один раз при первом появлении, а изменение второго массива затрагивает
+    само число и те числа первого массива, чья перевернутая версия с ним
+    совпадает (их не больше числа разрядов: 21 ← 12, 120, 1200, ...).
+    Проверка числа и число общих - O(1), список общих в порядке первого
+    добавления - O(k log k) для k общих чисел.
+
+    Пример:
+    -------
+    index = CommonNumbersIndex([12, 5], [7])
+    index.add_right(21)
+    index.common()          # [12]
+    index.remove(21, side='right')
+    12 in index             # False
+    """
+
+    def __init__(self, arr1=(), arr2=()):
+        """
+        Создание индекса.
+
+        Параметры:
+        ----------
+        arr1 : iterable
+            Начальные числа первого массива
+        arr2 : iterable
+            Начальные числа второго массива
+        """
+        self._left = {}          # число первого массива → кратность
+        self._order = {}         # число первого массива → номер первого добавления
+        self._right = {}         # число второго массива → кратность
+        self._reversal = {}      # число первого массива → перевернутое (или None)
+        self._sources = {}       # перевернутое число → числа первого массива
+        self._common = {}        # общее число → перевернутое (None - прямое совпадение)
+        self._tickets = itertools.count()
+        self.extend_left(arr1)
+        self.extend_right(arr2)
+
+    def add_left(self, num):
+        """Добавление числа в первый массив."""
+        count = self._left.get(num)
+        if count:
+            self._left[num] = count + 1
+            return
+        self._left[num] = 1
+        self._order[num] = next(self._tickets)
+        self._register(num, reverse_number(num) if is_reversible(num) else None)
+
+    def add_right(self, num):
+        """Добавление числа во второй массив."""
+        count = self._right.get(num, 0)
+        self._right[num] = count + 1
+        if not count:
+            self._touch(num)
+
+    def extend_left(self, values):
+        """
+        Добавление многих чисел в первый массив.
+
+        Новые различные значения переворачиваются одним векторизованным
+        вызовом (build_reversal_table).
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+        new = []
+        for num in values:
+            count = self._left.get(num)
+            if count:
+                self._left[num] = count + 1
+            else:
+                self._left[num] = 1
+                self._order[num] = next(self._tickets)
+                new.append(num)
+        for num, reversed_num in build_reversal_table(new).items():
+            self._register(num, reversed_num)
+
+    def extend_right(self, values):
+        """Добавление многих чисел во второй массив."""
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+        for num in values:
+            self.add_right(num)
+
+    def remove(self, num, side='left'):
+        """
+        Удаление одного вхождения числа.
+
+        Параметры:
+        ----------
+        num : int
+            Удаляемое число
+        side : str
+            Массив: "left" (первый) или "right" (второй)
+
+        Исключения:
+        -----------
+        ValueError
+            Если массив указан неверно или числа в нем нет
+        """
+        if side not in ('left', 'right'):
+            raise ValueError(f"неизвестный массив: {side} (доступны: left, right)")
+        counts = self._left if side == 'left' else self._right
+        count = counts.get(num)
+        if not count:
+            name = 'первом' if side == 'left' else 'втором'
+            raise ValueError(f"числа {num} нет в {name} массиве")
+        if count > 1:
+            counts[num] = count - 1
+            return
+
+        del counts[num]
+        if side == 'right':
+            self._touch(num)
+            return
+        del self._order[num]
+        self._common.pop(num, None)
+        reversed_num = self._reversal.pop(num)
+        if reversed_num is not None:
+            sources = self._sources[reversed_num]
+            sources.discard(num)
+            if not sources:
+                del self._sources[reversed_num]
+
+    def common(self):
+        """
+        Текущие общие числа.
+
+        Возвращает:
+        -----------
+        list
+            Общие числа без повторов в порядке первого добавления в первый
+            массив (как find_common_numbers для тех же данных)
+        """
+        return sorted(self._common, key=self._order.__getitem__)
+
+    def classify(self):
+        """
+        Текущие общие числа с классификацией совпадений.
+
+        Возвращает:
+        -----------
+        tuple
+            (common, direct_matches, reversed_matches) - как
+            classify_common_numbers для тех же данных
+        """
+        common = self.common()
+        direct_matches = [num for num in common if self._common[num] is None]
+        reversed_matches = [(num, self._common[num]) for num in common
+                            if self._common[num] is not None]
+        return common, direct_matches, reversed_matches
+
+    def __contains__(self, num):
+        return num in self._common
+
+    def __len__(self):
+        return len(self._common)
+
+    def __repr__(self):
+        return (f"CommonNumbersIndex(left={len(self._left)}, right={len(self._right)}, "
+                f"common={len(self._common)})")
+
+    def _register(self, num, reversed_num):
+        """Учет нового различного числа первого массива."""
+        self._reversal[num] = reversed_num
+        if reversed_num is not None:
+            self._sources.setdefault(reversed_num, set()).add(num)
+        self._refresh(num)
+
+    def _touch(self, num):
+        """Пересчет чисел, на которые влияет появление/исчезновение num во втором массиве."""
+        if num in self._left:
+            self._refresh(num)
+        for source in self._sources.get(num, ()):
+            self._refresh(source)
+
+    def _refresh(self, num):
+        """Пересчет статуса числа первого массива."""
+        if num in self._right:
+            self._common[num] = None
+            return
+        reversed_num = self._reversal[num]
+        if reversed_num is not None and reversed_num in self._right:
+            self._common[num] = reversed_num
+        else:
+            self._common.pop(num, None)
+
+
+def iter_common_numbers_external(source1, source2, memory_budget=EXTERNAL_MEMORY_BUDGET,
+                                 tmp_dir=None, dtype='int64', partitions=None):
+    """
+    Поиск общих чисел во внешней памяти - для входов больше ОЗУ.
+
+    Этапы:
+    ------
+    1. Разбиение: оба входа читаются блоками и раскладываются по файлам
+       разделов на диске по хешу. Число x первого массива попадает в
+       раздел hash(x) (прямое совпадение) и в раздел hash(reverse(x))
+       (совпадение по перевернутой версии), число второго массива - в
+       раздел hash(m). Общий ключ min(x, reverse(x)) не подходит:
+       120 → 21, но 21 → 12, и пара 120/21 разошлась бы по разным
+       разделам.
+    2. Соединение: для каждого раздела различные числа второго массива
+       загружаются в память, а записи первого массива проверяются
+       блоками; найденные числа с позицией первого появления пишутся в
+       отсортированный по позиции файл.
+    3. Слияние: файлы разделов сливаются по позиции порциями ограниченного
+       размера; число, совпавшее в двух разделах (напрямую и по
+       перевернутой версии), выдается один раз.
+
+    Параметры:
+    ----------
+    source1, source2 : str or numpy.ndarray
+        Входы: пути к файлам (.txt - читается потоково, .npy, контейнер
+        .adp с одним столбцом, остальные - двоичные с типом dtype) или
+        одномерные массивы (в том числе numpy.memmap)
+    memory_budget : int
+        Ориентировочный объем памяти (байт): по нему выбираются размер
+        блоков и число разделов
+    tmp_dir : str or None
+        Каталог для временных файлов (None - системный)
+    dtype : str
+        Тип элементов текстовых и двоичных входов
+    partitions : int or None
+        Число разделов (степень двойки; None - по объему входов и бюджету)
+
+    Возвращает:
+    -----------
+    generator
+        Блоки общих чисел (numpy.ndarray int64) в порядке первого
+        появления в первом входе - как find_common_numbers
+
+    Исключения:
+    -----------
+    ValueError
+        Если NumPy не установлен, входы не целочисленные или бюджет
+        слишком мал
+    """
+    if np is None:
+        raise ValueError("внешний режим требует NumPy")
+    if memory_budget < _MIN_EXTERNAL_BUDGET:
+        raise ValueError(f"бюджет памяти должен быть не меньше {_MIN_EXTERNAL_BUDGET} байт")
+    if partitions is not None and (partitions < 1 or partitions & (partitions - 1)):
+        raise ValueError("число разделов должно быть степенью двойки")
+
+    block = max(1024, memory_budget // _BYTES_PER_BLOCK_ITEM)
+    if partitions is None:
+        # Различные числа второго массива раздела должны помещаться в бюджет
+        estimate = _estimate_length(source2, dtype) * _JOIN_BYTES_PER_ITEM
+        partitions = min(_MAX_PARTITIONS, 1 << max(0, math.ceil(math.log2(max(1, estimate / memory_budget)))))
+    bits = partitions.bit_length() - 1
+
+    with tempfile.TemporaryDirectory(prefix='task8_', dir=tmp_dir) as tmp:
+        left = [os.path.join(tmp, f"left{p}.bin") for p in range(partitions)]
+        right = [os.path.join(tmp, f"right{p}.bin") for p in range(partitions)]
+        runs = [os.path.join(tmp, f"run{p}.bin") for p in range(partitions)]
+
+        _spill(_iter_blocks(source1, dtype, block), left, bits, _left_records)
+        _spill(_iter_blocks(source2, dtype, block), right, bits, lambda values, offset: (values, values))
+
+        for p in range(partitions):
+            _join_partition(left[p], right[p], runs[p], block)
+
+        yield from _merge_runs(runs, max(1024, memory_budget // (4 * _RUN_RECORD.itemsize)))
+
+
+def find_common_numbers_external(source1, source2, output, memory_budget=EXTERNAL_MEMORY_BUDGET,
+                                 tmp_dir=None, dtype='int64', partitions=None):
+    """
+    Поиск общих чисел во внешней памяти с потоковой записью результата.
+
+    Параметры:
+    ----------
+    source1, source2, memory_budget, tmp_dir, dtype, partitions
+        См. iter_common_numbers_external
+    output : str
+        Файл результата: .txt - числа через пробел, остальные - двоичный
+        файл с типом dtype (.npy и .adp требуют размер заранее и не
+        поддерживаются)
+
+    Возвращает:
+    -----------
+    int
+        Число найденных общих чисел
+
+    Исключения:
+    -----------
+    ValueError
+        Если формат вывода не поддерживается (и см.
+        iter_common_numbers_external)
+    """
+    ext = os.path.splitext(output)[1].lower()
+    if ext in ('.npy', '.adp'):
+        raise ValueError(f"потоковая запись в {ext} не поддерживается: используйте .txt или двоичный файл")
+
+    count = 0
+    blocks = iter_common_numbers_external(source1, source2, memory_budget, tmp_dir, dtype, partitions)
+    if ext == '.txt':
+        with open(output, 'w', encoding='utf-8') as f:
+            for values in blocks:
+                f.write(' ' if count else '')
+                f.write(' '.join(map(str, values.tolist())))
+                count += len(values)
+            f.write('\n')
+    else:
+        with open(output, 'wb') as f:
+            for values in blocks:
+                values.astype(np.dtype(dtype)).tofile(f)
+                count += len(values)
+    return count
+
+
+def _iter_blocks(source, dtype, block):
+    """Блоки входа как массивы int64 (файлы не загружаются целиком)."""
+    if isinstance(source, str):
+        ext = os.path.splitext(source)[1].lower()
+        if ext == '.txt':
+            for values in iter_numbers(source, dtype=dtype, chunk_size=block * 8):
+                yield _as_int64(values)
+            return
+        source = _open_array(source, dtype)
+    data = np.asarray(source)
+    if data.ndim != 1:
+        raise ValueError("внешний режим принимает только одномерные входы")
+    for start in range(0, len(data), block):
+        yield _as_int64(data[start:start + block])
+
+
+def _open_array(path, dtype):
+    """Одномерный массив поверх файла без чтения в память."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy':
+        return np.load(path, mmap_mode='r')
+    if ext == EXTENSION:
+        columns = list(read_container(path).columns.values())
+        if len(columns) != 1:
+            raise ValueError(f"{path}: для внешнего режима контейнер должен содержать один столбец")
+        return columns[0]
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=np.dtype(dtype))
+    return np.memmap(path, dtype=np.dtype(dtype), mode='r')
+
+
+def _estimate_length(source, dtype):
+    """Оценка числа элементов входа сверху (для выбора числа разделов)."""
+    if not isinstance(source, str):
+        return len(source)
+    if os.path.splitext(source)[1].lower() == '.txt':
+        # Самое короткое число с разделителем - два байта
+        return os.path.getsize(source) // 2
+    return len(_open_array(source, dtype))
+
+
+def _as_int64(values):
+    """Проверка, что блок целочисленный, и приведение к int64."""
+    if values.dtype.kind not in 'iu':
+        raise ValueError(f"внешний режим поддерживает только целые числа (dtype={values.dtype})")
+    if values.dtype == np.uint64 and len(values) and int(values.max()) > _INT64_MAX:
+        raise ValueError("числа больше 2^63 - 1 не поддерживаются")
+    return values.astype(np.int64, copy=False)
+
+
+def _left_records(values, offset):
+    """
+    Записи первого массива: (ключ раздела, запись).
+
+    Каждое число дает запись с ключом x и, если перевернутая версия
+    отличается и помещается в int64, запись с ключом reverse(x).
+    """
+    positions = np.arange(offset, offset + len(values), dtype=np.int64)
+    reversed_values = np.full(len(values), -1, dtype=np.int64)
+    small = (values >= 0) & (values < _REVERSE_LIMIT)
+    reversed_values[small] = reverse_digits(values[small])
+    for k in np.flatnonzero(values >= _REVERSE_LIMIT):
+        # Перевернутая версия может выйти за int64 - тогда совпадения быть не может
+        reversed_num = reverse_number(int(values[k]))
+        if reversed_num <= _INT64_MAX:
+            reversed_values[k] = reversed_num
+
+    by_reversal = (reversed_values >= 0) & (reversed_values != values)
+    records = np.empty(len(values) + int(by_reversal.sum()), dtype=_LEFT_RECORD)
+    n = len(values)
+    records['probe'][:n] = values
+    records['value'][:n] = values
+    records['pos'][:n] = positions
+    records['probe'][n:] = reversed_values[by_reversal]
+    records['value'][n:] = values[by_reversal]
+    records['pos'][n:] = positions[by_reversal]
+    return records['probe'], records
+
+
+def _spill(blocks, paths, bits, make_records):
+    """Раскладка записей блоков по файлам разделов."""
+    files = [open(path, 'wb') for path in paths]
+    try:
+        offset = 0
+        for values in blocks:
+            keys, records = make_records(values, offset)
+            offset += len(values)
+            part = _partition_of(keys, bits)
+            order = np.argsort(part, kind='stable')
+            records = records[order]
+            bounds = np.concatenate(([0], np.cumsum(np.bincount(part, minlength=len(files)))))
+            for p, f in enumerate(files):
+                if bounds[p + 1] > bounds[p]:
+                    records[bounds[p]:bounds[p + 1]].tofile(f)
+    finally:
+        for f in files:
+            f.close()
+
+
+def _partition_of(keys, bits):
+    """Номер раздела по мультипликативному хешу ключа."""
+    if bits == 0:
+        return np.zeros(len(keys), dtype=np.intp)
+    hashed = keys.astype(np.uint64) * _HASH_MULTIPLIER
+    return (hashed >> np.uint64(64 - bits)).astype(np.intp)
+
+
+def _join_partition(left_path, right_path, run_path, block):
+    """
+    Соединение раздела: числа первого массива, найденные во втором.
+
+    Результат - файл записей (позиция первого появления, число),
+    отсортированный по позиции.
+    """
+    right = np.unique(np.fromfile(right_path, dtype=np.int64))
+    os.unlink(right_path)
+    found = []
+    if len(right):
+        left = np.memmap(left_path, dtype=_LEFT_RECORD, mode='r') if os.path.getsize(left_path) else ()
+        for start in range(0, len(left), block):
+            records = left[start:start + block]
+            index = np.minimum(np.searchsorted(right, records['probe']), len(right) - 1)
+            hit = right[index] == records['probe']
+            if hit.any():
+                found.append(_first_positions(records['value'][hit], records['pos'][hit]))
+        del left
+    os.unlink(left_path)
+
+    run = np.empty(0, dtype=_RUN_RECORD)
+    if found:
+        values, positions = _first_positions(np.concatenate([v for v, _ in found]),
+                                             np.concatenate([p for _, p in found]))
+        order = np.argsort(positions, kind='stable')
+        run = np.empty(len(values), dtype=_RUN_RECORD)
+        run['pos'] = positions[order]
+        run['value'] = values[order]
+    run.tofile(run_path)
+
+
+def _first_positions(values, positions):
+    """Различные числа и наименьшая позиция каждого."""
+    order = np.lexsort((positions, values))
+    values = values[order]
+    positions = positions[order]
+    first = np.ones(len(values), dtype=bool)
+    first[1:] = values[1:] != values[:-1]
+    return values[first], positions[first]
+
+
+def _merge_runs(paths, window):
+    """
+    Слияние отсортированных по позиции файлов разделов порциями.
+
+    За шаг из каждого файла берется не больше window / число файлов
+    записей, причем только с позициями не больше наименьшей из последних
+    взятых - тогда все записи до этой границы уже собраны, и порцию можно
+    упорядочить и выдать целиком.
+    """
+    runs = [np.memmap(path, dtype=_RUN_RECORD, mode='r') for path in paths if os.path.getsize(path)]
+    if not runs:
+        return
+    quota = max(1, window // len(runs))
+    cursors = [0] * len(runs)
+    while True:
+        active = [k for k, run in enumerate(runs) if cursors[k] < len(run)]
+        if not active:
+            return
+        bound = min(int(runs[k]['pos'][min(cursors[k] + quota, len(runs[k])) - 1]) for k in active)
+
+        parts = []
+        for k in active:
+            run = runs[k]
+            start = cursors[k]
+            stop = min(start + quota, len(run))
+            end = start + int(np.searchsorted(run['pos'][start:stop], bound, side='right'))
+            if end > start:
+                parts.append(np.array(run[start:end]))
+                cursors[k] = end
+        chunk = np.concatenate(parts)
+        chunk = chunk[np.argsort(chunk['pos'], kind='stable')]
+        # Число, найденное и напрямую, и по перевернутой версии, встречается дважды с одной позицией
+        keep = np.ones(len(chunk), dtype=bool)
+        keep[1:] = chunk['pos'][1:] != chunk['pos'][:-1]
+        yield chunk['value'][keep]
@@ -0,0 +1,268 @@
+"""
+БАЗОВЫЕ ОПЕРАЦИИ НАД МАССИВАМИ
+==============================
+
+Переиспользуемые вычислительные ядра для алгоритмов приложения.
+
+Содержит:
+---------
+- reverse_number  - переворот цифр одного числа (арифметически, без строк)
+- reverse_digits  - векторизованный переворот цифр целого массива
+- sort_integers   - сортировка подсчетом для целых из узкого диапазона
+                    с откатом на сортировку сравнением
+
+NumPy - необязательная зависимость: без неё используются циклы Python.
+"""
+
+import numbers
+from collections import Counter
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен - работаем на чистом Python
+    np = None
+
+
+# Числа меньше этой границы переворачиваются в int64 без переполнения:
+# результат содержит не более 18 цифр
+_REVERSE_INT64_LIMIT = 10 ** 18
+
+# Степени десяти 10^0 .. 10^17 для определения числа цифр
+_POWERS_OF_TEN = [10 ** k for k in range(18)]
+
+# Стратегии сортировки sort_integers
+SORT_STRATEGIES = ('auto', 'counting', 'comparison')
+
+# "auto" сортирует подсчетом, если диапазон значений k не больше n / делитель:
+# тогда O(n + k) заметно быстрее O(n log n) сортировки сравнением
+COUNTING_RANGE_DIVISOR = 4
+
+# То же для списков без NumPy: подсчет через Counter дороже bincount,
+# и выигрыш у sorted появляется только при k порядка n / 32
+_PYTHON_COUNTING_RANGE_DIVISOR = 32
+
+# Наибольший диапазон значений для подсчета (размер массива счетчиков)
+COUNTING_MAX_RANGE = 1 << 24
+
+# Меньшие массивы всегда сортируются сравнением
+_COUNTING_MIN_SIZE = 1024
+
+
+def reverse_number(num):
+    """
+    Переворот цифр целого неотрицательного числа.
+
+    Совпадает с int(str(num)[::-1]), но не создает промежуточных строк:
+    конечные нули исходного числа становятся ведущими и отбрасываются
+    (120 → 21).
+
+    Параметры:
+    ----------
+    num : int
+        Целое неотрицательное число
+
+    Возвращает:
+    -----------
+    int
+        Число с цифрами в обратном порядке
+
+    Исключения:
+    -----------
+    ValueError
+        Если число отрицательное
+    """
+    num = int(num)
+    if num < 0:
+        raise ValueError(f"переворот цифр определен только для неотрицательных чисел: {num}")
+
+    result = 0
+    while num:
+        num, digit = divmod(num, 10)
+        result = result * 10 + digit
+    return result
+
+
+def reverse_digits(values):
+    """
+    Векторизованный переворот цифр для массива целых неотрицательных чисел.
+
+    Ядро работает целочисленными операциями деления и остатка над всем
+    массивом сразу: за k-й проход извлекается k-я цифра каждого элемента
+    и прибавляется с весом 10^(d-1-k), где d - число цифр элемента.
+    Число проходов равно числу цифр самого длинного элемента.
+
+    Параметры:
+    ----------
+    values : array-like
+        Целые неотрицательные числа
+
+    Возвращает:
+    -----------
+    numpy.ndarray or list
+        Перевернутые числа в том же порядке: массив int64 (или object,
+        если есть числа от 10^18), без NumPy - список
+
+    Исключения:
+    -----------
+    ValueError
+        Если среди чисел есть отрицательные или нецелые
+    """
+    if np is None:
+        return [reverse_number(_as_integer(num)) for num in values]
+
+    arr = np.asarray(values)
+    if not isinstance(values, np.ndarray) and arr.dtype.kind not in 'iuO':
+        # Список с большими целыми NumPy приводит к float - сохраняем значения как есть
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = list(values)
+    if arr.size == 0:
+        return np.zeros(arr.shape, dtype=np.int64)
+    if arr.dtype.kind not in 'iu':
+        if arr.dtype.kind != 'O':
+            raise ValueError(f"переворот цифр определен только для целых чисел (dtype={arr.dtype})")
+        # Большие целые Python - поэлементно, с проверкой типа
+        return np.array([reverse_number(_as_integer(num)) for num in arr.ravel()],
+                        dtype=object).reshape(arr.shape)
+
+    if arr.min() < 0:
+        raise ValueError("переворот цифр определен только для неотрицательных чисел")
+    if int(arr.max()) >= _REVERSE_INT64_LIMIT:
+        return np.array([reverse_number(num) for num in arr.ravel().tolist()],
+                        dtype=object).reshape(arr.shape)
+
+    remaining = arr.astype(np.int64)
+    powers = np.asarray(_POWERS_OF_TEN, dtype=np.int64)
+
+    # Число цифр каждого элемента (у нуля - одна цифра) и вес старшей позиции
+    n_digits = np.maximum(np.searchsorted(powers, remaining, side='right'), 1)
+    weight = powers[n_digits - 1]
+
+    result = np.zeros_like(remaining)
+    digit = np.empty_like(remaining)
+    for _ in range(int(n_digits.max())):
+        # Младшая цифра уходит в старшую позицию результата; у коротких чисел
+        # вес и остаток уже равны нулю, поэтому лишние проходы ничего не меняют
+        np.remainder(remaining, 10, out=digit)
+        np.floor_divide(remaining, 10, out=remaining)
+        digit *= weight
+        result += digit
+        weight //= 10
+
+    return result
+
+
+def sort_integers(values, strategy='auto', reverse=False):
+    """
+    Сортировка по возрастанию с подсчетом для целых из узкого диапазона.
+
+    Для целых чисел с диапазоном k = max - min + 1 сортировка подсчетом
+    выполняется за O(n + k): NumPy - через np.bincount и np.repeat,
+    без NumPy - через Counter по различным значениям. Вещественные
+    числа, смешанные типы и широкие диапазоны сортируются сравнением.
+
+    Параметры:
+    ----------
+    values : list or numpy.ndarray
+        Одномерный массив чисел
+    strategy : str
+        "auto" - подсчет, если k <= n / COUNTING_RANGE_DIVISOR
+        (для списков - n / 32);
+        "counting" - подсчет всегда, когда k <= COUNTING_MAX_RANGE;
+        "comparison" - всегда сортировка сравнением
+    reverse : bool
+        Сортировать по убыванию (для массива NumPy - развернутое
+        представление отсортированной копии)
+
+    Возвращает:
+    -----------
+    list or numpy.ndarray
+        Отсортированная копия того же вида, что и вход
+
+    Исключения:
+    -----------
+    ValueError
+        Если указана неизвестная стратегия
+    """
+    if strategy not in SORT_STRATEGIES:
+        raise ValueError(f"неизвестная стратегия сортировки: {strategy} "
+                         f"(доступны: {', '.join(SORT_STRATEGIES)})")
+
+    if np is not None and isinstance(values, np.ndarray):
+        result = None
+        if strategy != 'comparison':
+            result = _counting_sort_numpy(values, strategy)
+        if result is None:
+            result = np.sort(values)
+        return result[::-1] if reverse else result
+
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    if strategy != 'comparison':
+        result = _counting_sort_python(values, strategy)
+        if result is not None:
+            if reverse:
+                result.reverse()
+            return result
+    return sorted(values, reverse=reverse)
+
+
+def _counting_range_allowed(n, k, strategy, divisor=COUNTING_RANGE_DIVISOR):
+    """Подходит ли диапазон k значений для сортировки подсчетом."""
+    if k > COUNTING_MAX_RANGE:
+        return False
+    if strategy == 'counting':
+        return True
+    return n >= _COUNTING_MIN_SIZE and k * divisor <= n
+
+
+def _counting_sort_numpy(arr, strategy):
+    """Сортировка подсчетом массива NumPy или None, если она не подходит."""
+    if arr.dtype.kind not in 'iu' or arr.ndim != 1 or arr.size == 0:
+        return None
+    low, high = int(arr.min()), int(arr.max())
+    if not _counting_range_allowed(arr.size, high - low + 1, strategy):
+        return None
+    if 0 <= low <= high - low + 1 and arr.dtype != np.uint64:
+        # Значения от нуля (массив счетчиков удлиняется не более чем вдвое)
+        # считаются без сдвига и без копии массива
+        counts = np.bincount(arr, minlength=high + 1)[low:]
+    elif arr.dtype.kind == 'u':
+        # Беззнаковые: разность в исходном типе не переполняется (arr >= low)
+        counts = np.bincount((arr - arr.dtype.type(low)).astype(np.intp, copy=False),
+                             minlength=high - low + 1)
+    else:
+        # Знаковые: сдвиг в intp, чтобы узкие типы не переполнились
+        shifted = arr.astype(np.intp)
+        shifted -= low
+        counts = np.bincount(shifted, minlength=high - low + 1)
+    return np.repeat(np.arange(low, high + 1, dtype=arr.dtype), counts)
+
+
+def _counting_sort_python(values, strategy):
+    """Сортировка подсчетом списка целых или None, если она не подходит."""
+    if not values:
+        return None
+    low, high = min(values), max(values)
+    # Типы проверяются целиком: Counter объединил бы 1, 1.0 и True
+    if set(map(type, values)) != {int}:
+        return None
+    if not _counting_range_allowed(len(values), high - low + 1, strategy,
+                                   _PYTHON_COUNTING_RANGE_DIVISOR):
+        return None
+    # Подсчет - Counter (цикл на C), выдача - обходом диапазона без сортировки ключей
+    counts = Counter(values)
+    get = counts.get
+    result = []
+    for num in range(low, high + 1):
+        count = get(num)
+        if count:
+            result.extend(repeat(num, count))
+    return result
+
+
+def _as_integer(num):
+    """Проверка, что значение - целое неотрицательное число."""
+    if not isinstance(num, numbers.Integral) or isinstance(num, bool) or num < 0:
+        raise ValueError(f"переворот цифр определен только для целых неотрицательных чисел: {num}")
+    return int(num)
@@ -0,0 +1,443 @@
+"""
+ДВОИЧНЫЙ КОНТЕЙНЕР ДАННЫХ
+=========================
+
+Компактный формат для обмена данными заданий (входные массивы, матрицы,
+результаты) между пакетным режимом, генераторами и выводом результата -
+без текстового преобразования чисел.
+
+Структура файла (все числа little-endian):
+------------------------------------------
+- заголовок: сигнатура b'ADPC', версия (u16), номер задания (u16),
+  число столбцов (u32)
+- для каждого столбца: длина имени (u16), имя (UTF-8), длина типа (u8),
+  тип NumPy (например '<i8'), число измерений (u8), размеры (u64 каждый),
+  смещение данных (u64), размер данных в байтах (u64)
+- данные столбцов: сырые буферы по строкам, выровненные по 64 байта
+
+Чтение отображает файл в память (mmap), и столбцы возвращаются как
+numpy.frombuffer / memoryview поверх него - без копирования данных.
+"""
+
+import array
+import mmap
+import os
+import struct
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен - столбцы читаются как memoryview
+    np = None
+
+
+# Сигнатура и версия формата
+MAGIC = b'ADPC'
+VERSION = 1
+
+# Расширение файлов контейнера
+EXTENSION = '.adp'
+
+# Выравнивание начала данных каждого столбца (байт)
+ALIGNMENT = 64
+
+_HEADER = struct.Struct('<4sHHI')
+_U8 = struct.Struct('<B')
+_U16 = struct.Struct('<H')
+_U64 = struct.Struct('<Q')
+
+# Соответствие типов формата и кодов memoryview/array.array (без NumPy)
+_TYPECODES = {
+    '|i1': 'b', '<i2': 'h', '<i4': 'i', '<i8': 'q',
+    '|u1': 'B', '<u2': 'H', '<u4': 'I', '<u8': 'Q',
+    '<f4': 'f', '<f8': 'd',
+}
+_DTYPES = {code: dtype for dtype, code in _TYPECODES.items()}
+
+# Размер порции строк при записи несмежных массивов (байт)
+_WRITE_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+class DataContainer:
+    """
+    Содержимое двоичного контейнера.
+
+    Атрибуты:
+    ---------
+    task : int
+        Номер задания (0 - не указан)
+    columns : dict
+        Столбцы: имя → numpy.ndarray (без NumPy - memoryview)
+    path : str or None
+        Файл, из которого прочитан контейнер
+    """
+
+    def __init__(self, task, columns, path=None):
+        self.task = task
+        self.columns = columns
+        self.path = path
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __len__(self):
+        return len(self.columns)
+
+    def names(self):
+        """Имена столбцов в порядке записи."""
+        return list(self.columns)
+
+    def __repr__(self):
+        shapes = ', '.join(f"{name}{tuple(col.shape)}" for name, col in self.columns.items())
+        return f"DataContainer(task={self.task}, columns=[{shapes}])"
+
+
+def write_container(path, columns, task=0):
+    """
+    Запись столбцов в двоичный контейнер.
+
+    Параметры:
+    ----------
+    path : str
+        Путь к файлу
+    columns : dict
+        Имя → данные (numpy.ndarray, array.array, список чисел или
+        матрица-список списков; несмежные представления допускаются)
+    task : int
+        Номер задания
+
+    Исключения:
+    -----------
+    ValueError
+        Если тип данных столбца не поддерживается
+    """
+    prepared = {name: _as_buffer(data) for name, data in columns.items()}
+    specs = {name: (dtype, shape) for name, (dtype, shape, _) in prepared.items()}
+
+    layout, total = _layout(specs)
+    with open(path, 'wb') as f:
+        f.write(_encode_header(specs, task, layout))
+        for name, (dtype, shape, data) in prepared.items():
+            offset, nbytes = layout[name]
+            f.seek(offset)
+            _write_data(f, data)
+        f.truncate(total)
+
+
+def allocate_container(path, columns, task=0):
+    """
+    Создание контейнера с заранее выделенными столбцами для заполнения.
+
+    Файл создается нужного размера, а столбцы возвращаются как
+    записываемые numpy.memmap - генераторы и алгоритмы пишут прямо в файл.
+
+    Параметры:
+    ----------
+    path : str
+        Путь к файлу
+    columns : dict
+        Имя → (тип NumPy, размер)
+    task : int
+        Номер задания
+
+    Возвращает:
+    -----------
+    DataContainer
+        Контейнер со столбцами numpy.memmap (режим r+)
+
+    Исключения:
+    -----------
+    ValueError
+        Если NumPy не установлен
+    """
+    if np is None:
+        raise ValueError("выделение контейнера требует NumPy")
+
+    specs = {name: (np.dtype(dtype).newbyteorder('<').str, tuple(shape))
+             for name, (dtype, shape) in columns.items()}
+    layout, total = _layout(specs)
+    with open(path, 'wb') as f:
+        f.write(_encode_header(specs, task, layout))
+        f.truncate(total)
+
+    result = {}
+    for name, (dtype, shape) in specs.items():
+        offset, _ = layout[name]
+        result[name] = np.memmap(path, dtype=np.dtype(dtype), mode='r+',
+                                 offset=offset, shape=shape)
+    return DataContainer(task, result, path)
+
+
+def read_container(path):
+    """
+    Чтение двоичного контейнера без копирования данных.
+
+    Параметры:
+    ----------
+    path : str
+        Путь к файлу
+
+    Возвращает:
+    -----------
+    DataContainer
+        Контейнер; столбцы - представления над отображенным в память
+        файлом (numpy.ndarray только для чтения или memoryview)
+
+    Исключения:
+    -----------
+    ValueError
+        Если файл не является контейнером или поврежден
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            raise ValueError(f"{path}: файл слишком мал для контейнера")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return _parse(buffer, path)
+
+
+def encode_container(columns, task=0):
+    """
+    Контейнер в памяти - для передачи по сети или каналу без файла.
+
+    Параметры:
+    ----------
+    columns : dict
+        Имя → данные (как в write_container)
+    task : int
+        Номер задания
+
+    Возвращает:
+    -----------
+    bytearray
+        Содержимое контейнера, байт в байт совпадающее с файлом
+        write_container
+
+    Исключения:
+    -----------
+    ValueError
+        Если тип данных столбца не поддерживается
+    """
+    prepared = {name: _as_buffer(data) for name, data in columns.items()}
+    specs = {name: (dtype, shape) for name, (dtype, shape, _) in prepared.items()}
+
+    layout, total = _layout(specs)
+    buffer = bytearray(total)
+    header = _encode_header(specs, task, layout)
+    buffer[:len(header)] = header
+    for name, (dtype, shape, data) in prepared.items():
+        offset, nbytes = layout[name]
+        if np is not None and isinstance(data, np.ndarray):
+            data = np.ascontiguousarray(data)
+        buffer[offset:offset + nbytes] = memoryview(data).cast('B')
+    return buffer
+
+
+def decode_container(buffer):
+    """
+    Чтение контейнера из буфера в памяти без копирования данных.
+
+    Параметры:
+    ----------
+    buffer : bytes, bytearray or memoryview
+        Содержимое контейнера (например, из encode_container)
+
+    Возвращает:
+    -----------
+    DataContainer
+        Контейнер; столбцы - представления над буфером
+
+    Исключения:
+    -----------
+    ValueError
+        Если буфер не является контейнером или поврежден
+    """
+    if len(buffer) < _HEADER.size:
+        raise ValueError("<буфер>: слишком мал для контейнера")
+    return _parse(buffer, '<буфер>')
+
+
+def _parse(buffer, source):
+    """Разбор заголовка и столбцов контейнера; source - имя для сообщений."""
+    try:
+        return _parse_columns(buffer, source)
+    except (struct.error, TypeError) as e:
+        # Обрезанный заголовок или неизвестный тип столбца
+        raise ValueError(f"{source}: поврежденный заголовок контейнера ({e})") from e
+
+
+def _parse_columns(buffer, source):
+    """Разбор без обработки ошибок struct - см. _parse."""
+    magic, version, task, count = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{source}: не является контейнером данных")
+    if version > VERSION:
+        raise ValueError(f"{source}: неподдерживаемая версия формата {version}")
+
+    pos = _HEADER.size
+    columns = {}
+    for _ in range(count):
+        name_len, = _U16.unpack_from(buffer, pos)
+        pos += _U16.size
+        name = bytes(buffer[pos:pos + name_len]).decode('utf-8')
+        pos += name_len
+
+        dtype_len, = _U8.unpack_from(buffer, pos)
+        pos += _U8.size
+        dtype = bytes(buffer[pos:pos + dtype_len]).decode('ascii')
+        pos += dtype_len
+
+        ndim, = _U8.unpack_from(buffer, pos)
+        pos += _U8.size
+        shape = tuple(_U64.unpack_from(buffer, pos + k * _U64.size)[0] for k in range(ndim))
+        pos += ndim * _U64.size
+
+        offset, = _U64.unpack_from(buffer, pos)
+        nbytes, = _U64.unpack_from(buffer, pos + _U64.size)
+        pos += 2 * _U64.size
+
+        if offset + nbytes > len(buffer):
+            raise ValueError(f"{source}: столбец {name} выходит за пределы файла")
+        columns[name] = _view(buffer, dtype, shape, offset, nbytes)
+
+    return DataContainer(task, columns, source if isinstance(buffer, mmap.mmap) else None)
+
+
+def is_container(path):
+    """
+    Проверка, является ли файл двоичным контейнером (по сигнатуре).
+
+    Параметры:
+    ----------
+    path : str
+        Путь к файлу
+
+    Возвращает:
+    -----------
+    bool
+        True, если файл начинается с сигнатуры контейнера
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _view(buffer, dtype, shape, offset, nbytes):
+    """Представление столбца поверх буфера файла без копирования."""
+    if np is not None:
+        count = nbytes // np.dtype(dtype).itemsize
+        return np.frombuffer(buffer, dtype=np.dtype(dtype), count=count, offset=offset).reshape(shape)
+
+    typecode = _TYPECODES.get(dtype)
+    if typecode is None:
+        raise ValueError(f"тип {dtype} без NumPy не поддерживается")
+    if sys.byteorder != 'little' and dtype[0] == '<':
+        raise ValueError("чтение без NumPy возможно только на little-endian платформе")
+    if nbytes == 0:
+        # memoryview не поддерживает нулевые размеры - пустой одномерный столбец
+        return memoryview(b'').cast(typecode)
+    return memoryview(buffer)[offset:offset + nbytes].cast(typecode, shape)
+
+
+def _as_buffer(data):
+    """
+    Приведение данных столбца к (тип, размер, буфер).
+
+    Массивы NumPy приводятся к little-endian без копирования, если это
+    уже так; списки и array.array - к типизированному буферу.
+    """
+    if np is not None:
+        if not isinstance(data, np.ndarray):
+            data = np.asarray(data.materialize() if hasattr(data, 'materialize') else data)
+        if data.dtype.kind not in 'iuf':
+            raise ValueError(f"неподдерживаемый тип данных столбца: {data.dtype}")
+        data = data.astype(data.dtype.newbyteorder('<'), copy=False)
+        return data.dtype.str, data.shape, data
+
+    if hasattr(data, 'materialize'):
+        data = data.materialize()
+    if isinstance(data, array.array):
+        return _DTYPES[data.typecode], (len(data),), data
+    if data and isinstance(data[0], (list, tuple)):
+        rows, cols = len(data), len(data[0])
+        flat = _typed_array([x for row in data for x in row])
+        return _DTYPES[flat.typecode], (rows, cols), flat
+    flat = _typed_array(list(data))
+    return _DTYPES[flat.typecode], (len(flat),), flat
+
+
+def _typed_array(values):
+    """Список чисел → array.array int64 или float64."""
+    if all(isinstance(x, int) for x in values):
+        return array.array('q', values)
+    return array.array('d', values)
+
+
+def _write_data(f, data):
+    """Запись буфера столбца; несмежные массивы пишутся порциями строк."""
+    if np is not None and isinstance(data, np.ndarray) and not data.flags.c_contiguous:
+        row_bytes = max(1, data[0].nbytes if data.ndim > 1 and len(data) else data.itemsize)
+        step = max(1, _WRITE_CHUNK_BYTES // row_bytes)
+        for start in range(0, len(data), step):
+            f.write(np.ascontiguousarray(data[start:start + step]).data)
+        return
+    f.write(memoryview(data).cast('B'))
+
+
+def _encode_descriptors(specs, offsets):
+    """Описания столбцов для заголовка."""
+    parts = []
+    for name, (dtype, shape) in specs.items():
+        encoded_name = name.encode('utf-8')
+        encoded_dtype = dtype.encode('ascii')
+        parts.append(_U16.pack(len(encoded_name)))
+        parts.append(encoded_name)
+        parts.append(_U8.pack(len(encoded_dtype)))
+        parts.append(encoded_dtype)
+        parts.append(_U8.pack(len(shape)))
+        parts.extend(_U64.pack(dim) for dim in shape)
+        offset, nbytes = offsets.get(name, (0, 0))
+        parts.append(_U64.pack(offset))
+        parts.append(_U64.pack(nbytes))
+    return b''.join(parts)
+
+
+def _encode_header(specs, task, layout):
+    """Заголовок контейнера с описаниями столбцов."""
+    return _HEADER.pack(MAGIC, VERSION, task, len(specs)) + _encode_descriptors(specs, layout)
+
+
+def _layout(specs):
+    """
+    Размещение столбцов в файле.
+
+    Возвращает:
+    -----------
+    tuple
+        (имя → (смещение, размер в байтах), общий размер файла)
+    """
+    header_size = _HEADER.size + len(_encode_descriptors(specs, {}))
+    layout = {}
+    offset = _align(header_size)
+    for name, (dtype, shape) in specs.items():
+        nbytes = _itemsize(dtype)
+        for dim in shape:
+            nbytes *= dim
+        layout[name] = (offset, nbytes)
+        offset = _align(offset + nbytes)
+    total = max((off + size for off, size in layout.values()), default=header_size)
+    return layout, total
+
+
+def _itemsize(dtype):
+    """Размер элемента по строке типа ('<i8' → 8)."""
+    return int(dtype[2:])
+
+
+def _align(offset):
+    """Округление смещения вверх до ALIGNMENT."""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
@@ -0,0 +1,617 @@
+"""
+ОПЕРАЦИИ ВВОДА ДАННЫХ
+=====================
+
+Ввод массивов вручную, разбор чисел и генерация случайных данных
+для алгоритмов приложения.
+
+Для больших входов есть потоковое чтение (read_numbers, read_matrix):
+файл или stdin читается блоками фиксированного размера, и каждый блок
+целиком разбирается NumPy сразу в заранее выделенный типизированный
+массив - без промежуточного списка строк всего файла. iter_numbers
+отдает те же блоки по одному - для файлов больше памяти.
+
+Для больших наборов данных есть генераторы на numpy.random.Generator
+(generate_array, generate_matrix): тип, зерно и выходной буфер задаются
+явно, буфер (в том числе memmap) заполняется блоками параллельно, а
+результат при одном зерне не зависит от числа потоков.
+"""
+
+import array
+import random
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен - разбор на чистом Python
+    np = None
+
+
+# Размер блока потокового чтения (байт)
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Начальная емкость массива, если число элементов заранее неизвестно
+_INITIAL_CAPACITY = 1024
+
+# Разделители чисел
+_WHITESPACE = b' \t\n\r\f\v'
+
+# Число элементов в одном блоке генерации (блок - единица параллелизма
+# и одновременно граница независимого потока случайных чисел)
+DEFAULT_GENERATE_CHUNK = 1 << 20
+
+# Типы array.array для разбора без NumPy
+_ARRAY_TYPECODES = {'int64': 'q', 'int32': 'i', 'float64': 'd', 'float32': 'f'}
+
+
+def parse_number(token):
+    """
+    Разбор одного числа из строки.
+
+    Параметры:
+    ----------
+    token : str
+        Текстовое представление числа
+
+    Возвращает:
+    -----------
+    int or float
+        Целое число, если запись целая, иначе вещественное
+
+    Исключения:
+    -----------
+    ValueError
+        Если строка не является числом
+    """
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def parse_numbers(line):
+    """
+    Разбор строки чисел, разделенных пробелами.
+
+    Параметры:
+    ----------
+    line : str
+        Строка с числами
+
+    Возвращает:
+    -----------
+    list
+        Список чисел (int или float)
+    """
+    return [parse_number(token) for token in line.split()]
+
+
+def manual_input_array(prompt="Введите числа через пробел: "):
+    """
+    Ручной ввод массива чисел с клавиатуры.
+
+    Ввод повторяется, пока пользователь не введет только числа.
+
+    Параметры:
+    ----------
+    prompt : str
+        Приглашение к вводу
+
+    Возвращает:
+    -----------
+    list
+        Введенные числа
+    """
+    while True:
+        try:
+            return parse_numbers(input(prompt))
+        except ValueError:
+            print("✗ Ошибка: вводите только числа!")
+
+
+def generate_random_array(size, min_val=0, max_val=100):
+    """
+    Генерация массива случайных целых чисел.
+
+    Параметры:
+    ----------
+    size : int
+        Размер массива
+    min_val : int
+        Минимальное значение (включительно)
+    max_val : int
+        Максимальное значение (включительно)
+
+    Возвращает:
+    -----------
+    list
+        Массив случайных чисел
+    """
+    return [random.randint(min_val, max_val) for _ in range(size)]
+
+
+def generate_random_matrix(rows, cols, min_val=0, max_val=100):
+    """
+    Генерация матрицы случайных целых чисел.
+
+    Параметры:
+    ----------
+    rows : int
+        Количество строк
+    cols : int
+        Количество столбцов
+    min_val : int
+        Минимальное значение (включительно)
+    max_val : int
+        Максимальное значение (включительно)
+
+    Возвращает:
+    -----------
+    list
+        Матрица (список строк)
+    """
+    return [generate_random_array(cols, min_val, max_val) for _ in range(rows)]
+
+
+def generate_array(size=None, min_val=0, max_val=100, dtype='int64', seed=None,
+                   out=None, workers=1, chunk_size=DEFAULT_GENERATE_CHUNK):
+    """
+    Генерация массива случайных чисел на numpy.random.Generator.
+
+    Массив делится на блоки по chunk_size элементов; каждый блок получает
+    собственный поток случайных чисел из SeedSequence(seed).spawn(...),
+    поэтому при одном зерне результат одинаков при любом числе потоков.
+    Блоки пишутся прямо в выходной буфер (временная память - один блок
+    на поток).
+
+    Параметры:
+    ----------
+    size : int or None
+        Размер массива (не нужен, если задан out)
+    min_val, max_val : int or float
+        Границы значений (включительно для целых типов)
+    dtype : str or numpy.dtype
+        Тип элементов: целый или вещественный
+    seed : int, numpy.random.SeedSequence or None
+        Зерно генератора (None - случайное)
+    out : numpy.ndarray or None
+        Заранее выделенный буфер, например numpy.memmap (заполняется целиком)
+    workers : int
+        Число потоков заполнения
+    chunk_size : int
+        Размер блока в элементах
+
+    Возвращает:
+    -----------
+    numpy.ndarray
+        Заполненный массив (out, если он передан)
+
+    Исключения:
+    -----------
+    ValueError
+        Если NumPy не установлен, не задан размер или тип не числовой
+    """
+    if np is None:
+        raise ValueError("генерация массивов требует NumPy")
+    if min_val > max_val:
+        raise ValueError("минимальное значение больше максимального")
+    if chunk_size <= 0 or workers <= 0:
+        raise ValueError("размер блока и число потоков должны быть положительными")
+
+    if out is None:
+        if size is None:
+            raise ValueError("нужно указать size или out")
+        out = np.empty(size, dtype=dtype)
+    elif size is not None and out.size != size:
+        raise ValueError(f"размер out ({out.size}) не совпадает с size ({size})")
+
+    if not out.flags.c_contiguous:
+        raise ValueError("буфер out должен быть непрерывным")
+    # Плоское представление буфера (для матриц - без копирования)
+    flat = out.reshape(-1)
+    if flat.dtype.kind not in 'iuf':
+        raise ValueError(f"неподдерживаемый тип: {flat.dtype}")
+
+    bounds = [(start, min(start + chunk_size, flat.size)) for start in range(0, flat.size, chunk_size)]
+    sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    streams = sequence.spawn(len(bounds))
+
+    def fill(index):
+        start, end = bounds[index]
+        rng = np.random.Generator(np.random.PCG64(streams[index]))
+        block = flat[start:end]
+        if block.dtype.kind == 'f':
+            # Равномерное [0, 1) прямо в буфер и масштабирование на месте
+            if block.dtype in (np.float32, np.float64):
+                rng.random(out=block, dtype=block.dtype)
+            else:
+                block[...] = rng.random(len(block))
+            block *= max_val - min_val
+            block += min_val
+        else:
+            block[...] = rng.integers(min_val, max_val, size=len(block),
+                                      dtype=block.dtype, endpoint=True)
+
+    if workers == 1 or len(bounds) <= 1:
+        for index in range(len(bounds)):
+            fill(index)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() - чтобы исключения из потоков дошли до вызывающего кода
+            list(pool.map(fill, range(len(bounds))))
+
+    return out
+
+
+def generate_matrix(rows=None, cols=None, min_val=0, max_val=100, dtype='int64', seed=None,
+                    out=None, workers=1, chunk_size=DEFAULT_GENERATE_CHUNK):
+    """
+    Генерация матрицы случайных чисел на numpy.random.Generator.
+
+    Матрица заполняется как плоский массив той же процедурой, что и
+    generate_array (параметры совпадают).
+
+    Параметры:
+    ----------
+    rows, cols : int or None
+        Размер матрицы (не нужен, если задан out)
+    out : numpy.ndarray or None
+        Заранее выделенная непрерывная матрица
+
+    Возвращает:
+    -----------
+    numpy.ndarray
+        Матрица rows×cols
+    """
+    if np is None:
+        raise ValueError("генерация матриц требует NumPy")
+    if out is None:
+        if rows is None or cols is None:
+            raise ValueError("нужно указать rows и cols или out")
+        out = np.empty((rows, cols), dtype=dtype)
+    elif out.ndim != 2:
+        raise ValueError("буфер out должен быть двумерным")
+    return generate_array(min_val=min_val, max_val=max_val, seed=seed, out=out,
+                          workers=workers, chunk_size=chunk_size)
+
+
+def read_numbers(source, dtype='int64', count=None, out=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Потоковое чтение чисел, разделенных пробельными символами.
+
+    Источник читается блоками по chunk_size байт; незавершенное число
+    в конце блока переносится в следующий. Каждый блок разбирается одним
+    вызовом numpy.fromstring прямо в типизированный массив.
+
+    Параметры:
+    ----------
+    source : str, file object or None
+        Путь к файлу, открытый файл (текстовый или двоичный) или
+        None / "-" для стандартного ввода
+    dtype : str or numpy.dtype
+        Тип элементов результата
+    count : int or None
+        Ожидаемое число элементов: массив выделяется сразу нужного размера
+    out : numpy.ndarray or None
+        Заранее выделенный одномерный массив для результата
+    chunk_size : int
+        Размер блока чтения в байтах
+
+    Возвращает:
+    -----------
+    numpy.ndarray or array.array
+        Прочитанные числа (срез out, если он передан). Без NumPy -
+        array.array для типов int64, int32, float64, float32
+
+    Исключения:
+    -----------
+    ValueError
+        Если встречено не число, чисел больше емкости out или count
+    """
+    if chunk_size <= 0:
+        raise ValueError("размер блока должен быть положительным")
+
+    stream, close = _open_binary(source)
+    try:
+        if np is None:
+            return _read_numbers_python(stream, str(dtype), chunk_size)
+
+        dtype = np.dtype(dtype)
+        if out is not None:
+            if out.ndim != 1:
+                raise ValueError("массив out должен быть одномерным")
+            buffer, fixed = out, True
+        elif count is not None:
+            buffer, fixed = np.empty(count, dtype=dtype), True
+        else:
+            buffer, fixed = np.empty(_INITIAL_CAPACITY, dtype=dtype), False
+
+        filled = 0
+        for chunk in _iter_chunks(stream, chunk_size):
+            values = _parse_chunk(chunk, buffer.dtype)
+            end = filled + len(values)
+            if end > len(buffer):
+                if fixed:
+                    raise ValueError(f"чисел больше, чем ожидалось ({len(buffer)})")
+                # Удвоение емкости - амортизированно O(1) на элемент
+                grown = np.empty(max(end, 2 * len(buffer)), dtype=buffer.dtype)
+                grown[:filled] = buffer[:filled]
+                buffer = grown
+            buffer[filled:end] = values
+            filled = end
+
+        return buffer[:filled]
+    finally:
+        if close:
+            stream.close()
+
+
+def iter_numbers(source, dtype='int64', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Потоковое чтение чисел блоками без накопления всего файла.
+
+    Параметры:
+    ----------
+    source : str, file object or None
+        Путь к файлу, открытый файл или None / "-" для стандартного ввода
+    dtype : str or numpy.dtype
+        Тип элементов
+    chunk_size : int
+        Размер блока чтения в байтах
+
+    Возвращает:
+    -----------
+    generator
+        Непустые массивы numpy.ndarray - числа очередного блока
+
+    Исключения:
+    -----------
+    ValueError
+        Если встречено не число или NumPy не установлен
+    """
+    if chunk_size <= 0:
+        raise ValueError("размер блока должен быть положительным")
+    if np is None:
+        raise ValueError("чтение блоками требует NumPy")
+    dtype = np.dtype(dtype)
+
+    stream, close = _open_binary(source)
+    try:
+        for chunk in _iter_chunks(stream, chunk_size):
+            values = _parse_chunk(chunk, dtype)
+            if len(values):
+                yield values
+    finally:
+        if close:
+            stream.close()
+
+
+def read_matrix(source, cols=None, dtype='float64', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Потоковое чтение матрицы: по строке файла на строку матрицы.
+
+    Файл читается блоками, разрезанными по концам строк; число чисел в
+    каждой строке блока подсчитывается векторно и сверяется с cols.
+
+    Параметры:
+    ----------
+    source : str
+        Путь к файлу
+    cols : int or None
+        Число столбцов (None - по первой непустой строке файла)
+    dtype : str or numpy.dtype
+        Тип элементов
+    chunk_size : int
+        Размер блока чтения в байтах
+
+    Возвращает:
+    -----------
+    numpy.ndarray or list
+        Матрица rows×cols (без NumPy - список строк)
+
+    Исключения:
+    -----------
+    ValueError
+        Если матрица пустая, в какой-либо строке число элементов
+        отличается от числа столбцов или встречено не число
+    """
+    if chunk_size <= 0:
+        raise ValueError("размер блока должен быть положительным")
+    if cols is None:
+        with open(source, 'rb') as f:
+            cols = next((len(line.split()) for line in f if line.strip()), 0)
+    if cols <= 0:
+        raise ValueError("матрица не должна быть пустой")
+
+    if np is None:
+        return _read_matrix_python(source, cols, str(dtype))
+
+    dtype = np.dtype(dtype)
+    parts = []
+    line = 0
+    with open(source, 'rb') as f:
+        for chunk in _iter_chunks(f, chunk_size, separators=b'\n'):
+            counts = _line_token_counts(chunk)
+            bad = np.flatnonzero((counts != 0) & (counts != cols))
+            if bad.size:
+                raise ValueError(f"строка {line + int(bad[0]) + 1}: ожидается чисел {cols}, "
+                                 f"получено {int(counts[bad[0]])}")
+            line += len(counts)
+            parts.append(_parse_chunk(chunk, dtype))
+
+    values = np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+    if not len(values):
+        raise ValueError("матрица не должна быть пустой")
+    return values.reshape(-1, cols)
+
+
+def _read_matrix_python(source, cols, dtype):
+    """Построчное чтение матрицы без NumPy."""
+    if dtype not in _ARRAY_TYPECODES:
+        raise ValueError(f"без NumPy поддерживаются типы: {', '.join(_ARRAY_TYPECODES)}")
+    convert = float if dtype.startswith('float') else int
+    matrix = []
+    with open(source, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            tokens = line.split()
+            if not tokens:
+                continue
+            if len(tokens) != cols:
+                raise ValueError(f"строка {line_number}: ожидается чисел {cols}, получено {len(tokens)}")
+            matrix.append([convert(token) for token in tokens])
+    if not matrix:
+        raise ValueError("матрица не должна быть пустой")
+    return matrix
+
+
+def _line_token_counts(chunk):
+    """
+    Число чисел в каждой строке блока (пустые строки - 0).
+
+    Пробельными считаются все байты не больше b' ': прочие управляющие
+    символы все равно не пройдут разбор чисел.
+    """
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    blank = data <= 0x20
+    # Начало числа - непробельный байт после пробельного или в начале блока
+    starts = np.flatnonzero(blank[:-1] > blank[1:]) + 1
+    if not blank[0]:
+        starts = np.concatenate(([0], starts))
+    ends = np.flatnonzero(data == 0x0A) + 1
+    if not ends.size or ends[-1] != data.size:
+        ends = np.append(ends, data.size)
+    return np.diff(np.searchsorted(starts, ends), prepend=0)
+
+
+def _open_binary(source):
+    """Двоичный поток для источника и признак, нужно ли его закрыть."""
+    if source is None or source == '-':
+        return sys.stdin.buffer, False
+    if isinstance(source, str):
+        return open(source, 'rb'), True
+    # Текстовый файл - читаем его двоичный буфер
+    return getattr(source, 'buffer', source), False
+
+
+def _iter_chunks(stream, chunk_size, separators=_WHITESPACE):
+    """
+    Блоки потока, разрезанные по разделителям (по умолчанию - пробельным
+    символам).
+
+    Хвост блока после последнего разделителя (возможно, незавершенное
+    число или строка) переносится в начало следующего блока.
+    """
+    tail = b''
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        if isinstance(data, str):
+            # Текстовый поток без двоичного буфера (например, io.StringIO)
+            data = data.encode()
+        data = tail + data
+        if len(separators) == 1:
+            cut = data.rfind(separators) + 1
+        else:
+            cut = len(data)
+            while cut and data[cut - 1] not in separators:
+                cut -= 1
+        if cut == 0:
+            # В блоке нет разделителей - число продолжается дальше
+            tail = data
+            continue
+        tail = data[cut:]
+        yield data[:cut]
+    if tail:
+        yield tail
+
+
+def _parse_chunk(chunk, dtype):
+    """
+    Разбор блока чисел одним вызовом numpy.fromstring.
+
+    fromstring не сообщает о переполнении целых (значение насыщается до
+    границы int64, а узкие типы обрезаются) и читает одинокий знак "-"
+    как 0 или склеивает его со следующим числом. Поэтому целые
+    разбираются в 64-битный тип, а сомнительный блок - с числами на
+    границе типа или со знаком без цифр - и блок, который NumPy не
+    разобрал, повторно разбираются точно через int()/float().
+
+    Блок из одних пробелов NumPy разбирает как [0], поэтому он пропускается.
+    """
+    if not chunk.strip():
+        return np.empty(0, dtype=dtype)
+    integer = dtype.kind in 'iu'
+    wide = np.dtype(np.uint64 if dtype == np.uint64 else np.int64) if integer else dtype
+    with warnings.catch_warnings():
+        # Старые версии NumPy сообщают о нечисловых данных предупреждением
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            values = np.fromstring(chunk, dtype=wide, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return _parse_chunk_exact(chunk, dtype)
+
+    if integer:
+        limits, target = np.iinfo(wide), np.iinfo(dtype)
+        low, high = values.min(), values.max()
+        if (high == limits.max or (limits.min and low == limits.min)
+                or low < target.min or high > target.max or _has_bare_sign(chunk)):
+            return _parse_chunk_exact(chunk, dtype)
+        values = values.astype(dtype, copy=False)
+    return values
+
+
+def _has_bare_sign(chunk):
+    """
+    Есть ли в блоке знак без цифр.
+
+    Знак перед пробельным символом (все они не больше b' ') ищется
+    векторно; "+" в целых редок, и блок с ним считается сомнительным
+    целиком.
+    """
+    if b'+' in chunk:
+        return True
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    return bool(data[-1] == 0x2D or ((data[:-1] == 0x2D) & (data[1:] <= 0x20)).any())
+
+
+def _parse_chunk_exact(chunk, dtype):
+    """
+    Точный разбор блока через int()/float() с проверкой диапазона типа.
+
+    Исключения:
+    -----------
+    ValueError
+        Если встречено не число или целое не помещается в dtype
+    """
+    convert = int if dtype.kind in 'iu' else float
+    values = []
+    for token in chunk.split():
+        try:
+            values.append(convert(token))
+        except ValueError:
+            raise ValueError(f"во входных данных встречено не число: "
+                             f"{token.decode(errors='replace')!r}") from None
+    if convert is int:
+        limits = np.iinfo(dtype)
+        for value in (min(values), max(values)):
+            if not limits.min <= value <= limits.max:
+                raise ValueError(f"число {value} не помещается в тип {dtype}")
+    return np.array(values, dtype=dtype)
+
+
+def _read_numbers_python(stream, dtype, chunk_size):
+    """Потоковое чтение без NumPy в array.array."""
+    typecode = _ARRAY_TYPECODES.get(dtype)
+    if typecode is None:
+        raise ValueError(f"без NumPy поддерживаются типы: {', '.join(_ARRAY_TYPECODES)}")
+    convert = float if typecode in 'df' else int
+    result = array.array(typecode)
+    for chunk in _iter_chunks(stream, chunk_size):
+        try:
+            result.extend(convert(token) for token in chunk.split())
+        except OverflowError:
+            raise ValueError(f"число не помещается в тип {dtype}") from None
+    return result
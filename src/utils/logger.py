@@ -4,16 +4,319 @@
 
 Настройка и конфигурация системы логирования для всего приложения.
 Поддерживает запись в файл и консоль с различными уровнями логирования.
+
+Асинхронный режим (async_mode=True): вызывающий поток только подставляет
+аргументы в текст сообщения (урезанный до бюджета) и кладет запись в
+ограниченную очередь (QueueHandler), а оформление строк и запись в
+консоль/файл выполняет фоновый поток (QueueListener). При переполнении
+очереди действует политика overflow:
+- "block"       - ждать свободного места (ни одна запись не теряется)
+- "drop-oldest" - вытеснить самую старую запись
+- "drop-new"    - отбросить новую запись
+При завершении программы очередь дописывается до конца.
+
+Импорт модуля не создает обработчиков и файлов: логгер приложения
+получает лишь заглушку, которая при первой выведенной записи вызывает
+configure() с настройками по умолчанию (или логирование настраивается
+явно через configure()/setup_logging() до первого сообщения).
+
+Профилирование (enable_profiling()): функции, обернутые FunctionLogger,
+дополнительно замеряют время вызова (perf_counter_ns), число вызовов
+и, по желанию, пиковый прирост памяти (tracemalloc). Замеры копятся в
+памяти (profiler), отчет с перцентилями выдает dump_stats().
+
+Структурированный вывод (log_format="json"): файл логов пишется по
+одному JSON-объекту на строку с полями function, phase (call/return/
+error), task, duration_ms и arg_sizes для записей FunctionLogger.
+С buffered=True файл пишется пачками - по заполнении буфера,
+по истечении интервала или сразу для записей уровня ERROR и выше.
 """
 
+import atexit
+import contextvars
+import copy
+import functools
+import itertools
+import json
 import logging
+import queue
+import reprlib
 import sys
 import os
+import threading
+import time
+import tracemalloc
+from array import array
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Политики переполнения очереди асинхронного логирования
+OVERFLOW_POLICIES = ('block', 'drop-oldest', 'drop-new')
+
+# Бюджет длины представления аргументов в сообщениях FunctionLogger (символов)
+DEFAULT_REPR_BUDGET = 200
+
+# Бюджет длины сообщения, форматируемого при постановке в очередь (символов)
+DEFAULT_MESSAGE_BUDGET = 4 * DEFAULT_REPR_BUDGET
+
+# Имя логгера приложения
+APP_LOGGER_NAME = 'ascending_design_app'
+
+# Форматы файла логов
+LOG_FORMATS = ('text', 'json')
+
+# Размер пачки и интервал сброса буферизованного файла логов
+DEFAULT_BUFFER_CAPACITY = 256
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Номер текущего задания для структурированных записей
+_task_id = contextvars.ContextVar('task_id', default=None)
+
+# Число хранимых замеров времени на функцию (старые вытесняются по кругу)
+DEFAULT_PROFILE_SAMPLES = 10000
+
+# Фоновый обработчик очереди (если включен асинхронный режим)
+_queue_listener = None
+
+# Выполнена ли настройка обработчиков (явно или при первом сообщении)
+_configured = False
+_configure_lock = threading.Lock()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Обработчик, передающий записи в ограниченную очередь.
+
+    Атрибуты:
+    ---------
+    overflow : str
+        Политика переполнения ("block", "drop-oldest", "drop-new")
+    repr_budget : int
+        Максимальная длина сообщения, подставленного при постановке в очередь
+    dropped : int
+        Число записей, потерянных из-за переполнения
+    """
+
+    def __init__(self, log_queue, overflow='block', repr_budget=DEFAULT_MESSAGE_BUDGET):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.repr_budget = repr_budget
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record):
+        if self.overflow == 'block':
+            self.queue.put(record)
+            return
+
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                # Записи ставятся в очередь из многих потоков
+                with self._dropped_lock:
+                    self.dropped += 1
+                if self.overflow == 'drop-new':
+                    return
+            # drop-oldest: освобождаем место, вынимая самую старую запись
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+
+    def prepare(self, record):
+        # Как в QueueHandler: аргументы подставляются сразу, пока их не
+        # изменил вызывающий код, а args и exc_info очищаются, чтобы запись
+        # в очереди не удерживала объекты аргументов и кадры стека.
+        # Текст исключения сохраняется в exc_text для обработчиков
+        message = record.getMessage()
+        if len(message) > self.repr_budget:
+            message = message[:max(self.repr_budget - 3, 0)] + '...'
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+# Форматирование исключений при постановке записи в очередь
+_exception_formatter = logging.Formatter()
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener, который при остановке дожидается места для маркера конца."""
+
+    def enqueue_sentinel(self):
+        # put_nowait из базового класса теряет маркер при полной очереди
+        self.queue.put(self._sentinel)
 
 
-def setup_logging(log_level=logging.INFO, log_to_file=True, max_file_size=1024 * 1024, backup_count=5):
+class JsonFormatter(logging.Formatter):
+    """
+    Форматирование записи в одну строку JSON.
+
+    Поля: time, level, logger, message; для записей FunctionLogger также
+    function, phase, duration_ms, arg_sizes; task - номер задания,
+    записанный в запись фильтром TaskFilter при ее создании. Поля без
+    значения не выводятся.
+    """
+
+    _FIELDS = ('function', 'phase', 'duration_ms', 'arg_sizes')
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, self.datefmt),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for field in self._FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        task = getattr(record, 'task', None)
+        if task is not None:
+            entry['task'] = task
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TaskFilter(logging.Filter):
+    """
+    Запись номера текущего задания (set_task_id) в поле task.
+
+    Стоит на обработчиках логгера приложения и срабатывает в потоке,
+    создавшем запись: в асинхронном режиме форматирование идет в фоновом
+    потоке, где номера задания в контексте нет.
+    """
+
+    def filter(self, record):
+        if getattr(record, 'task', None) is None:
+            record.task = _task_id.get()
+        return True
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Файловый обработчик с ротацией, пишущий записи пачками.
+
+    Отформатированные записи копятся в памяти и пишутся одним вызовом
+    write/flush, когда набирается capacity записей, проходит
+    flush_interval секунд (проверяется при записи и фоновым потоком)
+    или приходит запись уровня flush_level и выше. Ротация проверяется
+    для пачки целиком.
+
+    Атрибуты:
+    ---------
+    capacity : int
+        Число записей в пачке
+    flush_interval : float
+        Максимальное время хранения записей в буфере (секунды)
+    """
+
+    def __init__(self, filename, capacity=DEFAULT_BUFFER_CAPACITY, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 flush_level=logging.ERROR, **kwargs):
+        if capacity <= 0:
+            raise ValueError("размер пачки должен быть положительным")
+        if flush_interval <= 0:
+            raise ValueError("интервал сброса должен быть положительным")
+        super().__init__(filename, **kwargs)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True,
+                                         name='log-flusher')
+        self._flusher.start()
+
+    def emit(self, record):
+        try:
+            self._buffer.append(self.format(record))
+            if (len(self._buffer) >= self.capacity or record.levelno >= self.flush_level
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._write_batch()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._write_batch()
+        finally:
+            self.release()
+
+    def close(self):
+        self._stop.set()
+        self.flush()
+        super().close()
+
+    def _write_batch(self):
+        """Запись накопленной пачки (вызывается под блокировкой обработчика)."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        text = self.terminator.join(self._buffer) + self.terminator
+        self._buffer.clear()
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            size = len(text.encode(self.encoding or 'utf-8'))
+            if self.stream.tell() and self.stream.tell() + size > self.maxBytes:
+                self.doRollover()
+        self.stream.write(text)
+        self.stream.flush()
+
+    def _flush_periodically(self):
+        """Фоновый сброс буфера, если записи не поступают."""
+        while not self._stop.wait(self.flush_interval):
+            if self._buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+
+def set_task_id(task):
+    """
+    Установка номера текущего задания для структурированных записей.
+
+    Параметры:
+    ----------
+    task : int or None
+        Номер задания (None - не указан)
+    """
+    _task_id.set(task)
+
+
+def shutdown_logging():
+    """
+    Остановка асинхронного логирования.
+
+    Дописывает все записи из очереди в обработчики и останавливает
+    фоновый поток. Вызывается автоматически при завершении программы.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.flush()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def setup_logging(log_level=logging.INFO, log_to_file=True, max_file_size=1024 * 1024, backup_count=5,
+                  async_mode=False, queue_size=10000, overflow='block', log_format='text',
+                  buffered=False, buffer_capacity=DEFAULT_BUFFER_CAPACITY,
+                  flush_interval=DEFAULT_FLUSH_INTERVAL):
     """
     Настройка системы логирования.
 
@@ -27,18 +330,52 @@ def setup_logging(log_level=logging.INFO, log_to_file=True, max_file_size=1024 *
         Максимальный размер лог-файла в байтах (по умолчанию 1MB)
     backup_count : int
         Количество резервных копий лог-файлов
+    async_mode : bool
+        Писать логи в фоновом потоке через очередь (по умолчанию False)
+    queue_size : int
+        Максимальное число записей в очереди асинхронного режима
+    overflow : str
+        Политика переполнения очереди: "block", "drop-oldest", "drop-new"
+    log_format : str
+        Формат файла логов: "text" или "json" (консоль всегда текстовая)
+    buffered : bool
+        Писать файл логов пачками (BufferedRotatingFileHandler)
+    buffer_capacity : int
+        Число записей в пачке буферизованного файла
+    flush_interval : float
+        Максимальная задержка записи пачки (секунды)
 
     Возвращает:
     -----------
     logging.Logger
         Сконфигурированный логгер
     """
+    global _queue_listener, _configured
+
+    if overflow not in OVERFLOW_POLICIES:
+        raise ValueError(f"неизвестная политика переполнения: {overflow}")
+    if queue_size <= 0:
+        raise ValueError("размер очереди должен быть положительным")
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"неизвестный формат логов: {log_format}")
+
     # Создаем логгер для приложения
-    logger = logging.getLogger('ascending_design_app')
+    logger = logging.getLogger(APP_LOGGER_NAME)
     logger.setLevel(log_level)
 
-    # Очищаем существующие обработчики (чтобы не дублировались)
-    logger.handlers.clear()
+    # Останавливаем прежний фоновый поток и заменяем список обработчиков
+    # новым (чтобы не дублировались; прежний список может в этот момент
+    # обходиться, если настройку вызвала заглушка при первом сообщении).
+    # Прежние обработчики закрываются: буфер дописывается, файл и поток
+    # сброса освобождаются
+    old_handlers = list(logger.handlers)
+    if _queue_listener is not None:
+        old_handlers.extend(_queue_listener.handlers)
+    shutdown_logging()
+    logger.handlers = []
+    for handler in old_handlers:
+        handler.close()
+    _configured = True
 
     # Формат для сообщений
     formatter = logging.Formatter(
@@ -62,16 +399,47 @@ def setup_logging(log_level=logging.INFO, log_to_file=True, max_file_size=1024 *
         log_filename = f"{log_dir}/app_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 
         # Ротация логов (автоматическое создание новых файлов при достижении размера)
-        file_handler = RotatingFileHandler(
-            log_filename,
-            maxBytes=max_file_size,
-            backupCount=backup_count,
-            encoding='utf-8'
-        )
+        if buffered:
+            file_handler = BufferedRotatingFileHandler(
+                log_filename,
+                capacity=buffer_capacity,
+                flush_interval=flush_interval,
+                maxBytes=max_file_size,
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
+        else:
+            file_handler = RotatingFileHandler(
+                log_filename,
+                maxBytes=max_file_size,
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
         file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
+        if log_format == 'json':
+            file_handler.setFormatter(JsonFormatter(datefmt='%Y-%m-%dT%H:%M:%S'))
+        else:
+            file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
+    # 3. Асинхронный режим: обработчики переносятся в фоновый поток
+    if async_mode:
+        handlers = logger.handlers
+        logger.handlers = []
+
+        queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), overflow)
+        queue_handler.setLevel(log_level)
+        logger.addHandler(queue_handler)
+
+        _queue_listener = _DrainingQueueListener(queue_handler.queue, *handlers,
+                                                 respect_handler_level=True)
+        _queue_listener.start()
+
+    # Номер задания берется в потоке, создавшем запись
+    for handler in logger.handlers:
+        handler.addFilter(TaskFilter())
+
+    if log_to_file:
         logger.info(f"Логирование в файл: {log_filename}")
 
     logger.info(f"Система логирования инициализирована с уровнем {logging.getLevelName(log_level)}")
@@ -93,25 +461,342 @@ def get_logger(name=None):
         Запрошенный логгер
     """
     if name:
-        return logging.getLogger(f'ascending_design_app.{name}')
-    return logging.getLogger('ascending_design_app')
+        return logging.getLogger(f'{APP_LOGGER_NAME}.{name}')
+    return logging.getLogger(APP_LOGGER_NAME)
 
 
-# Создаем глобальный логгер по умолчанию
-app_logger = setup_logging()
+def configure(**options):
+    """
+    Явная настройка логирования.
+
+    Без параметров настраивает логирование по умолчанию, если это еще
+    не сделано; с параметрами - перенастраивает (см. setup_logging).
+
+    Параметры:
+    ----------
+    **options
+        Параметры setup_logging (log_level, log_to_file, async_mode, ...)
+
+    Возвращает:
+    -----------
+    logging.Logger
+        Логгер приложения
+    """
+    with _configure_lock:
+        if options or not _configured:
+            return setup_logging(**options)
+    return get_logger()
+
+
+def is_configured():
+    """Настроены ли обработчики логирования."""
+    return _configured
+
+
+class _LazySetupHandler(logging.Handler):
+    """
+    Заглушка логгера приложения до настройки.
+
+    Первая дошедшая до нее запись вызывает configure() с уровнем
+    логгера и передается уже настроенным обработчикам.
+    """
+
+    def handle(self, record):
+        logger = get_logger()
+        with _configure_lock:
+            if not _configured:
+                setup_logging(log_level=logger.level or logging.INFO)
+        for handler in logger.handlers:
+            if handler is not self and record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):
+        pass
+
+
+# Глобальный логгер по умолчанию: обработчики создаются при первом
+# сообщении или явном вызове configure()
+app_logger = get_logger()
+app_logger.setLevel(logging.INFO)
+app_logger.addHandler(_LazySetupHandler())
+
+
+class _TruncatedRepr:
+    """
+    Отложенное представление аргумента для сообщения лога.
+
+    repr строится только при форматировании записи (то есть только если
+    она действительно выводится) и ограничивается бюджетом символов:
+    большие коллекции обходятся через reprlib лишь частично.
+    """
+
+    __slots__ = ('value', 'budget')
+
+    def __init__(self, value, budget):
+        self.value = value
+        self.budget = budget
+
+    def __str__(self):
+        text = _bounded_repr(self.budget).repr(self.value)
+        if len(text) > self.budget:
+            text = text[:max(self.budget - 3, 0)] + '...'
+        return text
+
+
+def _bounded_repr(budget):
+    """Экземпляр reprlib.Repr, ограничивающий число элементов под бюджет."""
+    limiter = reprlib.Repr()
+    items = max(budget // 4, 1)
+    limiter.maxlist = limiter.maxtuple = limiter.maxset = limiter.maxfrozenset = items
+    limiter.maxdeque = limiter.maxarray = limiter.maxdict = items
+    limiter.maxstring = limiter.maxother = limiter.maxlong = max(budget, 8)
+    return limiter
+
+
+class _FunctionStats:
+    """
+    Накопленные замеры одной функции.
+
+    Время хранится кольцевым буфером array('q') последних max_samples
+    вызовов (для перцентилей); число вызовов, ошибок и суммарное время
+    учитываются по всем вызовам.
+    """
+
+    __slots__ = ('calls', 'errors', 'total_ns', 'samples', 'max_samples', 'peak_bytes')
+
+    def __init__(self, max_samples):
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.samples = array('q')
+        self.max_samples = max_samples
+        self.peak_bytes = None
+
+    def add(self, elapsed_ns, peak_bytes=None):
+        if len(self.samples) < self.max_samples:
+            self.samples.append(elapsed_ns)
+        else:
+            self.samples[self.calls % self.max_samples] = elapsed_ns
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if peak_bytes is not None and (self.peak_bytes is None or peak_bytes > self.peak_bytes):
+            self.peak_bytes = peak_bytes
+
+    def percentile(self, q):
+        """Перцентиль времени (нс) по хранимым замерам, метод ближайшего ранга."""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return 0
+        rank = max(1, -(-len(ordered) * q // 100))
+        return ordered[int(rank) - 1]
+
+
+class ProfileRegistry:
+    """
+    Реестр замеров функций, обернутых FunctionLogger.
+
+    Атрибуты:
+    ---------
+    enabled : bool
+        Включено ли профилирование для всех оберток
+    memory : bool
+        Замерять ли пиковую память через tracemalloc (заметно медленнее).
+        Память трассируется на весь процесс, поэтому пик вызова включает
+        и то, что одновременно выделяли другие потоки
+    max_samples : int
+        Число хранимых замеров времени на функцию
+    """
+
+    def __init__(self, max_samples=DEFAULT_PROFILE_SAMPLES):
+        self.enabled = False
+        self.memory = False
+        self.max_samples = max_samples
+        self._stats = {}
+        self._lock = threading.Lock()
+        # Открытые замеры памяти всех потоков: номер → [память на входе, пик]
+        self._frames = {}
+        self._frame_ids = itertools.count()
+        self._memory_lock = threading.Lock()
+
+    def measure(self, name, func, args, kwargs):
+        """Вызов func с замером времени (и памяти) под именем name."""
+        stats = self._stats.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(name, _FunctionStats(self.max_samples))
+
+        track_memory = self.memory and tracemalloc.is_tracing()
+        if track_memory:
+            frame = self._push_frame()
+        start = time.perf_counter_ns()
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            peak = self._pop_frame(frame) if track_memory else None
+            # Обертки вызываются из пулов потоков - счетчики меняются под блокировкой
+            with self._lock:
+                stats.errors += failed
+                stats.add(elapsed, peak)
+
+    def _push_frame(self):
+        """
+        Начало замера памяти вызова.
+
+        Пик tracemalloc один на процесс, а каждый замер сбрасывает его на
+        входе. Перед сбросом текущий пик переносится во все открытые кадры
+        (вложенных вызовов и других потоков), поэтому сброс не теряет их
+        пики.
+        """
+        with self._memory_lock:
+            current, peak = tracemalloc.get_traced_memory()
+            for frame in self._frames.values():
+                frame[1] = max(frame[1], peak)
+            tracemalloc.reset_peak()
+            frame_id = next(self._frame_ids)
+            self._frames[frame_id] = [current, current]
+        return frame_id
+
+    def _pop_frame(self, frame_id):
+        """Конец замера памяти: прирост пика относительно входа (байт)."""
+        with self._memory_lock:
+            _, peak = tracemalloc.get_traced_memory()
+            start, frame_peak = self._frames.pop(frame_id)
+        return max(peak, frame_peak) - start
+
+    def stats(self):
+        """
+        Сводка по функциям.
+
+        Возвращает:
+        -----------
+        dict
+            Имя → {'calls', 'errors', 'total_ms', 'p50_ms', 'p95_ms',
+            'p99_ms', 'peak_kb'} (peak_kb - None без замера памяти)
+        """
+        summary = {}
+        with self._lock:
+            for name, stats in self._stats.items():
+                if not stats.calls:
+                    continue  # первый вызов еще выполняется
+                summary[name] = {
+                    'calls': stats.calls,
+                    'errors': stats.errors,
+                    'total_ms': stats.total_ns / 1e6,
+                    'p50_ms': stats.percentile(50) / 1e6,
+                    'p95_ms': stats.percentile(95) / 1e6,
+                    'p99_ms': stats.percentile(99) / 1e6,
+                    'peak_kb': None if stats.peak_bytes is None else stats.peak_bytes / 1024,
+                }
+        return summary
+
+    def reset(self):
+        """Очистка всех замеров."""
+        with self._lock:
+            self._stats.clear()
+
+
+# Глобальный реестр профилирования
+profiler = ProfileRegistry()
+
+# Запущена ли трассировка tracemalloc функцией enable_profiling()
+_started_tracing = False
+
+
+def enable_profiling(memory=False):
+    """
+    Включение профилирования всех функций с FunctionLogger.
+
+    Параметры:
+    ----------
+    memory : bool
+        Замерять ли пиковый прирост памяти через tracemalloc
+        (запускает трассировку, если она еще не запущена)
+    """
+    global _started_tracing
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    profiler.memory = memory
+    profiler.enabled = True
+
+
+def disable_profiling():
+    """
+    Выключение профилирования (накопленные замеры сохраняются).
+
+    Трассировка tracemalloc останавливается, только если ее запустил
+    enable_profiling().
+    """
+    global _started_tracing
+    profiler.enabled = False
+    if _started_tracing and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _started_tracing = False
+    profiler.memory = False
+
+
+def reset_stats():
+    """Очистка накопленных замеров профилирования."""
+    profiler.reset()
+
+
+def dump_stats(stream=None):
+    """
+    Отчет профилирования: вызовы, ошибки, суммарное время и перцентили.
+
+    Параметры:
+    ----------
+    stream : file-like or None
+        Куда дополнительно записать отчет
+
+    Возвращает:
+    -----------
+    str
+        Текст отчета (функции по убыванию суммарного времени)
+    """
+    summary = profiler.stats()
+    if not summary:
+        report = "Нет данных профилирования"
+    else:
+        width = max(len('функция'), *(len(name) for name in summary))
+        lines = [f"{'функция':<{width}} {'вызовы':>8} {'ошибки':>7} {'всего, мс':>11} "
+                 f"{'p50, мс':>9} {'p95, мс':>9} {'p99, мс':>9} {'пик, КБ':>9}"]
+        for name, row in sorted(summary.items(), key=lambda item: -item[1]['total_ms']):
+            peak = '-' if row['peak_kb'] is None else f"{row['peak_kb']:.1f}"
+            lines.append(f"{name:<{width}} {row['calls']:>8} {row['errors']:>7} {row['total_ms']:>11.3f} "
+                         f"{row['p50_ms']:>9.3f} {row['p95_ms']:>9.3f} {row['p99_ms']:>9.3f} {peak:>9}")
+        report = '\n'.join(lines)
+    if stream is not None:
+        stream.write(report + '\n')
+    return report
 
 
 class FunctionLogger:
     """
     Декоратор для логирования вызовов функций.
 
+    Если уровень сообщений декоратора выключен (например, логгер
+    переведен на CRITICAL), обертка сразу вызывает функцию - аргументы
+    не форматируются. Включенные сообщения используют %-форматирование
+    с отложенным repr аргументов, урезанным до repr_budget символов.
+    При включенном профилировании (или profile=True) каждый вызов
+    замеряется в реестре profiler под именем функции; в замер входит
+    только сама функция, без записи сообщений лога.
+
     Пример использования:
     @FunctionLogger()
     def my_function(arg1, arg2):
         return arg1 + arg2
     """
 
-    def __init__(self, logger_name=None, level=logging.INFO):
+    def __init__(self, logger_name=None, level=logging.INFO, repr_budget=DEFAULT_REPR_BUDGET,
+                 profile=None):
         """
         Инициализация декоратора логирования.
 
@@ -121,46 +806,92 @@ class FunctionLogger:
             Имя логгера (если None, используется корневой)
         level : int
             Уровень логирования для сообщений
+        repr_budget : int
+            Максимальная длина представления аргументов в символах
+        profile : bool or None
+            Профилировать всегда (True), никогда (False) или по
+            глобальному переключателю enable_profiling() (None)
         """
         self.logger = get_logger(logger_name)
         self.level = level
+        self.repr_budget = repr_budget
+        self.profile = profile
 
     def __call__(self, func):
+        logger = self.logger
+        level = self.level
+        budget = self.repr_budget
+        name = func.__name__
+        profile = self.profile
+
+        def call(args, kwargs):
+            if profile or (profile is None and profiler.enabled):
+                return profiler.measure(func.__qualname__, func, args, kwargs)
+            return func(*args, **kwargs)
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Логируем вызов функции
-            self.logger.log(
-                self.level,
-                f"ВЫЗОВ ФУНКЦИИ: {func.__name__} - "
-                f"аргументы: {args if len(args) <= 3 else f'{len(args)} args'}, "
-                f"ключевые слова: {kwargs if kwargs else 'нет'}"
+            # Выключенный уровень: никакой подготовки сообщений
+            if not logger.isEnabledFor(level):
+                try:
+                    return call(args, kwargs)
+                except Exception as e:
+                    _log_error(logger, name, e, None)
+                    raise
+
+            # Логируем вызов функции (форматирование - только при выводе)
+            logger.log(
+                level,
+                "ВЫЗОВ ФУНКЦИИ: %s - аргументы: %s, ключевые слова: %s",
+                name,
+                _TruncatedRepr(args, budget) if len(args) <= 3 else f'{len(args)} args',
+                _TruncatedRepr(kwargs, budget) if kwargs else 'нет',
+                extra={'function': name, 'phase': 'call', 'arg_sizes': _arg_sizes(args, kwargs)}
             )
 
+            start = time.perf_counter_ns()
             try:
                 # Выполняем функцию
-                result = func(*args, **kwargs)
-
-                # Логируем успешное выполнение
-                self.logger.log(
-                    self.level,
-                    f"ФУНКЦИЯ ВЫПОЛНЕНА: {func.__name__} - "
-                    f"результат тип: {type(result).__name__}"
-                )
-
-                return result
-
+                result = call(args, kwargs)
             except Exception as e:
                 # Логируем ошибку
-                self.logger.error(
-                    f"ОШИБКА В ФУНКЦИИ: {func.__name__} - {type(e).__name__}: {str(e)}"
-                )
+                _log_error(logger, name, e, time.perf_counter_ns() - start)
                 raise
 
-        # Сохраняем оригинальное имя и документацию
-        wrapper.__name__ = func.__name__
-        wrapper.__doc__ = func.__doc__
+            # Логируем успешное выполнение
+            logger.log(level, "ФУНКЦИЯ ВЫПОЛНЕНА: %s - результат тип: %s",
+                       name, type(result).__name__,
+                       extra={'function': name, 'phase': 'return',
+                              'duration_ms': (time.perf_counter_ns() - start) / 1e6})
+            return result
 
         return wrapper
 
 
+def _log_error(logger, name, error, elapsed_ns):
+    """Запись об ошибке в декорированной функции."""
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error("ОШИБКА В ФУНКЦИИ: %s - %s: %s", name, type(error).__name__, error,
+                     extra={'function': name, 'phase': 'error',
+                            'duration_ms': None if elapsed_ns is None else elapsed_ns / 1e6})
+
+
+def _arg_sizes(args, kwargs):
+    """Размеры аргументов (len или None для объектов без длины)."""
+    sizes = [_size(value) for value in args]
+    sizes.extend(_size(value) for value in kwargs.values())
+    return sizes
+
+
+def _size(value):
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
 # Экспорт основных функций
-__all__ = ['setup_logging', 'get_logger', 'FunctionLogger', 'app_logger']
\ No newline at end of file
+__all__ = ['setup_logging', 'configure', 'is_configured', 'shutdown_logging', 'get_logger', 'FunctionLogger',
+           'BoundedQueueHandler', 'JsonFormatter', 'TaskFilter', 'BufferedRotatingFileHandler', 'set_task_id',
+           'ProfileRegistry', 'profiler', 'enable_profiling', 'disable_profiling', 'reset_stats', 'dump_stats',
+           'app_logger']
@@ -0,0 +1,427 @@
+"""
+КЭШ РЕЗУЛЬТАТОВ
+===============
+
+Запоминание результатов алгоритмов по ключу (задание, параметры, хеш
+содержимого входов): повторное выполнение над теми же данными становится
+поиском в кэше.
+
+Уровни:
+-------
+- память: LRU с ограничением числа записей и суммарного объема
+  (оценка по nbytes массивов и размерам списков)
+- диск (необязательно): вытесненные из памяти записи сохраняются в
+  каталог через pickle и переживают перезапуск; объем каталога тоже
+  ограничен, старые файлы удаляются первыми
+
+Дисковый уровень приложения включается переменной окружения
+ADP_CACHE_DIR (каталог) или из меню настроек (result_cache.configure).
+Файлы дискового уровня читаются через pickle - каталог должен быть
+доступен на запись только владельцу.
+
+Пример:
+-------
+key = make_key(1, {'engine': 'auto'}, [arr1, arr2])
+result = result_cache.get(key)
+if result is None:
+    result = sum_arrays_special(arr1, arr2)
+    result_cache.put(key, result)
+"""
+
+import array
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+import warnings
+from collections import OrderedDict
+
+# Ограничения по умолчанию
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+DEFAULT_DISK_BUDGET = 2 * 1024 * 1024 * 1024
+
+# Переменная окружения с каталогом дискового уровня кэша приложения
+CACHE_DIR_ENV = 'ADP_CACHE_DIR'
+
+# Расширение файлов дискового уровня
+_DISK_SUFFIX = '.pkl'
+
+
+class ResultCache:
+    """
+    Двухуровневый LRU-кэш результатов.
+
+    Потокобезопасен: один кэш можно использовать из нескольких потоков.
+
+    Атрибуты:
+    ---------
+    max_entries : int
+        Наибольшее число записей в памяти
+    memory_budget : int
+        Наибольший суммарный объем записей в памяти (байт)
+    disk_dir : str or None
+        Каталог дискового уровня (None - только память)
+    disk_budget : int
+        Наибольший суммарный объем файлов дискового уровня (байт)
+    hits, misses : int
+        Число попаданий и промахов
+    disk_hits : int
+        Попадания, найденные только на диске (входят в hits)
+    evictions : int
+        Число записей, вытесненных из памяти
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, memory_budget=DEFAULT_MEMORY_BUDGET,
+                 disk_dir=None, disk_budget=DEFAULT_DISK_BUDGET):
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._disk = OrderedDict()
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.disk_dir = None
+        self.configure(max_entries, memory_budget, disk_dir, disk_budget)
+        self.reset_stats()
+
+    def configure(self, max_entries=None, memory_budget=None, disk_dir=None, disk_budget=None):
+        """
+        Изменение ограничений; лишние записи сразу вытесняются.
+
+        Параметры:
+        ----------
+        max_entries, memory_budget, disk_budget : int or None
+            Новые ограничения (None - без изменений)
+        disk_dir : str or None
+            Каталог дискового уровня ("" - отключить, None - без изменений)
+
+        Исключения:
+        -----------
+        ValueError
+            Если ограничение отрицательно
+        OSError
+            Если каталог дискового уровня нельзя создать
+        """
+        for name, value in (('max_entries', max_entries), ('memory_budget', memory_budget),
+                            ('disk_budget', disk_budget)):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} не может быть отрицательным")
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if memory_budget is not None:
+                self.memory_budget = memory_budget
+            if disk_budget is not None:
+                self.disk_budget = disk_budget
+            if disk_dir is not None:
+                if disk_dir:
+                    # Недоступный каталог не должен заменить прежние настройки
+                    os.makedirs(disk_dir, exist_ok=True)
+                self.disk_dir = disk_dir or None
+                self._disk.clear()
+                self.disk_bytes = 0
+                if self.disk_dir:
+                    self._scan_disk()
+            self._shrink()
+            self._trim_disk()
+
+    def get(self, key):
+        """
+        Поиск результата.
+
+        Параметры:
+        ----------
+        key : str
+            Ключ из make_key
+
+        Возвращает:
+        -----------
+        object or None
+            Сохраненный результат или None при промахе
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key][0]
+
+            value = self._load(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._store(key, value)
+            return value
+
+    def put(self, key, value):
+        """
+        Сохранение результата.
+
+        Результат больше бюджета памяти сразу уходит на диск (если он
+        включен). Сохраненный объект не копируется - изменять его после
+        сохранения нельзя.
+
+        Параметры:
+        ----------
+        key : str
+            Ключ из make_key
+        value : object
+            Результат (не None)
+        """
+        if value is None:
+            return
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_compute(self, key, compute):
+        """
+        Результат из кэша или вычисленный compute() и сохраненный.
+
+        Параметры:
+        ----------
+        key : str
+            Ключ из make_key
+        compute : callable
+            Вычисление результата без аргументов
+
+        Возвращает:
+        -----------
+        object
+            Результат
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self, disk=False):
+        """Очистка памяти (и дискового уровня, если disk=True)."""
+        with self._lock:
+            self._memory.clear()
+            self.memory_bytes = 0
+            if disk:
+                for key in list(self._disk):
+                    self._remove_file(key)
+
+    def reset_stats(self):
+        """Обнуление счетчиков попаданий и промахов."""
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+    def stats(self):
+        """
+        Счетчики и заполнение кэша.
+
+        Возвращает:
+        -----------
+        dict
+            hits, misses, disk_hits, evictions, hit_rate, entries,
+            memory_bytes, disk_entries, disk_bytes
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'disk_hits': self.disk_hits,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._memory),
+                'memory_bytes': self.memory_bytes,
+                'disk_entries': len(self._disk),
+                'disk_bytes': self.disk_bytes,
+            }
+
+    def _store(self, key, value):
+        """Запись в память с вытеснением (под блокировкой)."""
+        size = _nbytes(value)
+        if key in self._memory:
+            self.memory_bytes -= self._memory.pop(key)[1]
+        if size > self.memory_budget or self.max_entries == 0:
+            self._spill(key, value)
+            return
+        self._memory[key] = (value, size)
+        self.memory_bytes += size
+        self._shrink()
+
+    def _shrink(self):
+        """Вытеснение самых старых записей сверх ограничений."""
+        while self._memory and (len(self._memory) > self.max_entries
+                                or self.memory_bytes > self.memory_budget):
+            key, (value, size) = self._memory.popitem(last=False)
+            self.memory_bytes -= size
+            self.evictions += 1
+            self._spill(key, value)
+
+    def _spill(self, key, value):
+        """Сохранение записи на диск (если дисковый уровень включен)."""
+        if not self.disk_dir or key in self._disk:
+            return
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+            size = os.path.getsize(path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # Несериализуемый результат или нет места - запись просто теряется
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            return
+        self._disk[key] = size
+        self.disk_bytes += size
+        self._trim_disk()
+
+    def _trim_disk(self):
+        """Удаление самых старых файлов сверх бюджета диска."""
+        while self._disk and self.disk_bytes > self.disk_budget:
+            self._remove_file(next(iter(self._disk)))
+
+    def _load(self, key):
+        """Чтение записи с диска (None, если ее нет или файл поврежден)."""
+        if key not in self._disk:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self._remove_file(key)
+            return None
+        self._disk.move_to_end(key)
+        return value
+
+    def _remove_file(self, key):
+        """Удаление файла записи дискового уровня."""
+        self.disk_bytes -= self._disk.pop(key, 0)
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _scan_disk(self):
+        """Индекс файлов, оставшихся от прежних запусков (старые - первыми)."""
+        entries = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith(_DISK_SUFFIX) and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-len(_DISK_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self.disk_bytes += size
+
+    def _path(self, key):
+        return os.path.join(self.disk_dir, key + _DISK_SUFFIX)
+
+
+def make_key(task, params, inputs):
+    """
+    Ключ кэша по заданию, параметрам и содержимому входов.
+
+    Параметры:
+    ----------
+    task : int
+        Номер задания
+    params : dict
+        Параметры, влияющие на результат (значения - JSON-совместимые)
+    inputs : list
+        Входы (массивы NumPy, списки чисел, матрицы-списки списков)
+
+    Возвращает:
+    -----------
+    str
+        Шестнадцатеричный ключ (годится и как имя файла)
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{task}|{json.dumps(params, sort_keys=True, default=str)}".encode('utf-8'))
+    for data in inputs:
+        digest.update(b'|')
+        _update_hash(digest, data)
+    return digest.hexdigest()
+
+
+def _update_hash(digest, data):
+    """Добавление содержимого входа в хеш (с типом и размером)."""
+    if hasattr(data, 'materialize'):
+        data = data.materialize()
+    if hasattr(data, 'dtype') and hasattr(data, 'shape'):
+        # Массив NumPy: тип, размер и сырой буфер без преобразования в числа Python
+        digest.update(f"nd:{data.dtype.str}:{tuple(data.shape)}:".encode('ascii'))
+        if not data.flags.c_contiguous:
+            data = data.copy(order='C')
+        digest.update(memoryview(data).cast('B'))
+        return
+    if isinstance(data, memoryview):
+        digest.update(f"mv:{data.format}:{data.shape}:".encode('ascii'))
+        digest.update(data.cast('B') if data.c_contiguous else data.tobytes())
+        return
+
+    values = data if isinstance(data, (list, tuple)) else list(data)
+    first = values[0] if values else None
+    if isinstance(first, (list, tuple)) or getattr(first, 'ndim', 0) >= 1:
+        # Матрица: хеш по строкам
+        digest.update(f"rows:{len(values)}:".encode('ascii'))
+        for row in values:
+            _update_hash(digest, row)
+        return
+
+    types = set(map(type, values))
+    if types <= {int}:
+        try:
+            digest.update(f"q:{len(values)}:".encode('ascii'))
+            digest.update(memoryview(array.array('q', values)).cast('B'))
+            return
+        except OverflowError:
+            pass
+    elif types == {float}:
+        digest.update(f"d:{len(values)}:".encode('ascii'))
+        digest.update(memoryview(array.array('d', values)).cast('B'))
+        return
+    # Смешанные типы и длинные целые - через repr (медленнее, но точно)
+    digest.update(b"repr:" + repr(values).encode('utf-8'))
+
+
+def _nbytes(value):
+    """Оценка объема результата в памяти (байт)."""
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if hasattr(value, 'base') and hasattr(value, 'materialize'):
+        # Представление хранит ссылку на исходную матрицу
+        return _nbytes(value.base)
+    if isinstance(value, (list, tuple)):
+        size = sys.getsizeof(value)
+        if not value:
+            return size
+        if isinstance(value[0], (list, tuple)) or hasattr(value[0], 'nbytes'):
+            return size + sum(_nbytes(item) for item in value)
+        # Плоский список чисел: оценка по первому элементу
+        return size + len(value) * sys.getsizeof(value[0])
+    return sys.getsizeof(value)
+
+
+def _application_cache():
+    """Кэш приложения с дисковым уровнем из CACHE_DIR_ENV (если задан и доступен)."""
+    cache = ResultCache()
+    disk_dir = os.environ.get(CACHE_DIR_ENV)
+    if disk_dir:
+        try:
+            cache.configure(disk_dir=disk_dir)
+        except OSError as e:
+            warnings.warn(f"дисковый уровень кэша выключен: каталог {disk_dir} недоступен ({e})",
+                          RuntimeWarning)
+    return cache
+
+
+# Кэш приложения
+result_cache = _application_cache()
+
+
+__all__ = [
+    'DEFAULT_MAX_ENTRIES', 'DEFAULT_MEMORY_BUDGET', 'DEFAULT_DISK_BUDGET', 'CACHE_DIR_ENV',
+    'ResultCache', 'make_key', 'result_cache',
+]
@@ -0,0 +1,178 @@
+"""Тесты пакетного режима: запуск заданий, просмотр и генерация контейнеров."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from src.core import batch
+from src.tasks.task1 import sum_arrays_special
+from src.tasks.task8 import find_common_numbers
+from src.utils.binary_format import read_container, write_container
+
+
+def _write_text(path, rows):
+    path.write_text('\n'.join(' '.join(map(str, row)) for row in rows) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def _read_text(path):
+    with open(path, encoding='utf-8') as f:
+        return [[int(x) for x in line.split()] for line in f if line.strip()]
+
+
+def test_run_task1_text_files(tmp_path, capsys):
+    arr1, arr2 = [5, -3, 8, 1], [2, 8, 0, -4]
+    a = _write_text(tmp_path / 'a.txt', [arr1])
+    b = _write_text(tmp_path / 'b.txt', [arr2])
+    out = str(tmp_path / 'out.txt')
+    assert batch.main(['--task', '1', '--input', a, '--input', b, '--output', out]) == 0
+    assert _read_text(out) == [list(sum_arrays_special(arr1, arr2))]
+    assert 'задание 1' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('direction', ['cw', 'ccw'])
+def test_run_task3_npy_file(tmp_path, direction):
+    matrix = np.arange(12, dtype=np.int64).reshape(3, 4)
+    path = str(tmp_path / 'm.npy')
+    np.save(path, matrix)
+    out = str(tmp_path / 'r.npy')
+    args = ['--task', '3', '--input', path, '--direction', direction, '--output', out]
+    assert batch.main(args) == 0
+    expected = np.rot90(matrix, -1 if direction == 'cw' else 1)
+    assert np.load(out).tolist() == expected.tolist()
+
+
+def test_run_task8_binary_files(tmp_path):
+    arr1 = np.array([12, 5, 120, 7, 33], dtype=np.int64)
+    arr2 = np.array([21, 7, 1, 33], dtype=np.int64)
+    a, b = str(tmp_path / 'a.bin'), str(tmp_path / 'b.bin')
+    arr1.tofile(a)
+    arr2.tofile(b)
+    out = str(tmp_path / 'out.bin')
+    assert batch.main(['--task', '8', '--input', a, '--input', b, '--output', out]) == 0
+    expected = find_common_numbers(arr1.tolist(), arr2.tolist())
+    assert np.fromfile(out, dtype=np.int64).tolist() == expected
+
+
+def test_run_reports_missing_file(tmp_path, capsys):
+    missing = str(tmp_path / 'missing.txt')
+    out = str(tmp_path / 'out.txt')
+    assert batch.main(['--task', '1', '--input', missing, '--input', missing,
+                       '--output', out]) == 1
+    assert 'Ошибка' in capsys.readouterr().err
+
+
+def test_run_rejects_extra_inputs(tmp_path):
+    path = _write_text(tmp_path / 'a.txt', [[1]])
+    with pytest.raises(SystemExit):
+        batch.main(['--task', '3', '--input', path, '--input', path, '--output', path])
+
+
+def test_run_reads_and_writes_containers(tmp_path):
+    arr1, arr2 = np.array([4, 9, -2]), np.array([9, 1, 3])
+    data = str(tmp_path / 'data.adp')
+    write_container(data, {'arr1': arr1, 'arr2': arr2}, task=1)
+    out = str(tmp_path / 'result.adp')
+    assert batch.main(['--task', '1', '--input', data, '--output', out]) == 0
+    result = read_container(out)
+    assert result.task == 1
+    assert result['result'].tolist() == list(sum_arrays_special(arr1.tolist(), arr2.tolist()))
+
+
+def test_show_container(tmp_path, capsys):
+    path = str(tmp_path / 'data.adp')
+    write_container(path, {'arr1': np.arange(20), 'matrix': np.ones((2, 3))}, task=3)
+    assert batch.show_main([path, '--head', '3']) == 0
+    out = capsys.readouterr().out
+    assert 'Задание: 3' in out
+    assert 'arr1' in out and 'matrix' in out
+    assert '[0, 1, 2]' in out
+
+
+def test_show_rejects_damaged_file(tmp_path, capsys):
+    path = tmp_path / 'bad.adp'
+    path.write_bytes(b'NOPE' + bytes(60))
+    assert batch.show_main([str(path)]) == 1
+    assert 'Ошибка' in capsys.readouterr().err
+
+
+def test_show_rejects_truncated_header(tmp_path, capsys):
+    path = str(tmp_path / 'data.adp')
+    write_container(path, {'arr1': np.arange(20)}, task=1)
+    with open(path, 'rb') as f:
+        header = f.read(20)
+    with open(path, 'wb') as f:
+        f.write(header)
+    assert batch.show_main([path]) == 1
+    assert 'Ошибка' in capsys.readouterr().err
+
+
+def test_main_dispatches_commands_without_menu(tmp_path):
+    path = str(tmp_path / 'data.adp')
+    write_container(path, {'arr1': np.arange(5)}, task=1)
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    done = subprocess.run([sys.executable, os.path.join(root, 'main.py'), 'show', path],
+                          cwd=tmp_path, capture_output=True, text=True, timeout=60,
+                          stdin=subprocess.DEVNULL)
+    assert done.returncode == 0, done.stderr
+    assert done.stdout.count('Задание: 1') == 1
+    assert 'меню' not in done.stdout.lower()
+
+
+def test_generate_task1_container(tmp_path):
+    first, second = str(tmp_path / 'a.adp'), str(tmp_path / 'b.adp')
+    args = ['--task', '1', '--size', '1000', '--min', '-50', '--max', '50', '--seed', '3']
+    assert batch.generate_main(args + ['--output', first]) == 0
+    assert batch.generate_main(args + ['--output', second, '--workers', '1']) == 0
+    a, b = read_container(first), read_container(second)
+    assert a.task == 1 and a.names() == ['arr1', 'arr2']
+    for name in a.names():
+        assert a[name].shape == (1000,)
+        assert a[name].min() >= -50 and a[name].max() <= 50
+        assert np.array_equal(a[name], b[name])
+    assert not np.array_equal(a['arr1'], a['arr2'])
+
+
+def test_generate_task3_matrix(tmp_path):
+    path = str(tmp_path / 'm.adp')
+    args = ['--task', '3', '--shape', '4', '6', '--dtype', 'float32', '--max', '1',
+            '--output', path]
+    assert batch.generate_main(args) == 0
+    matrix = read_container(path)['matrix']
+    assert matrix.shape == (4, 6) and matrix.dtype == np.float32
+
+
+def test_generate_requires_size(tmp_path):
+    with pytest.raises(SystemExit):
+        batch.generate_main(['--task', '8', '--output', str(tmp_path / 'x.adp')])
+
+
+def test_run_task8_external_memory(tmp_path):
+    arr1, arr2 = [12, 5, 120, 7, 12, 310], [21, 7, 13]
+    a = _write_text(tmp_path / 'a.txt', [arr1])
+    b = _write_text(tmp_path / 'b.txt', [arr2])
+    out = str(tmp_path / 'out.txt')
+    args = ['--task', '8', '--input', a, '--input', b, '--output', out, '--memory-budget', '1',
+            '--tmp-dir', str(tmp_path)]
+    assert batch.main(args) == 0
+    assert _read_text(out) == [find_common_numbers(arr1, arr2)]
+
+
+def test_run_task_rejects_unknown_direction():
+    with pytest.raises(ValueError):
+        batch.run_task(3, [[[1, 2], [3, 4]]], direction='up')
+
+
+def test_load_task_inputs_checks_count_and_dtype(tmp_path):
+    a = _write_text(tmp_path / 'a.txt', [[1, 2, 3]])
+    m = _write_text(tmp_path / 'm.txt', [[1, 2], [3, 4]])
+    first, second = batch.load_task_inputs(1, [a, a])
+    assert first.tolist() == second.tolist() == [1, 2, 3]
+    matrix, = batch.load_task_inputs(3, [m])
+    assert matrix.dtype == np.dtype(batch.DEFAULT_DTYPE)
+    assert matrix.tolist() == [[1, 2], [3, 4]]
+    with pytest.raises(ValueError):
+        batch.load_task_inputs(8, [a])
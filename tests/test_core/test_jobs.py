@@ -0,0 +1,131 @@
+"""Тесты запуска заданий по манифесту JSONL."""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.core import jobs
+from src.tasks.task1 import sum_arrays_special
+from src.tasks.task8 import find_common_numbers
+
+
+def _write_manifest(path, entries):
+    lines = [entry if isinstance(entry, str) else json.dumps(entry) for entry in entries]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def _read_records(path):
+    with open(path, encoding='utf-8') as f:
+        return {record['id']: record for record in map(json.loads, f)}
+
+
+def test_manifest_run_with_inline_and_file_inputs(tmp_path, capsys):
+    np.save(tmp_path / 'm.npy', np.arange(6, dtype=np.int64).reshape(2, 3))
+    manifest = _write_manifest(tmp_path / 'jobs.jsonl', [
+        {'id': 'sum', 'task': 1, 'data': [[3, 1, 2], [2, 2, 5]]},
+        '# комментарий',
+        {'id': 'rot', 'task': 3, 'inputs': [str(tmp_path / 'm.npy')], 'direction': 'ccw'},
+        {'id': 'common', 'task': 8, 'data': [[12, 5, 7], [21, 7]],
+         'output': str(tmp_path / 'common.txt')},
+    ])
+    out = str(tmp_path / 'results.jsonl')
+    assert jobs.main([manifest, '--workers', '2', '--output', out]) == 0
+    records = _read_records(out)
+    assert {record['status'] for record in records.values()} == {'ok'}
+    assert records['sum']['result'] == sum_arrays_special([3, 1, 2], [2, 2, 5])
+    assert records['rot']['result'] == [[2, 5], [1, 4], [0, 3]]
+    assert records['common']['output'] == str(tmp_path / 'common.txt')
+    with open(tmp_path / 'common.txt', encoding='utf-8') as f:
+        assert [int(x) for x in f.read().split()] == find_common_numbers([12, 5, 7], [21, 7])
+    assert 'заданий: 3 (успешно 3, с ошибкой 0)' in capsys.readouterr().out
+
+
+def test_failed_jobs_do_not_stop_the_run(tmp_path):
+    manifest = _write_manifest(tmp_path / 'jobs.jsonl', [
+        {'id': 'bad-task', 'task': 5, 'data': []},
+        'не json',
+        {'id': 'missing', 'task': 8, 'inputs': [str(tmp_path / 'no.txt'), str(tmp_path / 'no.txt')]},
+        {'id': 'ok', 'task': 1, 'data': [[1, 2], [3, 4]]},
+    ])
+    out = str(tmp_path / 'results.jsonl')
+    assert jobs.main([manifest, '--output', out]) == 1
+    records = _read_records(out)
+    assert len(records) == 4
+    assert records['ok']['status'] == 'ok'
+    assert records['ok']['result'] == sum_arrays_special([1, 2], [3, 4])
+    for job_id in ('bad-task', '2', 'missing'):
+        assert records[job_id]['status'] == 'error'
+        assert records[job_id]['error']
+
+
+@pytest.mark.parametrize('pool', jobs.POOLS)
+def test_run_jobs_pools(pool):
+    manifest = [{'id': str(i), 'task': 1, 'data': [[i, 2 * i, -i], [1, i, 0]]} for i in range(20)]
+    records = list(jobs.run_jobs(manifest, pool=pool, workers=2, max_pending=3))
+    assert sorted(int(record['id']) for record in records) == list(range(20))
+    for record in records:
+        i = int(record['id'])
+        assert record['status'] == 'ok'
+        assert record['result'] == sum_arrays_special([i, 2 * i, -i], [1, i, 0])
+        assert record['latency_s'] >= 0
+
+
+def test_run_jobs_rejects_bad_pool():
+    with pytest.raises(ValueError):
+        list(jobs.run_jobs([], pool='fiber'))
+    with pytest.raises(ValueError):
+        list(jobs.run_jobs([], workers=-1))
+
+
+def test_summarize_percentiles():
+    records = [{'status': 'ok', 'latency_s': float(i), 'input_sizes': [1, 1]}
+               for i in range(1, 101)]
+    records[0]['status'] = 'error'
+    summary = jobs.summarize(records, 2.0)
+    assert summary['jobs'] == 100 and summary['ok'] == 99 and summary['failed'] == 1
+    assert summary['latency_p50_s'] == 50.0
+    assert summary['latency_p95_s'] == 95.0
+    assert summary['latency_p99_s'] == 99.0
+    assert summary['latency_max_s'] == 100.0
+    assert summary['elements_per_s'] == 100.0
+
+
+def test_unexpected_job_errors_are_recorded(tmp_path):
+    # Несравнимые элементы дают TypeError, а не ValueError
+    manifest = [
+        {'id': 'type-error', 'task': 1, 'data': [['a', 1], [2, 3]]},
+        {'id': 'not-a-list', 'task': 8, 'data': 5},
+        {'id': 'ok', 'task': 8, 'data': [[12, 3], [21]]},
+    ]
+    records = {record['id']: record for record in jobs.run_jobs(manifest, workers=2)}
+    assert records['type-error']['status'] == 'error'
+    assert records['type-error']['error'].startswith('TypeError')
+    assert records['not-a-list']['status'] == 'error'
+    assert records['ok']['status'] == 'ok' and records['ok']['result'] == [12]
+
+
+@pytest.mark.parametrize('name', ['m.txt', 'm.npy'])
+def test_task3_files_use_batch_default_dtype(tmp_path, name):
+    matrix = np.arange(6, dtype=np.int64).reshape(2, 3)
+    path = tmp_path / name
+    if name.endswith('.npy'):
+        np.save(path, matrix)
+    else:
+        path.write_text('0 1 2\n3 4 5\n', encoding='utf-8')
+    job = {'id': 'rot', 'task': 3, 'inputs': [str(path)]}
+    assert jobs._load_job_inputs(job, 3)[0].dtype == np.int64
+    record = jobs.execute_job(job)
+    assert record['status'] == 'ok'
+    assert record['result'] == [[3, 0], [4, 1], [5, 2]]
+
+
+def test_job_workers_are_passed_and_checked():
+    data = [[5, 1, 4, 2], [3, 3, 0, 1]]
+    ok = jobs.execute_job({'id': 'p', 'task': 1, 'data': data,
+                           'engine': 'parallel', 'workers': 2})
+    assert ok['status'] == 'ok' and ok['result'] == sum_arrays_special(*data)
+    for workers in (0, -1, 'many', 1.5, True):
+        record = jobs.execute_job({'id': 'w', 'task': 1, 'data': data, 'workers': workers})
+        assert record['status'] == 'error' and 'workers' in record['error']
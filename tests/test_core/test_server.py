@@ -0,0 +1,135 @@
+"""Тесты локального сервера заданий и его клиента."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.core import server
+from src.core.client import Client
+from src.tasks.task1 import sum_arrays_special
+from src.tasks.task8 import find_common_numbers
+
+
+def _run_with_server(tmp_path, scenario, **options):
+    """Запуск сценария scenario(client) на сервере с сокетом Unix."""
+    async def run():
+        path = str(tmp_path / 'adp.sock')
+        instance = server.RequestServer(workers=1, **options)
+        await instance.start(unix=path)
+        try:
+            async with await Client.connect(unix=path) as client:
+                return await scenario(client)
+        finally:
+            await instance.close()
+    return asyncio.run(run())
+
+
+def test_json_requests(tmp_path):
+    async def scenario(client):
+        return await asyncio.gather(
+            client.request(8, [[12, 5, 120], [21, 6]]),
+            client.request(1, [[3, 1, 2], [2, 2, 5]], engine='python'),
+            client.request(3, [[[1, 2, 3], [4, 5, 6]]], direction='ccw'),
+        )
+
+    common, sums, rotated = _run_with_server(tmp_path, scenario)
+    assert [r['status'] for r in (common, sums, rotated)] == ['ok'] * 3
+    assert common['result'] == find_common_numbers([12, 5, 120], [21, 6])
+    assert sums['result'] == sum_arrays_special([3, 1, 2], [2, 2, 5])
+    assert rotated['result'] == [[3, 6], [2, 5], [1, 4]]
+
+
+def test_binary_requests_inline_and_in_pool(tmp_path):
+    rng = np.random.default_rng(4)
+    small = [rng.integers(-100, 100, 50), rng.integers(-100, 100, 50)]
+    large = [rng.integers(-100, 100, 5000), rng.integers(-100, 100, 5000)]
+
+    async def scenario(client):
+        return [await client.request(1, arrays, binary=True) for arrays in (small, large)]
+
+    # Порог занижен: второй запрос выполняется в процессе пула
+    responses = _run_with_server(tmp_path, scenario, inline_bytes=4096)
+    for response, arrays in zip(responses, (small, large)):
+        assert response['status'] == 'ok'
+        assert isinstance(response['result'], np.ndarray)
+        expected = sum_arrays_special(arrays[0].tolist(), arrays[1].tolist())
+        assert response['result'].tolist() == list(expected)
+
+
+@pytest.mark.parametrize('task, inputs, params', [
+    (5, [[1], [2]], {}),
+    (1, [[1, 2]], {}),
+    (1, [[1], [2]], {'engine': 'gpu'}),
+    (1, [[1], [2]], {'engine': 'parallel'}),
+    (3, [[[1, 2], [3]]], {}),
+])
+def test_bad_params_give_error_response(tmp_path, task, inputs, params):
+    async def scenario(client):
+        failed = await client.request(task, inputs, **params)
+        # Соединение остается рабочим после ошибки запроса
+        return failed, await client.request(8, [[12], [21]])
+
+    failed, ok = _run_with_server(tmp_path, scenario)
+    assert failed['status'] == 'error' and failed['error']
+    assert 'result' not in failed
+    assert ok['status'] == 'ok' and ok['result'] == [12]
+
+
+def test_client_fails_pending_requests_on_disconnect(tmp_path):
+    async def run():
+        path = str(tmp_path / 'drop.sock')
+
+        async def drop(reader, writer):
+            # Сервер читает кадр запроса и разрывает соединение без ответа
+            await server.read_frame(reader)
+            writer.close()
+
+        fake = await asyncio.start_unix_server(drop, path=path)
+        try:
+            client = await Client.connect(unix=path)
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(client.request(8, [[1], [1]]), 5)
+            with pytest.raises(ConnectionError):
+                await client.request(8, [[1], [1]])
+            await client.close()
+        finally:
+            fake.close()
+            await fake.wait_closed()
+
+    asyncio.run(run())
+
+
+def test_frames_round_trip():
+    payload = server.pack_request(server.KIND_BINARY, 1, [np.arange(3), np.arange(3)],
+                                  request_id=7, engine='numpy')
+    response = server.unpack_response(server.KIND_BINARY,
+                                      server.handle_request(server.KIND_BINARY, payload))
+    assert response['id'] == 7 and response['status'] == 'ok'
+    assert response['result'].tolist() == list(sum_arrays_special([0, 1, 2], [0, 1, 2]))
+
+
+def test_close_with_open_connection(tmp_path):
+    async def run():
+        path = str(tmp_path / 'adp.sock')
+        instance = server.RequestServer(workers=1)
+        await instance.start(unix=path)
+        client = await Client.connect(unix=path)
+        assert (await client.request(8, [[12], [21]]))['status'] == 'ok'
+        await asyncio.wait_for(instance.close(), 10)
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(client.request(8, [[12], [21]]), 5)
+        await client.close()
+
+    asyncio.run(run())
+
+
+def test_truncated_binary_request_gives_error_response():
+    payload = server.pack_request(server.KIND_BINARY, 1, [np.arange(3), np.arange(3)],
+                                  request_id=9)
+    # Метаданные целы, заголовок контейнера обрезан внутри описаний столбцов
+    meta_size = server._META.size + server._META.unpack_from(payload)[0]
+    response = server.unpack_response(
+        server.KIND_BINARY, server.handle_request(server.KIND_BINARY, payload[:meta_size + 20]))
+    assert response['id'] == 9 and response['status'] == 'error'
+    assert 'контейнер' in response['error']
@@ -0,0 +1,149 @@
+"""Тесты задания 1: все движки и стратегии сортировки против эталона на Python."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.tasks import task1
+from src.tasks.task1 import sum_arrays_special
+
+
+def reference(arr1, arr2):
+    """Эталон: прямая реализация условия задания."""
+    pairs = zip(sorted(arr1, reverse=True), sorted(arr2))
+    return sorted(0 if x == y else x + y for x, y in pairs)
+
+
+def random_arrays(n, low=-1000, high=1000, seed=0):
+    rng = random.Random(seed)
+    return ([rng.randint(low, high) for _ in range(n)],
+            [rng.randint(low, high) for _ in range(n)])
+
+
+CASES = [
+    ([], []),
+    ([5], [5]),
+    ([5], [-3]),
+    ([-1, -2, -3], [-3, -2, -1]),
+    ([2, 2, 2, 2], [2, 2, 2, 2]),
+    ([1, 1, 2, 3], [3, 1, 1, 2]),
+    ([10, -10, 0], [0, 0, 0]),
+]
+
+
+@pytest.mark.parametrize('engine', task1.ENGINES)
+@pytest.mark.parametrize('arr1, arr2', CASES)
+def test_edge_cases(engine, arr1, arr2):
+    assert list(sum_arrays_special(arr1, arr2, engine=engine)) == reference(arr1, arr2)
+
+
+@pytest.mark.parametrize('engine', task1.ENGINES)
+def test_engines_match_reference(engine):
+    arr1, arr2 = random_arrays(3000, seed=1)
+    assert list(sum_arrays_special(arr1, arr2, engine=engine)) == reference(arr1, arr2)
+
+
+@pytest.mark.parametrize('n', [task1.NUMPY_THRESHOLD - 1, task1.NUMPY_THRESHOLD,
+                               task1.NUMPY_THRESHOLD + 1])
+def test_auto_around_numpy_threshold(n):
+    arr1, arr2 = random_arrays(n, seed=n)
+    assert sum_arrays_special(arr1, arr2) == reference(arr1, arr2)
+
+
+def test_result_type_follows_input():
+    arr1, arr2 = random_arrays(100, seed=2)
+    assert isinstance(sum_arrays_special(arr1, arr2, engine='numpy'), list)
+    result = sum_arrays_special(np.array(arr1), np.array(arr2))
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == reference(arr1, arr2)
+
+
+def test_wide_values_fall_back_to_python():
+    # Суммы за пределами int64: NumPy отказывается, "auto" считает на Python
+    big = 2 ** 62
+    arr1, arr2 = [big, big - 1, -big], [big, 1, -big]
+    assert sum_arrays_special(arr1, arr2) == reference(arr1, arr2)
+    assert sum_arrays_special(arr1, arr2, engine='python') == reference(arr1, arr2)
+    with pytest.raises(ValueError):
+        sum_arrays_special(arr1, arr2, engine='numpy')
+    result = sum_arrays_special(np.array(arr1, dtype=np.int64), np.array(arr2, dtype=np.int64))
+    assert [int(x) for x in result] == reference(arr1, arr2)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        sum_arrays_special([1, 2], [1])
+    with pytest.raises(ValueError):
+        sum_arrays_special([1], [1], engine='gpu')
+
+
+@pytest.mark.parametrize('n', [1, 2, 7, 999, 1000, 1001, 5000])
+def test_parallel_path_around_threshold(n):
+    # Порог занижен, чтобы параллельная ветка (а не откат на NumPy)
+    # проверялась на небольших размерах по обе стороны от него
+    arr1, arr2 = random_arrays(n, seed=n)
+    result = task1._sum_arrays_parallel(np.array(arr1), np.array(arr2), 2, threshold=1000)
+    assert result.tolist() == reference(arr1, arr2)
+
+
+def test_parallel_engine_rejects_bad_workers():
+    with pytest.raises(ValueError):
+        sum_arrays_special([1], [1], engine='parallel', workers=0)
+
+
+@pytest.mark.parametrize('engine', task1.ENGINES)
+@pytest.mark.parametrize('sort', ('auto', 'counting', 'comparison'))
+def test_sort_strategies_match_reference(engine, sort):
+    arr1, arr2 = random_arrays(3000, seed=1)
+    result = sum_arrays_special(arr1, arr2, engine=engine, sort=sort)
+    assert list(result) == reference(arr1, arr2)
+
+
+@pytest.mark.parametrize('n', [1, 999, 1000, 5000])
+@pytest.mark.parametrize('sort', ('counting', 'comparison'))
+def test_parallel_path_sort_strategies(n, sort):
+    arr1, arr2 = random_arrays(n, low=-20, high=20, seed=n)
+    result = task1._sum_arrays_parallel(np.array(arr1), np.array(arr2), 2,
+                                        threshold=1000, sort=sort)
+    assert result.tolist() == reference(arr1, arr2)
+
+
+def test_unknown_sort_strategy():
+    with pytest.raises(ValueError):
+        sum_arrays_special([1], [1], sort='bogo')
+
+
+@pytest.mark.parametrize('arr1, arr2', [
+    # Уже упорядоченные входы: суммы образуют один монотонный отрезок
+    (list(range(5000)), list(range(5000))),
+    (list(range(5000, 0, -1)), list(range(-2500, 2500))),
+    # Длинное плато одинаковых значений
+    ([7] * 3000 + [1, 2, 3], [7] * 3000 + [3, 2, 1]),
+    # Много повторов в узком диапазоне
+    random_arrays(5000, -3, 3, seed=3),
+])
+def test_run_merging_on_structured_inputs(arr1, arr2):
+    expected = reference(arr1, arr2)
+    assert list(sum_arrays_special(arr1, arr2, engine='numpy')) == expected
+    result = task1._sum_arrays_parallel(np.array(arr1), np.array(arr2), 2, threshold=1000)
+    assert result.tolist() == expected
+
+
+def test_merge_sum_runs_directions():
+    sums = np.array([1, 3, 5, 7], dtype=np.int64)
+    equal = np.array([False, True, False, False])
+    for direction in (1, -1):
+        merged = task1._merge_sum_runs(sums if direction > 0 else sums[::-1].copy(),
+                                       equal if direction > 0 else equal[::-1].copy(),
+                                       direction)
+        assert merged.tolist() == [0, 1, 5, 7]
+
+
+@pytest.mark.parametrize('engine', ['auto', 'python'])
+def test_python_engine_keeps_ndarray_result(engine):
+    arr1, arr2 = random_arrays(50, seed=3)
+    result = sum_arrays_special(np.array(arr1), np.array(arr2), engine=engine)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == reference(arr1, arr2)
+    assert isinstance(sum_arrays_special(arr1, arr2, engine=engine), list)
@@ -0,0 +1,197 @@
+"""Тесты задания 2: представления, план поворотов, поворот на месте и в файле."""
+
+import numpy as np
+import pytest
+
+from src.tasks.task2 import (
+    RotatedMatrix,
+    RotationPlan,
+    cache_block_size,
+    rotate_clockwise,
+    rotate_counterclockwise,
+    rotate_file,
+    rotate_square_inplace
+)
+
+
+def reference_cw(m):
+    return [list(row) for row in zip(*m[::-1])]
+
+
+def reference_ccw(m):
+    return [list(row) for row in zip(*m)][::-1]
+
+
+def reference_turns(m, turns):
+    for _ in range(turns % 4):
+        m = reference_cw(m)
+    return m
+
+
+def make_matrix(rows, cols, start=0):
+    return [[start + i * cols + j for j in range(cols)] for i in range(rows)]
+
+
+SHAPES = [(1, 1), (1, 5), (5, 1), (2, 3), (3, 2), (4, 4), (5, 5), (7, 3)]
+
+
+@pytest.mark.parametrize('rows, cols', SHAPES)
+def test_lists_match_reference(rows, cols):
+    m = make_matrix(rows, cols, start=-rows * cols // 2)
+    assert rotate_clockwise(m) == reference_cw(m)
+    assert rotate_counterclockwise(m) == reference_ccw(m)
+
+
+@pytest.mark.parametrize('rows, cols', SHAPES)
+def test_numpy_matches_reference(rows, cols):
+    m = make_matrix(rows, cols)
+    assert rotate_clockwise(np.array(m)).tolist() == reference_cw(m)
+    assert rotate_counterclockwise(np.array(m)).tolist() == reference_ccw(m)
+
+
+@pytest.mark.parametrize('rows, cols', SHAPES)
+@pytest.mark.parametrize('turns', [-3, -1, 0, 1, 2, 3, 5])
+def test_rotated_view(rows, cols, turns):
+    m = make_matrix(rows, cols)
+    expected = reference_turns(m, turns)
+    view = RotatedMatrix(m, turns)
+    assert view.shape == (len(expected), len(expected[0]))
+    assert view.materialize() == expected
+    assert [list(row) for row in view] == expected
+    assert all(view.get(i, j) == expected[i][j]
+               for i in range(len(expected)) for j in range(len(expected[0])))
+    assert [view[i][j] for i in range(len(expected)) for j in range(len(expected[0]))] \
+        == [x for row in expected for x in row]
+
+
+@pytest.mark.parametrize('turns', [0, 1, 2, 3])
+@pytest.mark.parametrize('i, j', [(-1, 0), (0, -1), (3, 0), (0, 2), (2, 2), (-4, -3)])
+def test_rotated_view_get_checks_bounds(turns, i, j):
+    view = RotatedMatrix(make_matrix(2, 3) if turns % 2 else make_matrix(3, 2), turns)
+    assert view.shape == (3, 2)
+    with pytest.raises(IndexError):
+        view.get(i, j)
+
+
+def test_view_does_not_copy():
+    m = make_matrix(3, 4)
+    view = rotate_clockwise(m, view=True)
+    m[2][0] = 100
+    assert view.get(0, 0) == 100
+    assert rotate_counterclockwise(view, view=True).materialize() == m
+
+
+def test_invalid_matrices():
+    for matrix in ([], [[]], [[1, 2], [3]]):
+        with pytest.raises(ValueError):
+            rotate_clockwise(matrix)
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 5, 16, 17, 33])
+@pytest.mark.parametrize('block_size', [None, 1, 2, 16])
+def test_inplace_lists(n, block_size):
+    m = make_matrix(n, n)
+    expected_cw = reference_cw(m)
+    result = rotate_clockwise(m, inplace=True, block_size=block_size)
+    assert result is m
+    assert m == expected_cw
+    rotate_counterclockwise(m, inplace=True, block_size=block_size)
+    assert m == make_matrix(n, n)
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 5, 16, 17, 33, 100])
+@pytest.mark.parametrize('block_size', [None, 1, 3, 16])
+def test_inplace_numpy(n, block_size):
+    m = np.arange(n * n, dtype=np.int64).reshape(n, n)
+    rotate_square_inplace(m, 1, block_size)
+    assert m.tolist() == reference_cw(make_matrix(n, n))
+    rotate_square_inplace(m, -1, block_size)
+    assert m.tolist() == make_matrix(n, n)
+    rotate_square_inplace(m, 3, block_size)
+    assert m.tolist() == reference_ccw(make_matrix(n, n))
+
+
+def test_inplace_rejects_non_square():
+    with pytest.raises(ValueError):
+        rotate_clockwise(make_matrix(2, 3), inplace=True)
+
+
+@pytest.mark.parametrize('itemsize', [1, 4, 8, 16])
+def test_cache_block_size(itemsize):
+    size = cache_block_size(itemsize)
+    assert 16 <= size <= 512
+    assert size & (size - 1) == 0
+    assert cache_block_size(itemsize, cache_bytes=1) == 16
+    assert cache_block_size(itemsize, cache_bytes=1 << 40) == 512
+
+
+def test_inplace_rejects_non_quarter_turns():
+    for turns in (0, 2, 4):
+        with pytest.raises(ValueError):
+            rotate_square_inplace(make_matrix(3, 3), turns)
+
+
+@pytest.mark.parametrize('rows, cols', [(1, 1), (1, 7), (5, 3), (37, 53)])
+@pytest.mark.parametrize('turns', [1, -1])
+def test_rotate_npy_file(tmp_path, rows, cols, turns):
+    m = make_matrix(rows, cols)
+    path = tmp_path / 'm.npy'
+    np.save(path, np.array(m, dtype=np.int32))
+    # Маленький бюджет: поворот идет многими блоками
+    result = rotate_file(path, turns, output=tmp_path / 'out.npy', tile_bytes=64)
+    expected = reference_cw(m) if turns == 1 else reference_ccw(m)
+    assert result.tolist() == expected
+    assert np.load(tmp_path / 'out.npy').tolist() == expected
+
+
+def test_rotate_raw_file(tmp_path):
+    m = make_matrix(6, 4)
+    path = tmp_path / 'm.bin'
+    np.array(m, dtype=np.float64).tofile(path)
+    result = rotate_clockwise(str(path), output=str(tmp_path / 'out.bin'),
+                              shape=(6, 4), dtype='float64', tile_bytes=64)
+    assert result.tolist() == reference_cw(m)
+    raw = np.fromfile(tmp_path / 'out.bin', dtype=np.float64).reshape(4, 6)
+    assert raw.tolist() == reference_cw(m)
+
+
+def test_rotate_file_rejects_bad_arguments(tmp_path):
+    path = tmp_path / 'm.bin'
+    np.zeros(6, dtype=np.int64).tofile(path)
+    with pytest.raises(ValueError):
+        rotate_file(path, 1)
+    with pytest.raises(ValueError):
+        rotate_file(path, 1, shape=(4, 4), dtype='int64')
+
+
+def test_rotate_file_rejects_half_turn(tmp_path):
+    path = tmp_path / 'm.bin'
+    np.zeros(6, dtype=np.int64).tofile(path)
+    with pytest.raises(ValueError):
+        rotate_file(path, 2, shape=(2, 3), dtype='int64')
+
+
+@pytest.mark.parametrize('turns', [0, 1, 2, 3, 4, 7, -1, -6])
+def test_plan_composes_turns(turns):
+    m = make_matrix(3, 5)
+    plan = RotationPlan(m).rotate(turns)
+    assert plan.turns == turns % 4
+    assert plan.materialize() == reference_turns(m, turns)
+    assert plan.view().materialize() == reference_turns(m, turns)
+
+
+def test_plan_chain():
+    m = make_matrix(2, 3)
+    plan = rotate_clockwise(rotate_clockwise(RotationPlan(m)).counterclockwise().clockwise())
+    assert plan.turns == 2
+    assert plan.materialize() == reference_turns(m, 2)
+
+
+def test_plan_records_many_turns_in_constant_space():
+    m = make_matrix(3, 4)
+    plan = RotationPlan(m)
+    for _ in range(100_003):
+        plan = plan.clockwise()
+    assert plan.turns == 3 and vars(plan).keys() == {'matrix', '_turns'}
+    assert plan.materialize() == reference_turns(m, 3)
+    assert RotationPlan(m, turns=-1).turns == 3
@@ -0,0 +1,213 @@
+"""Тесты задания 8: движки, инкрементальный индекс и внешний режим."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.tasks import task8
+from src.tasks.task8 import (
+    CommonNumbersIndex,
+    classify_common_numbers,
+    find_common_numbers,
+    find_common_numbers_external,
+    iter_common_numbers_external
+)
+from src.utils.binary_format import write_container
+
+
+def reference(arr1, arr2):
+    """Эталон: прямое и строковое сравнение без таблиц и векторизации."""
+    second = set(arr2)
+    common, direct, by_reversal = [], [], []
+    for num in dict.fromkeys(arr1):
+        if num in second:
+            common.append(num)
+            direct.append(num)
+        elif num >= 0 and int(str(num)[::-1]) in second:
+            common.append(num)
+            by_reversal.append((num, int(str(num)[::-1])))
+    return common, direct, by_reversal
+
+
+def random_arrays(n, m, low=-50, high=2000, seed=0):
+    rng = random.Random(seed)
+    return ([rng.randint(low, high) for _ in range(n)],
+            [rng.randint(low, high) for _ in range(m)])
+
+
+EMPTY_CASES = [
+    ([], []),
+    ([12], []),
+    ([], [21]),
+]
+
+
+CASES = [
+    ([12], [21]),
+    ([21], [12]),
+    ([120], [21]),
+    ([21], [120]),
+    ([0], [0]),
+    ([-12], [21]),
+    ([-12], [-12]),
+    ([7, 7, 7], [7]),
+    ([12, 21, 12, 5], [21, 6, 50]),
+    ([100, 10, 1], [1]),
+    ([10 ** 17 + 1], [10 ** 17 + 1]),
+]
+
+
+@pytest.mark.parametrize('arr1, arr2', EMPTY_CASES + CASES)
+def test_edge_cases(arr1, arr2):
+    assert classify_common_numbers(arr1, arr2) == reference(arr1, arr2)
+    assert find_common_numbers(arr1, arr2) == reference(arr1, arr2)[0]
+
+
+@pytest.mark.parametrize('n', [1, task8.NUMPY_THRESHOLD - 1, task8.NUMPY_THRESHOLD,
+                               task8.NUMPY_THRESHOLD + 1])
+def test_auto_around_numpy_threshold(n):
+    arr1, arr2 = random_arrays(n, n, seed=n)
+    assert classify_common_numbers(arr1, arr2) == reference(arr1, arr2)
+    common = find_common_numbers(np.array(arr1), np.array(arr2))
+    assert common == reference(arr1, arr2)[0]
+
+
+def test_auto_handles_large_values():
+    arr1 = [10 ** 18 + 1, 12] * task8.NUMPY_THRESHOLD
+    arr2 = [21, 10 ** 18 + 1]
+    assert classify_common_numbers(arr1, arr2) == reference(arr1, arr2)
+
+
+@pytest.mark.parametrize('engine', task8.ENGINES)
+@pytest.mark.parametrize('arr1, arr2', CASES)
+def test_engines_on_edge_cases(engine, arr1, arr2):
+    assert classify_common_numbers(arr1, arr2, engine=engine) == reference(arr1, arr2)
+
+
+@pytest.mark.parametrize('engine', task8.ENGINES)
+@pytest.mark.parametrize('n', [1, 100, task8.NUMPY_THRESHOLD - 1, task8.NUMPY_THRESHOLD])
+def test_engines_match_reference(engine, n):
+    arr1, arr2 = random_arrays(n, n, seed=n)
+    assert classify_common_numbers(arr1, arr2, engine=engine) == reference(arr1, arr2)
+    common = find_common_numbers(np.array(arr1), np.array(arr2), engine=engine)
+    assert common == reference(arr1, arr2)[0]
+
+
+def test_numpy_engine_rejects_unsuitable_data():
+    with pytest.raises(ValueError):
+        find_common_numbers([1.5], [1.5], engine='numpy')
+    with pytest.raises(ValueError):
+        find_common_numbers([10 ** 18], [1], engine='numpy')
+    # "auto" в таких случаях считает на Python
+    assert find_common_numbers([1.5, 12], [1.5, 21]) == [1.5, 12]
+    with pytest.raises(ValueError):
+        find_common_numbers([1], [1], engine='gpu')
+
+
+@pytest.mark.parametrize('engine', task8.ENGINES)
+@pytest.mark.parametrize('arr1, arr2', EMPTY_CASES)
+def test_engines_on_empty_input(engine, arr1, arr2):
+    assert classify_common_numbers(arr1, arr2, engine=engine) == reference(arr1, arr2)
+    assert find_common_numbers(arr1, arr2, engine=engine) == []
+
+
+def test_index_matches_batch_search():
+    arr1, arr2 = random_arrays(300, 300, seed=5)
+    index = CommonNumbersIndex(arr1[:150], arr2[:150])
+    index.extend_left(np.array(arr1[150:]))
+    for num in arr2[150:]:
+        index.add_right(num)
+    assert index.common() == reference(arr1, arr2)[0]
+    assert index.classify() == reference(arr1, arr2)
+    assert len(index) == len(reference(arr1, arr2)[0])
+
+
+def test_index_random_operations():
+    # Эталонные списки: удаление убирает последнее вхождение, так что
+    # позиция первого появления сохраняется, пока число есть в массиве
+    rng = random.Random(7)
+    left, right = [], []
+    index = CommonNumbersIndex()
+    for _ in range(2000):
+        side = rng.choice(('left', 'right'))
+        values = left if side == 'left' else right
+        if values and rng.random() < 0.4:
+            num = rng.choice(values)
+            index.remove(num, side)
+            del values[len(values) - 1 - values[::-1].index(num)]
+        else:
+            num = rng.choice([rng.randint(0, 30), rng.choice((12, 21, 120, 13, 31, 310))])
+            (index.add_left if side == 'left' else index.add_right)(num)
+            values.append(num)
+        expected = reference(left, right)[0]
+        assert index.common() == expected
+    assert all((num in index) == (num in expected) for num in range(40))
+
+
+def test_index_remove_errors():
+    index = CommonNumbersIndex([12], [21])
+    assert 12 in index
+    with pytest.raises(ValueError):
+        index.remove(5)
+    with pytest.raises(ValueError):
+        index.remove(12, side='middle')
+    index.remove(21, side='right')
+    assert 12 not in index
+    assert index.common() == []
+
+
+def _write_text(path, values):
+    path.write_text(' '.join(map(str, values)) + '\n', encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('n', [0, 1, 12_000])
+@pytest.mark.parametrize('partitions', [None, 1, 8])
+def test_external_matches_reference(tmp_path, n, partitions):
+    arr1, arr2 = random_arrays(n, n, low=0, seed=n)
+    arr1 += [120, 12, 21, 120]
+    arr2 += [21]
+    expected = reference(arr1, arr2)[0]
+    source1 = _write_text(tmp_path / 'a.txt', arr1)
+    source2 = np.array(arr2, dtype=np.int64)
+    blocks = iter_common_numbers_external(source1, source2, memory_budget=1024 * 1024,
+                                          tmp_dir=str(tmp_path), partitions=partitions)
+    assert [x for block in blocks for x in block.tolist()] == expected
+
+
+@pytest.mark.parametrize('ext', ['.npy', '.adp', '.bin'])
+def test_external_file_inputs(tmp_path, ext):
+    arr1, arr2 = random_arrays(3000, 2000, low=0, seed=11)
+    a, b = np.array(arr1, dtype=np.int32), np.array(arr2, dtype=np.int32)
+    path1, path2 = str(tmp_path / f'a{ext}'), str(tmp_path / f'b{ext}')
+    for path, data in ((path1, a), (path2, b)):
+        if ext == '.npy':
+            np.save(path, data)
+        elif ext == '.adp':
+            write_container(path, {'values': data}, task=8)
+        else:
+            data.tofile(path)
+
+    output = str(tmp_path / 'out.txt')
+    count = find_common_numbers_external(path1, path2, output, memory_budget=1024 * 1024,
+                                         dtype='int32', partitions=4)
+    expected = reference(arr1, arr2)[0]
+    assert count == len(expected)
+    with open(output, encoding='utf-8') as f:
+        assert [int(x) for x in f.read().split()] == expected
+
+    output = str(tmp_path / 'out.bin')
+    find_common_numbers_external(path1, path2, output, memory_budget=1024 * 1024, dtype='int32')
+    assert np.fromfile(output, dtype=np.int32).tolist() == expected
+
+
+def test_external_rejects_bad_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        list(iter_common_numbers_external([1], [1], memory_budget=1024))
+    with pytest.raises(ValueError):
+        list(iter_common_numbers_external([1], [1], partitions=3))
+    with pytest.raises(ValueError):
+        list(iter_common_numbers_external(np.array([1.5]), np.array([1.5])))
+    with pytest.raises(ValueError):
+        find_common_numbers_external([1], [1], str(tmp_path / 'out.npy'))
@@ -0,0 +1,106 @@
+"""Тесты переворота цифр и сортировки целых чисел."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.utils.array_operations import (
+    COUNTING_MAX_RANGE,
+    SORT_STRATEGIES,
+    reverse_digits,
+    reverse_number,
+    sort_integers
+)
+
+
+def reference_reverse(num):
+    return int(str(num)[::-1])
+
+
+@pytest.mark.parametrize('num', [0, 1, 9, 10, 120, 1200, 12345,
+                                 10 ** 17, 10 ** 18 + 7, 2 ** 64 + 3])
+def test_reverse_number(num):
+    assert reverse_number(num) == reference_reverse(num)
+
+
+def test_reverse_number_rejects_negative():
+    with pytest.raises(ValueError):
+        reverse_number(-1)
+
+
+def test_reverse_digits_matches_reference():
+    rng = random.Random(1)
+    values = [0, 1, 10, 100, 101, 909, 2 ** 62] + [rng.randint(0, 10 ** 17) for _ in range(1000)]
+    expected = [reference_reverse(num) for num in values]
+    assert reverse_digits(values).tolist() == expected
+    assert reverse_digits(np.array(values, dtype=np.int64)).tolist() == expected
+    assert reverse_digits(np.array(values[:6], dtype=np.uint16)).tolist() == expected[:6]
+
+
+def test_reverse_digits_large_and_empty():
+    values = [10 ** 18, 2 ** 63 - 1, 10 ** 30 + 5]
+    assert reverse_digits(values).tolist() == [reference_reverse(num) for num in values]
+    assert reverse_digits([]).tolist() == []
+
+
+@pytest.mark.parametrize('values', [[-1], [1.5], [True], np.array([-3, 4]), np.array([1.0])])
+def test_reverse_digits_rejects_bad_values(values):
+    with pytest.raises(ValueError):
+        reverse_digits(values)
+
+
+def _inputs():
+    rng = random.Random(2)
+    return [
+        [],
+        [5],
+        [-5],
+        [3, 3, 3],
+        [2, -1, 0, -1, 2],
+        [rng.randint(-10, 10) for _ in range(5000)],
+        [rng.randint(0, 100) for _ in range(5000)],
+        [rng.randint(-10 ** 12, 10 ** 12) for _ in range(2000)],
+        [0, COUNTING_MAX_RANGE],
+        [0, COUNTING_MAX_RANGE + 1],
+    ]
+
+
+@pytest.mark.parametrize('strategy', SORT_STRATEGIES)
+@pytest.mark.parametrize('reverse', [False, True])
+@pytest.mark.parametrize('values', _inputs())
+def test_sort_integers_matches_sorted(values, strategy, reverse):
+    expected = sorted(values, reverse=reverse)
+    assert sort_integers(values, strategy, reverse) == expected
+    for dtype in (np.int64, np.int32):
+        if all(np.iinfo(dtype).min <= x <= np.iinfo(dtype).max for x in values):
+            arr = np.array(values, dtype=dtype)
+            assert sort_integers(arr, strategy, reverse).tolist() == expected
+
+
+@pytest.mark.parametrize('strategy', SORT_STRATEGIES)
+def test_sort_integers_narrow_and_unsigned_types(strategy):
+    rng = np.random.default_rng(3)
+    for dtype in (np.int8, np.uint8, np.uint64):
+        info = np.iinfo(dtype)
+        arr = rng.integers(max(info.min, -100), 100, size=3000).astype(dtype)
+        result = sort_integers(arr, strategy)
+        assert result.dtype == arr.dtype
+        assert result.tolist() == sorted(arr.tolist())
+    arr = np.array([np.iinfo(np.int64).max, np.iinfo(np.int64).max - 3], dtype=np.int64)
+    assert sort_integers(arr, strategy).tolist() == sorted(arr.tolist())
+
+
+@pytest.mark.parametrize('strategy', SORT_STRATEGIES)
+def test_sort_integers_mixed_types(strategy):
+    values = [1, 1.0, True, 0, -2.5]
+    result = sort_integers(values, strategy)
+    assert result == sorted(values)
+    assert [type(x) for x in result] == [type(x) for x in sorted(values)]
+    floats = np.array([0.5, -1.0, 0.25])
+    assert sort_integers(floats, strategy).tolist() == sorted(floats.tolist())
+
+
+def test_sort_integers_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        sort_integers([1], 'radix')
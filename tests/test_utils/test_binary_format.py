@@ -0,0 +1,127 @@
+"""Тесты двоичного контейнера .adp: запись, чтение и буферы в памяти."""
+
+import array
+
+import numpy as np
+import pytest
+
+from src.utils.binary_format import (
+    ALIGNMENT,
+    EXTENSION,
+    allocate_container,
+    decode_container,
+    encode_container,
+    is_container,
+    read_container,
+    write_container
+)
+
+
+def _columns():
+    base = np.arange(30, dtype=np.int64).reshape(5, 6)
+    return {
+        'empty': np.empty(0, dtype=np.int32),
+        'single': np.array([-1], dtype=np.int8),
+        'ints': np.array([-2 ** 63, 0, 2 ** 63 - 1], dtype=np.int64),
+        'floats': np.array([0.5, -1e30, 3.0], dtype=np.float32),
+        'matrix': base,
+        'strided': base[::2, ::-1],
+        'list': [3, -4, 5],
+        'nested': [[1.5, 2.5], [3.5, 4.5], [5.5, 6.5]],
+        'array': array.array('H', [1, 2, 65535]),
+        'имя': np.array([7], dtype=np.uint64),
+    }
+
+
+def _assert_same(container, columns):
+    assert container.names() == list(columns)
+    for name, data in columns.items():
+        expected = np.asarray(data)
+        column = container[name]
+        assert column.shape == expected.shape
+        assert np.array_equal(column, expected.astype(column.dtype))
+
+
+def test_file_round_trip(tmp_path):
+    path = str(tmp_path / f'data{EXTENSION}')
+    columns = _columns()
+    write_container(path, columns, task=3)
+    assert is_container(path)
+    container = read_container(path)
+    assert container.task == 3
+    _assert_same(container, columns)
+    assert container['floats'].dtype == np.float32
+    assert container['array'].dtype == np.uint16
+
+
+def test_memory_round_trip_matches_file(tmp_path):
+    path = str(tmp_path / 'data.adp')
+    columns = _columns()
+    write_container(path, columns, task=8)
+    buffer = encode_container(columns, task=8)
+    with open(path, 'rb') as f:
+        assert bytes(buffer) == f.read()
+    container = decode_container(buffer)
+    assert container.task == 8
+    _assert_same(container, columns)
+
+
+def test_columns_are_aligned(tmp_path):
+    buffer = encode_container({'a': np.arange(3, dtype=np.int8), 'b': np.arange(5)})
+    container = decode_container(buffer)
+    base = np.frombuffer(buffer, dtype=np.uint8).ctypes.data
+    for column in container.columns.values():
+        assert (column.ctypes.data - base) % ALIGNMENT == 0
+
+
+def test_allocate_container(tmp_path):
+    path = str(tmp_path / 'alloc.adp')
+    container = allocate_container(path, {'a': ('int32', (4,)), 'm': ('float64', (2, 3))}, task=2)
+    container['a'][:] = [1, -2, 3, -4]
+    container['m'][:] = [[1, 2, 3], [4, 5, 6]]
+    container['a'].flush()
+    container['m'].flush()
+    result = read_container(path)
+    assert result.task == 2
+    assert result['a'].tolist() == [1, -2, 3, -4]
+    assert result['m'].tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+
+
+def test_rejects_damaged_input(tmp_path):
+    path = tmp_path / 'bad.adp'
+    path.write_bytes(b'NOPE' + bytes(60))
+    assert not is_container(str(path))
+    with pytest.raises(ValueError):
+        read_container(str(path))
+
+
+def test_rejects_unsupported_types(tmp_path):
+    with pytest.raises(ValueError):
+        write_container(str(tmp_path / 'a.adp'), {'a': np.array(['x'])})
+    with pytest.raises(ValueError):
+        write_container(str(tmp_path / 'b.adp'), {'a': ['x', 'y']})
+
+
+def test_decode_rejects_damaged_buffer():
+    with pytest.raises(ValueError):
+        decode_container(b'AD')
+    buffer = encode_container({'a': np.arange(100)})
+    with pytest.raises(ValueError):
+        decode_container(buffer[:len(buffer) - 8])
+
+
+@pytest.mark.parametrize('size', [12, 14, 20, 40])
+def test_truncated_header_gives_value_error(tmp_path, size):
+    header = bytes(encode_container({'values': np.arange(10)}, task=1)[:size])
+    with pytest.raises(ValueError):
+        decode_container(header)
+    path = tmp_path / 'cut.adp'
+    path.write_bytes(header)
+    with pytest.raises(ValueError):
+        read_container(str(path))
+
+
+def test_unknown_column_type_gives_value_error():
+    buffer = bytes(encode_container({'values': np.arange(10, dtype='<i8')}))
+    with pytest.raises(ValueError):
+        decode_container(buffer.replace(b'<i8', b'<z8', 1))
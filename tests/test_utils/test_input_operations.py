@@ -0,0 +1,205 @@
+"""Тесты потокового разбора чисел и матриц и генераторов массивов."""
+
+import io
+import random
+
+import numpy as np
+import pytest
+
+from src.utils import input_operations
+from src.utils.input_operations import (
+    generate_array,
+    generate_matrix,
+    iter_numbers,
+    parse_numbers,
+    read_matrix,
+    read_numbers
+)
+
+
+def _text(values, seed=0):
+    """Числа со смесью разделителей (пробелы, табуляции, переводы строк)."""
+    rng = random.Random(seed)
+    parts = []
+    for value in values:
+        parts.append(str(value))
+        parts.append(rng.choice([' ', '  ', '\t', '\n', ' \r\n']))
+    return ''.join(parts).encode('ascii')
+
+
+def _random_ints(n, seed=0, bound=10 ** 12):
+    rng = random.Random(seed)
+    return [rng.randint(-bound, bound) for _ in range(n)]
+
+
+@pytest.mark.parametrize('values', [[], [0], [-7], [5, 5, 5], _random_ints(5000)])
+@pytest.mark.parametrize('chunk_size', [1, 3, 16, 1 << 20])
+def test_read_numbers_matches_parse_numbers(values, chunk_size):
+    data = _text(values)
+    expected = parse_numbers(data.decode('ascii'))
+    assert read_numbers(io.BytesIO(data), chunk_size=chunk_size).tolist() == expected
+
+
+def test_read_numbers_from_path_and_text_stream(tmp_path):
+    values = _random_ints(100, seed=1)
+    path = tmp_path / 'numbers.txt'
+    path.write_bytes(_text(values))
+    assert read_numbers(str(path)).tolist() == values
+    with open(path, encoding='ascii') as f:
+        assert read_numbers(f).tolist() == values
+
+
+def test_read_numbers_floats():
+    data = b'1.5 -2e3 .25\n7'
+    assert read_numbers(io.BytesIO(data), dtype='float64').tolist() == [1.5, -2000.0, 0.25, 7.0]
+
+
+def test_read_numbers_count_and_out():
+    data = _text([1, 2, 3])
+    assert read_numbers(io.BytesIO(data), count=3).tolist() == [1, 2, 3]
+    out = np.zeros(5, dtype=np.int32)
+    result = read_numbers(io.BytesIO(data), out=out)
+    assert result.tolist() == [1, 2, 3]
+    assert np.shares_memory(result, out)
+    with pytest.raises(ValueError):
+        read_numbers(io.BytesIO(data), count=2)
+
+
+@pytest.mark.parametrize('data, dtype', [
+    (b'1 x 3', 'int64'),
+    (b'abc', 'float64'),
+])
+def test_read_numbers_rejects_bad_tokens(data, dtype):
+    with pytest.raises(ValueError):
+        read_numbers(io.BytesIO(data), dtype=dtype)
+
+
+def test_read_numbers_extreme_values():
+    data = b'9223372036854775807 -9223372036854775808 -2147483648'
+    assert read_numbers(io.BytesIO(data)).tolist() == [2 ** 63 - 1, -2 ** 63, -2 ** 31]
+    assert read_numbers(io.BytesIO(data[-11:]), dtype='int32').tolist() == [-2 ** 31]
+
+
+@pytest.mark.parametrize('chunk_size', [3, 1 << 20])
+def test_python_fallback_matches_numpy(chunk_size):
+    values = _random_ints(500, seed=2)
+    data = _text(values)
+    result = input_operations._read_numbers_python(io.BytesIO(data), 'int64', chunk_size)
+    assert list(result) == values
+    with pytest.raises(ValueError):
+        input_operations._read_numbers_python(io.BytesIO(b'1 x'), 'int64', chunk_size)
+
+
+def _write_matrix(path, rows):
+    path.write_text('\n'.join(' '.join(map(str, row)) for row in rows) + '\n', encoding='ascii')
+    return str(path)
+
+
+@pytest.mark.parametrize('shape', [(1, 1), (1, 5), (5, 1), (3, 4), (17, 9)])
+@pytest.mark.parametrize('chunk_size', [1, 7, 1 << 20])
+def test_read_matrix(tmp_path, shape, chunk_size):
+    rows, cols = shape
+    matrix = [[(i * cols + j) * (-1) ** j for j in range(cols)] for i in range(rows)]
+    path = _write_matrix(tmp_path / 'm.txt', matrix)
+    assert read_matrix(path, dtype='int64', chunk_size=chunk_size).tolist() == matrix
+    assert read_matrix(path, cols=cols, chunk_size=chunk_size).tolist() == matrix
+
+
+def test_read_matrix_skips_blank_lines(tmp_path):
+    path = tmp_path / 'm.txt'
+    path.write_text('\n1 2\n\n3 4\n\n', encoding='ascii')
+    assert read_matrix(str(path), dtype='int64').tolist() == [[1, 2], [3, 4]]
+
+
+@pytest.mark.parametrize('text', ['1 2\n3\n', '1 2\n3 4 5\n', '1 2 3\n4 5\n', '\n \n'])
+@pytest.mark.parametrize('chunk_size', [2, 1 << 20])
+def test_read_matrix_rejects_bad_shapes(tmp_path, text, chunk_size):
+    path = tmp_path / 'm.txt'
+    path.write_text(text, encoding='ascii')
+    with pytest.raises(ValueError):
+        read_matrix(str(path), chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_generate_array_is_reproducible(workers):
+    reference = generate_array(10_000, -5, 5, seed=42, chunk_size=1000)
+    result = generate_array(10_000, -5, 5, seed=42, workers=workers, chunk_size=1000)
+    assert np.array_equal(result, reference)
+    assert result.min() >= -5 and result.max() <= 5
+    assert set(result.tolist()) == set(range(-5, 6))
+
+
+def test_generate_array_types_and_buffers():
+    floats = generate_array(1000, 0.0, 1.0, dtype='float32', seed=1)
+    assert floats.dtype == np.float32
+    assert 0.0 <= floats.min() and floats.max() <= 1.0
+    out = np.empty(100, dtype=np.int16)
+    assert generate_array(min_val=-3, max_val=3, seed=1, out=out) is out
+    assert generate_array(0, seed=1).size == 0
+    with pytest.raises(ValueError):
+        generate_array(10, 5, 1)
+
+
+def test_generate_matrix():
+    matrix = generate_matrix(7, 3, seed=5)
+    assert matrix.shape == (7, 3)
+    assert np.array_equal(matrix.ravel(), generate_array(21, seed=5))
+    with pytest.raises(ValueError):
+        generate_matrix(3)
+
+
+def test_generate_array_seed_controls_output():
+    first = generate_array(5000, -1000, 1000, seed=7)
+    assert np.array_equal(first, generate_array(5000, -1000, 1000, seed=7))
+    assert not np.array_equal(first, generate_array(5000, -1000, 1000, seed=8))
+    assert first.dtype == np.int64
+    assert -1000 <= first.min() and first.max() <= 1000
+
+
+@pytest.mark.parametrize('values', [[], [0], _random_ints(5000)])
+@pytest.mark.parametrize('chunk_size', [1, 16, 1 << 20])
+def test_iter_numbers_matches_read_numbers(values, chunk_size):
+    data = _text(values)
+    blocks = iter_numbers(io.BytesIO(data), chunk_size=chunk_size)
+    assert [x for block in blocks for x in block.tolist()] == values
+
+
+@pytest.mark.parametrize('data, dtype', [
+    (b'1 - 3', 'int64'),
+    (b'1 -', 'int64'),
+    (b'1 2.5', 'int64'),
+    (b'9223372036854775808', 'int64'),
+    (b'-9223372036854775809', 'int64'),
+    (b'2147483648', 'int32'),
+    (b'1 - 2', 'float64'),
+])
+@pytest.mark.parametrize('chunk_size', [2, 1 << 20])
+def test_read_numbers_rejects_bare_signs_and_overflow(data, dtype, chunk_size):
+    with pytest.raises(ValueError):
+        read_numbers(io.BytesIO(data), dtype=dtype, chunk_size=chunk_size)
+
+
+def test_python_fallback_rejects_overflow():
+    with pytest.raises(ValueError):
+        input_operations._read_numbers_python(io.BytesIO(b'2147483648'), 'int32', 1 << 20)
+
+
+@pytest.mark.parametrize('shape', [(1, 1), (3, 4), (17, 9)])
+def test_read_matrix_python_fallback(tmp_path, shape):
+    rows, cols = shape
+    matrix = [[i * cols - j for j in range(cols)] for i in range(rows)]
+    path = _write_matrix(tmp_path / 'm.txt', matrix)
+    assert input_operations._read_matrix_python(path, cols, 'int64') == matrix
+
+
+@pytest.mark.parametrize('text', ['1 2\n3\n4\n', '1 2\n3 4 5\n6\n', '1 2 3\n4 5\n6\n'])
+@pytest.mark.parametrize('chunk_size', [2, 1 << 20])
+def test_read_matrix_rejects_ragged_rows(tmp_path, text, chunk_size):
+    # Общее число значений кратно cols, но строки разной длины
+    path = tmp_path / 'm.txt'
+    path.write_text(text, encoding='ascii')
+    with pytest.raises(ValueError):
+        read_matrix(str(path), chunk_size=chunk_size)
+    with pytest.raises(ValueError):
+        cols = max(len(line.split()) for line in text.splitlines())
+        input_operations._read_matrix_python(str(path), cols, 'float64')
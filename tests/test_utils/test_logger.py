@@ -0,0 +1,576 @@
+"""Тесты логирования: очередь, ленивое форматирование и настройка, профилирование, JSON."""
+
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from src.utils import logger as log_module
+
+
+def _record(message, level=logging.INFO, **fields):
+    return logging.makeLogRecord({'msg': message, 'levelno': level,
+                                  'levelname': logging.getLevelName(level), **fields})
+
+
+def _messages(log_queue):
+    messages = []
+    while not log_queue.empty():
+        messages.append(log_queue.get_nowait().getMessage())
+    return messages
+
+
+@pytest.fixture
+def app_logger(tmp_path, monkeypatch):
+    """Логгер приложения; после теста прежние обработчики восстанавливаются."""
+    monkeypatch.chdir(tmp_path)
+    logger = log_module.get_logger()
+    handlers, level = list(logger.handlers), logger.level
+    yield logger
+    log_module.shutdown_logging()
+    for handler in logger.handlers:
+        if handler not in handlers:
+            handler.close()
+    logger.handlers = handlers
+    logger.setLevel(level)
+
+
+@pytest.mark.parametrize('overflow, kept', [
+    ('drop-new', ['m0', 'm1']),
+    ('drop-oldest', ['m2', 'm3']),
+])
+def test_queue_overflow_drops_records(overflow, kept):
+    handler = log_module.BoundedQueueHandler(queue.Queue(maxsize=2), overflow)
+    for i in range(4):
+        handler.handle(_record(f'm{i}'))
+    assert _messages(handler.queue) == kept
+    assert handler.dropped == 2
+
+
+def test_queue_overflow_block_waits_for_space():
+    handler = log_module.BoundedQueueHandler(queue.Queue(maxsize=1), 'block')
+    handler.handle(_record('first'))
+    writer = threading.Thread(target=handler.handle, args=(_record('second'),))
+    writer.start()
+    writer.join(0.2)
+    assert writer.is_alive()          # очередь полна - запись ждет
+    assert handler.queue.get(timeout=1).getMessage() == 'first'
+    writer.join(5)
+    assert not writer.is_alive()
+    assert _messages(handler.queue) == ['second']
+    assert handler.dropped == 0
+
+
+def test_dropped_counter_under_threads():
+    handler = log_module.BoundedQueueHandler(queue.Queue(maxsize=1), 'drop-new')
+
+    def produce():
+        for i in range(1000):
+            handler.handle(_record(f'm{i}'))
+
+    threads = [threading.Thread(target=produce) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert handler.dropped == 8000 - 1
+
+
+def test_prepare_formats_message_on_enqueue():
+    handler = log_module.BoundedQueueHandler(queue.Queue(), repr_budget=20)
+    values = ['x' * 100]
+    record = _record('значения %s', args=(values,))
+    handler.handle(record)
+    values.append('изменено после записи')
+    queued = handler.queue.get_nowait()
+    assert queued.args is None
+    assert queued.msg == queued.getMessage() == "значения ['xxxxxx..."
+    assert len(queued.msg) == 20
+    assert record.args == (values,)       # исходная запись не изменяется
+
+
+def test_prepare_keeps_exception_text():
+    handler = log_module.BoundedQueueHandler(queue.Queue())
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        handler.handle(_record('сбой', logging.ERROR, exc_info=sys.exc_info()))
+    queued = handler.queue.get_nowait()
+    assert queued.exc_info is None
+    text = logging.Formatter('%(message)s').format(queued)
+    assert text.startswith('сбой') and 'ZeroDivisionError' in text
+
+
+def test_async_mode_delivers_every_record(app_logger, capsys):
+    log_module.setup_logging(log_to_file=False, async_mode=True, queue_size=4, overflow='block')
+
+    def produce(worker):
+        for i in range(50):
+            app_logger.info('поток %d запись %d', worker, i)
+
+    threads = [threading.Thread(target=produce, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log_module.shutdown_logging()
+
+    out = capsys.readouterr().out
+    assert all(f'поток {worker} запись {i}' in out for worker in range(4) for i in range(50))
+
+
+def test_setup_logging_rejects_bad_options(app_logger):
+    with pytest.raises(ValueError):
+        log_module.setup_logging(log_to_file=False, overflow='drop-all')
+    with pytest.raises(ValueError):
+        log_module.setup_logging(log_to_file=False, queue_size=0)
+
+
+class _ListHandler(logging.Handler):
+    """Обработчик, сохраняющий записи без форматирования."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class _Probe:
+    """Аргумент, считающий вызовы repr."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __repr__(self):
+        self.calls += 1
+        return 'probe'
+
+
+@pytest.fixture
+def captured():
+    """Отдельный логгер 'tests' с обработчиком-списком."""
+    logger = log_module.get_logger('tests')
+    handler = _ListHandler()
+    level = logger.level
+    logger.addHandler(handler)
+    logger.propagate = False
+    yield logger, handler
+    logger.removeHandler(handler)
+    logger.propagate = True
+    logger.setLevel(level)
+
+
+def test_disabled_level_skips_formatting(captured):
+    logger, handler = captured
+    logger.setLevel(logging.CRITICAL)
+
+    @log_module.FunctionLogger('tests')
+    def identity(value):
+        return value
+
+    @log_module.FunctionLogger('tests')
+    def fail(value):
+        raise KeyError(value)
+
+    probe = _Probe()
+    assert identity(probe) is probe
+    with pytest.raises(KeyError):
+        fail(probe)
+    assert probe.calls == 0
+    assert handler.records == []
+
+
+def test_enabled_level_formats_on_output(captured):
+    logger, handler = captured
+    logger.setLevel(logging.INFO)
+    # Перехват логов pytest форматирует записи сразу - оставляем только свой обработчик
+    logger.handlers = [handler]
+
+    @log_module.FunctionLogger('tests')
+    def identity(value):
+        return value
+
+    probe = _Probe()
+    identity(probe)
+    assert len(handler.records) == 2
+    assert probe.calls == 0          # repr строится только при выводе записи
+    assert 'probe' in handler.records[0].getMessage()
+    assert probe.calls == 1
+    assert 'identity' in handler.records[1].getMessage()
+
+
+def test_repr_budget_truncates_arguments(captured):
+    logger, handler = captured
+    logger.setLevel(logging.INFO)
+
+    @log_module.FunctionLogger('tests', repr_budget=40)
+    def total(values, **options):
+        return sum(values)
+
+    assert total(list(range(100_000)), scale='x' * 1000) == sum(range(100_000))
+    message = handler.records[0].getMessage()
+    assert '...' in message
+    assert len(message) < 200
+
+
+def test_errors_are_logged(captured):
+    logger, handler = captured
+    logger.setLevel(logging.INFO)
+
+    @log_module.FunctionLogger('tests')
+    def fail():
+        raise ValueError('плохие данные')
+
+    with pytest.raises(ValueError):
+        fail()
+    error = handler.records[-1]
+    assert error.levelno == logging.ERROR
+    assert 'ValueError' in error.getMessage() and 'плохие данные' in error.getMessage()
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _run_python(code, cwd):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    return subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env,
+                          capture_output=True, text=True, timeout=120)
+
+
+def test_import_creates_no_logs(tmp_path):
+    result = _run_python('import src.utils.logger, main\n'
+                         'from src.utils import logger\n'
+                         'assert not logger.is_configured()', tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert not (tmp_path / 'logs').exists()
+    assert result.stdout == ''
+
+
+def test_first_record_configures_logging(tmp_path):
+    result = _run_python('from src.utils import logger\n'
+                         'logger.get_logger("tests").warning("первое сообщение")\n'
+                         'assert logger.is_configured()', tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert 'первое сообщение' in result.stdout
+    files = list((tmp_path / 'logs').iterdir())
+    assert len(files) == 1
+    assert 'первое сообщение' in files[0].read_text(encoding='utf-8')
+
+
+def test_explicit_configure_is_kept(tmp_path):
+    result = _run_python('from src.utils import logger\n'
+                         'app = logger.configure(log_to_file=False)\n'
+                         'handlers = list(app.handlers)\n'
+                         'assert logger.configure() is app and app.handlers == handlers\n'
+                         'logger.get_logger("tests").info("после настройки")', tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert 'после настройки' in result.stdout
+    assert not (tmp_path / 'logs').exists()
+
+
+@pytest.fixture
+def profiling():
+    """Чистый глобальный реестр замеров; профилирование выключается после теста."""
+    log_module.reset_stats()
+    yield log_module.profiler
+    log_module.disable_profiling()
+    log_module.reset_stats()
+
+
+def test_percentiles_nearest_rank():
+    stats = log_module._FunctionStats(1000)
+    for value in range(100, 0, -1):
+        stats.add(value)
+    assert stats.percentile(50) == 50
+    assert stats.percentile(95) == 95
+    assert stats.percentile(99) == 99
+    assert stats.percentile(100) == 100
+
+
+def test_samples_ring_buffer():
+    stats = log_module._FunctionStats(10)
+    for value in range(1, 26):
+        stats.add(value)
+    assert sorted(stats.samples) == list(range(16, 26))
+    assert stats.calls == 25
+    assert stats.total_ns == sum(range(1, 26))
+
+
+def test_registry_counts_calls_and_errors():
+    registry = log_module.ProfileRegistry()
+
+    def work(value):
+        if value < 0:
+            raise ValueError(value)
+        return value
+
+    for value in (1, 2, -1, 3):
+        try:
+            registry.measure('work', work, (value,), {})
+        except ValueError:
+            pass
+    row = registry.stats()['work']
+    assert row['calls'] == 4 and row['errors'] == 1
+    assert 0 <= row['p50_ms'] <= row['p95_ms'] <= row['p99_ms']
+    assert row['peak_kb'] is None
+    registry.reset()
+    assert registry.stats() == {}
+
+
+def test_function_logger_profiles_calls(captured, profiling):
+    logger, _ = captured
+    logger.setLevel(logging.CRITICAL)
+
+    @log_module.FunctionLogger('tests')
+    def square(value):
+        return value * value
+
+    square(2)
+    assert profiling.stats() == {}     # профилирование выключено
+    log_module.enable_profiling()
+    for value in range(20):
+        square(value)
+    row = profiling.stats()[square.__qualname__]
+    assert row['calls'] == 20
+    assert square.__qualname__ in log_module.dump_stats()
+
+
+def test_memory_peaks_include_nested_calls(captured, profiling):
+    logger, _ = captured
+    logger.setLevel(logging.CRITICAL)
+
+    @log_module.FunctionLogger('tests')
+    def inner():
+        return len(bytearray(2 * 1024 * 1024))
+
+    @log_module.FunctionLogger('tests')
+    def outer():
+        small = bytearray(1024)
+        return inner() + len(small)
+
+    log_module.enable_profiling(memory=True)
+    outer()
+    stats = profiling.stats()
+    assert stats[inner.__qualname__]['peak_kb'] >= 2048
+    assert stats[outer.__qualname__]['peak_kb'] >= stats[inner.__qualname__]['peak_kb']
+    log_module.disable_profiling()
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_peak_survives_other_threads(captured, profiling):
+    logger, _ = captured
+    logger.setLevel(logging.CRITICAL)
+    allocated, finished = threading.Event(), threading.Event()
+
+    @log_module.FunctionLogger('tests')
+    def spike():
+        buffer = bytearray(4 * 1024 * 1024)
+        del buffer
+        allocated.set()
+        # Замер в другом потоке сбрасывает пик tracemalloc до конца этого вызова
+        assert finished.wait(5)
+
+    @log_module.FunctionLogger('tests')
+    def small():
+        return len(bytearray(16))
+
+    def other():
+        assert allocated.wait(5)
+        small()
+        finished.set()
+
+    log_module.enable_profiling(memory=True)
+    thread = threading.Thread(target=other)
+    thread.start()
+    spike()
+    thread.join()
+    assert profiling.stats()[spike.__qualname__]['peak_kb'] >= 4096
+
+
+def test_profiled_time_excludes_logging(captured, profiling):
+    logger, _ = captured
+    logger.setLevel(logging.INFO)
+
+    class SlowHandler(logging.Handler):
+        def emit(self, record):
+            time.sleep(0.05)
+
+    logger.handlers = [SlowHandler()]
+
+    @log_module.FunctionLogger('tests', profile=True)
+    def fast():
+        return 1
+
+    fast()
+    assert profiling.stats()[fast.__qualname__]['total_ms'] < 50
+
+
+def _json_lines(directory):
+    lines = []
+    for path in sorted(directory.iterdir()):
+        with open(path, encoding='utf-8') as f:
+            lines.extend(json.loads(line) for line in f if line.strip())
+    return lines
+
+
+def test_json_formatter_fields():
+    record = _record('сумма %s', args=('x',), function='total', phase='return',
+                     duration_ms=1.5, arg_sizes=[3, None], name='app.tests')
+    entry = json.loads(log_module.JsonFormatter().format(record))
+    assert entry['message'] == 'сумма x'
+    assert entry['level'] == 'INFO' and entry['logger'] == 'app.tests'
+    assert entry['function'] == 'total' and entry['phase'] == 'return'
+    assert entry['duration_ms'] == 1.5 and entry['arg_sizes'] == [3, None]
+    assert 'task' not in entry
+
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        error = _record('сбой', logging.ERROR, exc_info=sys.exc_info())
+    entry = json.loads(log_module.JsonFormatter().format(error))
+    assert 'ZeroDivisionError' in entry['exception']
+
+
+def test_json_log_file(app_logger, tmp_path):
+    log_module.setup_logging(log_to_file=True, log_format='json')
+
+    @log_module.FunctionLogger('json')
+    def total(values, offset=None):
+        return sum(values)
+
+    log_module.set_task_id(8)
+    try:
+        total([1, 2, 3], offset=4)
+    finally:
+        log_module.set_task_id(None)
+    entries = [e for e in _json_lines(tmp_path / 'logs') if e.get('function') == 'total']
+    assert [e['phase'] for e in entries] == ['call', 'return']
+    assert all(e['task'] == 8 for e in entries)
+    assert entries[0]['arg_sizes'] == [3, None]
+    assert entries[1]['duration_ms'] >= 0
+
+
+def test_buffered_handler_batches(tmp_path):
+    path = tmp_path / 'app.log'
+    handler = log_module.BufferedRotatingFileHandler(str(path), capacity=3, flush_interval=60,
+                                                     encoding='utf-8')
+    try:
+        handler.handle(_record('a'))
+        handler.handle(_record('b'))
+        assert path.read_text(encoding='utf-8') == ''
+        handler.handle(_record('c'))
+        assert path.read_text(encoding='utf-8').split() == ['a', 'b', 'c']
+        handler.handle(_record('d'))
+        handler.handle(_record('сбой', logging.ERROR))   # сбрасывается сразу
+        assert path.read_text(encoding='utf-8').split() == ['a', 'b', 'c', 'd', 'сбой']
+        handler.handle(_record('e'))
+    finally:
+        handler.close()
+    assert path.read_text(encoding='utf-8').split()[-1] == 'e'
+    handler._flusher.join(5)
+    assert not handler._flusher.is_alive()
+
+
+def test_buffered_handler_flushes_by_interval(tmp_path):
+    path = tmp_path / 'app.log'
+    handler = log_module.BufferedRotatingFileHandler(str(path), capacity=100, flush_interval=0.05)
+    try:
+        handler.handle(_record('ожидание'))
+        deadline = time.monotonic() + 5
+        while not path.read_text(encoding='utf-8') and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert path.read_text(encoding='utf-8').strip() == 'ожидание'
+    finally:
+        handler.close()
+
+
+def test_buffered_handler_rotates(tmp_path):
+    path = tmp_path / 'app.log'
+    handler = log_module.BufferedRotatingFileHandler(str(path), capacity=5, flush_interval=60,
+                                                     maxBytes=200, backupCount=2)
+    try:
+        for i in range(100):
+            handler.handle(_record(f'запись {i:03d}'))
+    finally:
+        handler.close()
+    assert (tmp_path / 'app.log.1').exists() and (tmp_path / 'app.log.2').exists()
+    assert not (tmp_path / 'app.log.3').exists()
+    assert path.read_text(encoding='utf-8').split()[-1] == '099'
+
+
+def test_buffered_handler_rejects_bad_options(tmp_path):
+    with pytest.raises(ValueError):
+        log_module.BufferedRotatingFileHandler(str(tmp_path / 'a.log'), capacity=0)
+    with pytest.raises(ValueError):
+        log_module.BufferedRotatingFileHandler(str(tmp_path / 'a.log'), flush_interval=0)
+
+
+def test_profile_counters_under_threads(captured, profiling):
+    logger, _ = captured
+    logger.setLevel(logging.CRITICAL)
+
+    @log_module.FunctionLogger('tests', profile=True)
+    def work(value):
+        return value + 1
+
+    def run():
+        for value in range(500):
+            work(value)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert profiling.stats()[work.__qualname__]['calls'] == 4000
+
+
+def test_foreign_tracing_is_kept(profiling):
+    tracemalloc.start()
+    try:
+        log_module.enable_profiling(memory=True)
+        log_module.disable_profiling()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_async_json_records_keep_task_id(app_logger, tmp_path):
+    log_module.setup_logging(log_to_file=True, log_format='json', async_mode=True)
+
+    def produce(task):
+        log_module.set_task_id(task)
+        for i in range(20):
+            app_logger.info('задание %d запись %d', task, i)
+
+    threads = [threading.Thread(target=produce, args=(task,)) for task in (1, 3, 8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log_module.shutdown_logging()
+
+    entries = [e for e in _json_lines(tmp_path / 'logs') if e['message'].startswith('задание')]
+    assert len(entries) == 60
+    assert all(e['task'] == int(e['message'].split()[1]) for e in entries)
+
+
+def test_reconfigure_closes_buffered_handler(app_logger, tmp_path):
+    log_module.setup_logging(log_to_file=True, buffered=True, flush_interval=60)
+    buffered = next(h for h in app_logger.handlers
+                    if isinstance(h, log_module.BufferedRotatingFileHandler))
+    app_logger.info('до перенастройки')
+    log_module.setup_logging(log_to_file=False)
+    buffered._flusher.join(5)
+    assert not buffered._flusher.is_alive()
+    text = ''.join(path.read_text(encoding='utf-8') for path in (tmp_path / 'logs').iterdir())
+    assert 'до перенастройки' in text
@@ -0,0 +1,115 @@
+"""Тесты двухуровневого кэша результатов и ключей кэша."""
+
+import numpy as np
+import pytest
+
+from src.tasks.task2 import RotatedMatrix
+from src.utils import result_cache as result_cache_module
+from src.utils.result_cache import CACHE_DIR_ENV, ResultCache, make_key
+
+
+def test_lru_eviction_by_entries():
+    cache = ResultCache(max_entries=2)
+    cache.put('a', [1])
+    cache.put('b', [2])
+    assert cache.get('a') == [1]      # 'a' становится свежей
+    cache.put('c', [3])               # вытесняется 'b'
+    assert cache.get('b') is None
+    assert cache.get('a') == [1] and cache.get('c') == [3]
+    stats = cache.stats()
+    assert stats['entries'] == 2
+    assert stats['evictions'] == 1
+    assert stats['hits'] == 3 and stats['misses'] == 1
+
+
+def test_memory_budget():
+    cache = ResultCache(memory_budget=1000)
+    cache.put('small', np.zeros(10, dtype=np.int64))
+    cache.put('large', np.zeros(1000, dtype=np.int64))
+    assert cache.get('large') is None
+    assert cache.get('small') is not None
+    assert cache.stats()['memory_bytes'] == 80
+
+
+def test_get_or_compute_calls_once():
+    cache = ResultCache()
+    calls = []
+    compute = lambda: calls.append(1) or [42]
+    assert cache.get_or_compute('k', compute) == [42]
+    assert cache.get_or_compute('k', compute) == [42]
+    assert len(calls) == 1
+
+
+def test_disk_tier_keeps_evicted_entries(tmp_path):
+    cache = ResultCache(max_entries=1, disk_dir=str(tmp_path))
+    cache.put('a', [1, 2])
+    cache.put('b', [3])
+    assert cache.stats()['disk_entries'] == 1
+    assert cache.get('a') == [1, 2]
+    assert cache.stats()['disk_hits'] == 1
+
+    # Файлы переживают перезапуск
+    restarted = ResultCache(disk_dir=str(tmp_path))
+    assert restarted.get('a') == [1, 2]
+
+    restarted.clear(disk=True)
+    assert restarted.get('a') is None
+    assert not list(tmp_path.glob('*.pkl'))
+
+
+def test_disk_budget_and_oversized_values(tmp_path):
+    cache = ResultCache(memory_budget=100, disk_dir=str(tmp_path), disk_budget=2000)
+    big = np.arange(100, dtype=np.int64)
+    cache.put('big', big)
+    assert cache.stats()['entries'] == 0
+    assert np.array_equal(cache.get('big'), big)
+    cache.configure(disk_budget=0)
+    assert cache.stats()['disk_entries'] == 0
+
+
+def test_configure_rejects_bad_values():
+    cache = ResultCache()
+    with pytest.raises(ValueError):
+        cache.configure(max_entries=-1)
+    with pytest.raises(ValueError):
+        cache.configure(memory_budget=-1)
+
+
+def test_make_key_depends_on_content_and_type():
+    base = make_key(1, {'engine': 'auto'}, [[1, 2, 3], [4, 5, 6]])
+    assert base == make_key(1, {'engine': 'auto'}, [[1, 2, 3], [4, 5, 6]])
+    assert base != make_key(1, {'engine': 'numpy'}, [[1, 2, 3], [4, 5, 6]])
+    assert base != make_key(8, {'engine': 'auto'}, [[1, 2, 3], [4, 5, 6]])
+    assert base != make_key(1, {'engine': 'auto'}, [[1, 2, 3], [4, 5, 7]])
+    assert make_key(1, {}, [[1, 2]]) != make_key(1, {}, [[1.0, 2.0]])
+    assert make_key(1, {}, [[2 ** 70]]) != make_key(1, {}, [[2 ** 70 + 1]])
+
+
+def test_make_key_arrays_and_views():
+    arr = np.arange(12, dtype=np.int64).reshape(3, 4)
+    assert make_key(2, {}, [arr]) == make_key(2, {}, [arr.copy()])
+    assert make_key(2, {}, [arr]) != make_key(2, {}, [arr.astype(np.int32)])
+    assert make_key(2, {}, [arr.T]) == make_key(2, {}, [np.ascontiguousarray(arr.T)])
+    rows = arr.tolist()
+    view = RotatedMatrix(rows, 1)
+    assert make_key(2, {}, [view]) == make_key(2, {}, [view.materialize()])
+
+
+def test_configure_keeps_memory_tier_on_bad_directory(tmp_path):
+    cache = ResultCache()
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    with pytest.raises(OSError):
+        cache.configure(disk_dir=str(blocker / 'sub'))
+    assert cache.disk_dir is None
+
+
+def test_application_cache_reads_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / 'cache'))
+    assert result_cache_module._application_cache().disk_dir == str(tmp_path / 'cache')
+
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    monkeypatch.setenv(CACHE_DIR_ENV, str(blocker / 'sub'))
+    with pytest.warns(RuntimeWarning):
+        assert result_cache_module._application_cache().disk_dir is None